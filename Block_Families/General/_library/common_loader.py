@@ -0,0 +1,60 @@
+"""
+Loader for the common files of the OS_Triage blocks.
+
+The blocks download their common files (e.g. convert_n_and_e.py, context_store.py)
+into the common files directory and load them by file path. import_common_file()
+keeps each loaded module in sys.modules under its module name, so repeated block
+calls in one process reuse it. A module is only executed again when its file on
+disk changes, checked by mtime and size, then by the sha256 of its contents.
+
+Each block loads this file itself, once per process, through its import_common().
+
+This module is copied into the common files directory and loaded by file path,
+so it must only depend on the standard library.
+"""
+
+import hashlib
+import importlib.util
+import os
+import sys
+
+
+def file_hash(module_path):
+    with open(module_path, "rb") as module_file:
+        return hashlib.sha256(module_file.read()).hexdigest()
+
+
+def import_common_file(module_name, module_path):
+    """
+    Load a common file as a module, reusing the module already loaded from it while the file is unchanged.
+
+    Args:
+        module_name (str): The module name, e.g. "context_store", under which it is kept in sys.modules.
+        module_path (str): The path of the common file.
+
+    Returns:
+        module: The loaded module.
+    """
+    module_path = os.path.abspath(module_path)
+    file_stat = os.stat(module_path)
+    file_stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+    common_module = sys.modules.get(module_name)
+    if common_module is not None and getattr(common_module, "__file__", None) == module_path:
+        if getattr(common_module, "_tr_file_stamp", None) == file_stamp:
+            return common_module
+        content_hash = file_hash(module_path)
+        if getattr(common_module, "_tr_file_hash", None) == content_hash:
+            common_module._tr_file_stamp = file_stamp
+            return common_module
+    # Load the module spec from the common files directory, create the module and load it
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    common_module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = common_module
+    try:
+        spec.loader.exec_module(common_module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    common_module._tr_file_hash = file_hash(module_path)
+    common_module._tr_file_stamp = file_stamp
+    return common_module
@@ -0,0 +1,1296 @@
+"""
+Context memory storage engine for the OS_Triage blocks.
+
+The blocks read and mutate context memory through the ContextStorage interface,
+and the JSON lists in the context directory (e.g. incident_edges.json,
+other_object_refs.json) stay the interchange format read by the Viz blocks.
+There are two backends:
+
+ContextStore (backend "json"), where each context file is held as the exported
+JSON list, plus an in-memory hash index keyed by node id, or by the edge_key
+(source, target, stix-id) for edges. Mutations are recorded in a write-ahead
+journal (.context.journal) in the context directory, one CRC-checked JSON
+record per line. Each mutation is serialised when it is made, and the store's
+own copy of a node is read back from that same text, so a node is encoded once
+and a caller may go on changing the objects it saved. Mutations are buffered and
+group committed: a group is appended with a commit record and fsynced once,
+when the buffer fills, when commit() is called and when the store is closed.
+The JSON lists are exported when the journal passes a threshold and when the
+store is closed, after which the journal is removed. A journal left behind by
+an interrupted run is replayed when the directory is next opened, applying the
+committed groups and discarding a torn or uncommitted tail.
+
+SQLiteContextStore (backend "sqlite"), where the lists are held in one SQLite
+database per context directory, with tables for nodes, edges, relation edges and
+replacement edges indexed by id, type, source and target, and keyed by the
+edge_key. Node records refer to their original stix object, which is held once
+in an objects table addressed by the hash of its content. All of the updates
+made in a block run are committed in one transaction, and the JSON lists are
+exported when the store is closed.
+
+With either backend the exported JSON lists still hold each node's original
+inline, as the Viz and Get_Context blocks read them, so an object held in more
+than one list is written to each of them. Only the SQLite database stores each
+original once, and the json backend journals the originals inline, as it exports
+them, rather than hashing each one to find the duplicates.
+
+Isolation model: a store takes an exclusive advisory lock on its context
+directory when it is opened, and holds it until it is closed. Block runs that
+open a store on the same directory are therefore serialised, whether they run
+on threads or in separate processes, and each sees the changes committed by
+the runs before it. A thread that opens a store on a directory it already has
+open, e.g. a block called from another block, is given the store it already
+holds, so both see and keep each other's changes. Closing that nested open
+exports the lists, and the store is closed when its last open is closed. The
+locks and open stores are kept in a registry shared by every copy of this
+module loaded in the process.
+JSON lists are written to a temporary file and renamed over the old list, so a
+reader that does not take the lock (e.g. a Viz block) sees either the old or
+the new list, never a partial one. Files written directly by blocks that do not
+use a store, such as context_map.json, are outside this model.
+
+Snapshot: when snapshots are turned on (TR_CONTEXT_SNAPSHOT=1, or snapshot=True),
+closing a store also writes a binary snapshot of the directory's lists
+(.context.snapshot), so the Viz and Get_Context blocks can load a list without
+parsing its JSON file. Each list is held in its own section, in the marshal
+format, which decodes faster and is smaller than the JSON text, and a small
+index gives the stamp of the JSON file each section was taken from. A list
+whose JSON file has changed since the snapshot was written is read from the
+JSON file, so the JSON lists remain the source of truth.
+
+This module is copied into the common files directory and loaded by file path,
+so it must only depend on the standard library.
+"""
+
+import hashlib
+import gc
+import json
+import marshal
+import os
+import sqlite3
+import struct
+import sys
+import tempfile
+import threading
+import time
+import types
+import weakref
+import zlib
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+import logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# Context types that hold edges rather than nodes, common to all of the context maps
+edge_types = ["edges", "relation_edges", "relation_replacement_edges"]
+journal_file = "/.context.journal"
+default_compact_threshold = 1000
+default_group_commit_size = 256
+# The backend used when a block does not ask for one, overridden by the TR_CONTEXT_BACKEND variable
+default_backend = "json"
+sqlite_file = "/context_mem.sqlite3"
+lock_file = "/.context.lock"
+# The sys.modules key of the registry of the locks and open stores of this process
+registry_module = "_tr_context_store_registry"
+snapshot_file = "/.context.snapshot"
+# Snapshot header: magic, format version, marshal format version, then the offset and length of the index
+snapshot_magic = b"TRCS"
+snapshot_version = 2
+snapshot_header = struct.Struct("<4sHHQQ")
+# Seconds to wait for another block run to release a context directory
+default_lock_timeout = 300
+# Key of the reference left in a node record in place of its stored original object
+object_ref = "$ref"
+# The extension on the incident object that holds the ref lists
+incident_ext_id = "extension-definition--ef765651-680c-498d-9894-99799f2fa126"
+
+
+def node_key(node):
+    return node["id"]
+
+
+def edge_key(edge):
+    # Canonical edge identity, shared by all three edge lists. Embedded reference edges have no stix-id,
+    # while relationship and sighting edges carry the id of the object that produced them
+    return (edge["source"], edge["target"], edge.get("stix-id"))
+
+
+def split_original(node):
+    """
+    Split a node record from its original stix object, for storing the object once by content.
+
+    Returns:
+        Tuple[Dict, str, Dict]: The record with the original replaced by a reference, the content
+        hash of the original, and the original. Records without an original are returned unchanged.
+    """
+    original = node.get("original")
+    if not isinstance(original, dict):
+        return node, None, None
+    object_hash = hashlib.sha256(json.dumps(original, sort_keys=True).encode("utf-8")).hexdigest()
+    record = dict(node)
+    record["original"] = {object_ref: object_hash}
+    return record, object_hash, original
+
+
+def copy_edge(edge):
+    # A copy of an edge, whose values are all strings, so a shallow copy holds none of the caller's objects
+    return dict(edge)
+
+
+def join_original(record, objects):
+    # Put the stored original back in place of its reference, keeping the record's key order
+    original = record.get("original")
+    if isinstance(original, dict) and len(original) == 1 and object_ref in original:
+        record["original"] = objects[original[object_ref]]
+    return record
+
+
+def atomic_write(path, text):
+    """
+    Write a file by writing a temporary file in the same directory and renaming it over the old file.
+    """
+    temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(temp_fd, "wb" if isinstance(text, bytes) else "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def file_stamp(path):
+    # Modification time and size of a file, used to tell whether it changed since it was last read
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return f"{file_stat.st_mtime_ns}:{file_stat.st_size}"
+
+
+def journal_line(entry):
+    # One journal record per line, the CRC32 of the JSON body, then the body
+    return crc_line(json.dumps(entry))
+
+
+def crc_line(body):
+    return f"{zlib.crc32(body.encode('utf-8')):08x} {body}\n"
+
+
+def journal_put(file_name, edge, record_text):
+    # The journal line of a put, around a record already serialised by json.dumps
+    return crc_line(f'{{"op": "put", "file": {json.dumps(file_name)}, "edge": {json.dumps(edge)}, '
+                    f'"record": {record_text}}}')
+
+
+def read_journal(journal_path):
+    """
+    Read the committed groups from a journal, stopping at the first torn or corrupt record.
+
+    Returns:
+        List[Dict]: The entries of every group that was followed by its commit record.
+    """
+    committed = []
+    group = []
+    with open(journal_path, "r") as journal_input:
+        for line in journal_input:
+            crc, _, body = line.rstrip("\n").partition(" ")
+            if not line.endswith("\n") or crc != f"{zlib.crc32(body.encode('utf-8')):08x}":
+                logger.warning(f"journal ends with a torn or corrupt record -> {journal_path}")
+                break
+            entry = json.loads(body)
+            if entry["op"] == "commit":
+                committed.extend(group)
+                group = []
+            else:
+                group.append(entry)
+    if group:
+        logger.warning(f"discarding {len(group)} uncommitted journal entries -> {journal_path}")
+    return committed
+
+
+def recover_journal(context_dir):
+    """
+    Replay the committed groups of a journal left by an interrupted run onto the JSON lists, then remove it.
+
+    Returns:
+        int: The number of entries replayed.
+    """
+    journal_path = context_dir + journal_file
+    if not os.path.exists(journal_path):
+        return 0
+    entries = read_journal(journal_path)
+    tables = {}
+    for entry in entries:
+        table = tables.get(entry["file"])
+        key_for = edge_key if entry["edge"] else node_key
+        if table is None:
+            table = {}
+            if os.path.exists(context_dir + entry["file"]):
+                with open(context_dir + entry["file"], "r") as mem_input:
+                    for record in json.load(mem_input):
+                        table[key_for(record)] = record
+            tables[entry["file"]] = table
+        if entry["op"] == "put":
+            table[key_for(entry["record"])] = entry["record"]
+        elif entry["op"] == "del":
+            # an edge key is journaled as a JSON list
+            table.pop(tuple(entry["key"]) if entry["edge"] else entry["key"], None)
+    for file_name, table in tables.items():
+        atomic_write(context_dir + file_name, json.dumps(list(table.values())))
+    os.remove(journal_path)
+    logger.info(f"recovered {len(entries)} journal entries -> {context_dir}")
+    return len(entries)
+
+
+def unpack_snapshot_header(header):
+    # The offset and length of the index, raising ValueError for a file that is not a snapshot this process can read
+    magic, version, marshal_version, index_offset, index_length = snapshot_header.unpack_from(header, 0)
+    if magic != snapshot_magic or version != snapshot_version or marshal_version != marshal.version:
+        raise ValueError(f"not a version {snapshot_version} context snapshot")
+    return index_offset, index_length
+
+
+def unpack_snapshot_index(index_text):
+    # The entries of the lists, raising ValueError for a snapshot written by another Python version
+    index = json.loads(index_text)
+    if index.get("python") != sys.implementation.cache_tag:
+        raise ValueError(f"context snapshot written by another Python version, {index.get('python')}")
+    return index["lists"]
+
+
+def decode_section(section):
+    # The decoded records only hold data, so the collector is paused while they are built
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return marshal.loads(section)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class ContextSnapshot:
+    """
+    Binary snapshot of the JSON lists in a context directory, read with a single file read.
+
+    The file starts with a fixed header, holding the magic, the format version, the
+    marshal format version and the position of the index. Each list follows in its
+    own section, the marshal encoding of the list. The JSON index maps the file name
+    of each list to its section, and to the stamp of the JSON file it was taken from.
+    Marshal data is only read back by the Python version that wrote it, so the index
+    also records that version, and a snapshot written by another is not used.
+
+    Args:
+        data (bytes): The contents of the snapshot file.
+    """
+
+    def __init__(self, data):
+        index_offset, index_length = unpack_snapshot_header(data)
+        self.data = data
+        self.lists = unpack_snapshot_index(data[index_offset:index_offset + index_length])
+        self._records = {}
+
+    @classmethod
+    def load(cls, path):
+        """Read a snapshot file, returning None when it is missing, or is not a readable snapshot."""
+        try:
+            with open(path, "rb") as snapshot_input:
+                return cls(snapshot_input.read())
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def is_current(self, context_dir, file_name):
+        """Whether the snapshot holds the list as it is in the JSON file now."""
+        entry = self.lists.get(file_name)
+        return entry is not None and entry["stamp"] == file_stamp(context_dir + file_name)
+
+    def section(self, file_name):
+        entry = self.lists[file_name]
+        return self.data[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def get_list(self, file_name):
+        return decode_section(self.section(file_name))
+
+    def get(self, file_name, key, default=None):
+        """Return one record of a list by its node id, or edge_key, shared with later calls, so not to be changed."""
+        records = self._records.get(file_name)
+        if records is None:
+            record_key = edge_key if self.lists[file_name]["edge"] else node_key
+            records = {record_key(x): x for x in self.get_list(file_name)}
+            self._records[file_name] = records
+        return records.get(key, default)
+
+
+def write_snapshot(context_dir, file_map, exported=None):
+    """
+    Write the snapshot of the lists in a context directory, if any of them changed since the last one.
+
+    Lists exported by the calling store are taken from their records, lists still current
+    in the previous snapshot are copied from it, and the others are read from their JSON
+    files. Lists in the previous snapshot that are not in the file map are kept while they
+    are current.
+
+    Args:
+        context_dir (str): The context directory.
+        file_map (Dict[str, str]): Context type to file name, e.g. incident_data.
+        exported (Dict[str, Tuple[str, List[Dict]]]): File name to the stamp and records of each
+            list the caller exported.
+
+    Returns:
+        bool: Whether a snapshot was written.
+    """
+    exported = exported or {}
+    previous = ContextSnapshot.load(context_dir + snapshot_file)
+    file_edges = {file_name: context_type in edge_types for context_type, file_name in file_map.items()}
+    if previous is not None:
+        for file_name in previous.lists:
+            file_edges.setdefault(file_name, None)
+    sections = []
+    lists = {}
+    offset = snapshot_header.size
+    changed = previous is None
+    for file_name, edge in file_edges.items():
+        stamp = file_stamp(context_dir + file_name)
+        if stamp is None:
+            changed = changed or (previous is not None and file_name in previous.lists)
+            continue
+        if file_name in exported and exported[file_name][0] == stamp:
+            section = marshal.dumps(exported[file_name][1])
+            changed = True
+        elif previous is not None and previous.is_current(context_dir, file_name):
+            if edge is None:
+                edge = previous.lists[file_name]["edge"]
+            section = previous.section(file_name)
+        elif edge is None:
+            # a list only the previous snapshot knew about, which has changed since
+            changed = True
+            continue
+        else:
+            with open(context_dir + file_name, "r") as mem_input:
+                records = json.load(mem_input)
+            if not isinstance(records, list):
+                continue
+            section = marshal.dumps(records)
+            changed = True
+        lists[file_name] = {"stamp": stamp, "edge": edge, "offset": offset, "length": len(section)}
+        sections.append(section)
+        offset += len(section)
+    if not changed:
+        return False
+    index_text = json.dumps({"python": sys.implementation.cache_tag, "lists": lists}).encode("utf-8")
+    header = snapshot_header.pack(snapshot_magic, snapshot_version, marshal.version, offset, len(index_text))
+    atomic_write(context_dir + snapshot_file, b"".join([header] + sections + [index_text]))
+    return True
+
+
+def read_snapshot_list(context_dir, file_name):
+    """
+    Read one list from the directory's snapshot, reading only the header, the index and the list's section.
+
+    Returns:
+        List[Dict]: The list, or None when there is no readable snapshot holding the list as it is in its JSON file now.
+    """
+    try:
+        with open(context_dir + snapshot_file, "rb") as snapshot_input:
+            index_offset, index_length = unpack_snapshot_header(snapshot_input.read(snapshot_header.size))
+            snapshot_input.seek(index_offset)
+            entry = unpack_snapshot_index(snapshot_input.read(index_length)).get(file_name)
+            if entry is None or entry["stamp"] != file_stamp(context_dir + file_name):
+                return None
+            snapshot_input.seek(entry["offset"])
+            section = snapshot_input.read(entry["length"])
+        return decode_section(section)
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+
+
+def load_context_list(context_dir, file_name, default=None):
+    """
+    Load a context list, from the directory's snapshot when it holds the current list, else from its JSON file.
+
+    Args:
+        context_dir (str): The context directory, e.g. the current incident directory.
+        file_name (str): The list's file name, e.g. incident_data["edges"].
+        default: Returned when the list does not exist.
+
+    Returns:
+        List[Dict]: The list, newly decoded, so the caller may change it.
+    """
+    if not os.path.exists(context_dir + file_name):
+        return default
+    records = read_snapshot_list(context_dir, file_name)
+    if records is not None:
+        return records
+    with open(context_dir + file_name, "r") as mem_input:
+        return json.load(mem_input)
+
+
+def process_registry():
+    """
+    Return the registry of the context directory locks and open stores of this process.
+
+    The registry is kept in sys.modules rather than in this module, so the copy of this module
+    imported from the package and the copies loaded from the common files directory share it.
+    """
+    registry = sys.modules.get(registry_module)
+    if registry is None:
+        registry = types.ModuleType(registry_module)
+        registry.guard = threading.Lock()
+        # lock file path -> id of the thread holding the lock
+        registry.held = {}
+        # context directory path -> weak reference to the store open on it
+        registry.stores = {}
+        registry = sys.modules.setdefault(registry_module, registry)
+    return registry
+
+
+class ContextLock:
+    """
+    Exclusive advisory lock on a context directory, shared between threads and processes.
+
+    The lock is not re-entrant: a thread that already holds it gets a RuntimeError, rather than
+    a second view of the directory, and should reuse its open store through open_context_store().
+
+    Args:
+        context_dir (str): The context directory to lock.
+        timeout (float): Seconds to wait for the lock before raising TimeoutError, None waits forever.
+    """
+
+    def __init__(self, context_dir, timeout=default_lock_timeout):
+        self.path = os.path.abspath(context_dir + lock_file)
+        self.timeout = timeout
+        self.locked = False
+        self.owner = None
+        self._handle = None
+
+    def acquire(self):
+        registry = process_registry()
+        thread_id = threading.get_ident()
+        with registry.guard:
+            if registry.held.get(self.path) == thread_id:
+                raise RuntimeError(f"context directory is already locked by this thread -> {self.path}")
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        lock_handle = open(self.path, "a+")
+        start = time.monotonic()
+        while True:
+            try:
+                if os.name == "nt":
+                    msvcrt.locking(lock_handle.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if self.timeout is not None and time.monotonic() - start > self.timeout:
+                    lock_handle.close()
+                    raise TimeoutError(f"context directory is locked by another block run -> {self.path}")
+                time.sleep(0.01)
+        with registry.guard:
+            registry.held[self.path] = thread_id
+        self._handle = lock_handle
+        self.owner = thread_id
+        self.locked = True
+
+    def release(self):
+        if not self.locked:
+            return
+        self.locked = False
+        registry = process_registry()
+        with registry.guard:
+            if registry.held.get(self.path) == self.owner:
+                del registry.held[self.path]
+        lock_handle = self._handle
+        self._handle = None
+        if os.name == "nt":
+            lock_handle.seek(0)
+            msvcrt.locking(lock_handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+        lock_handle.close()
+
+
+class ContextStorage:
+    """
+    Interface for the context memory backends, over one context memory directory.
+
+    Args:
+        context_dir (str): The context directory, e.g. the current incident directory.
+        file_map (Dict[str, str]): Context type to file name, e.g. incident_data.
+        lock_timeout (float): Seconds to wait for the context directory lock.
+    """
+
+    def __init__(self, context_dir, file_map, lock_timeout=default_lock_timeout):
+        self.context_dir = context_dir
+        self.file_map = file_map
+        self._commit_hooks = []
+        # whether closing the store writes the directory snapshot, and the lists exported since it was opened
+        self.snapshot = False
+        self._exported = {}
+        # the number of opens of this store that are not closed yet, see open_context_store()
+        self._opens = 1
+        self._lock = ContextLock(context_dir, lock_timeout)
+        self._lock.acquire()
+
+    def __del__(self):
+        # a store that was never closed must not keep its directory locked
+        lock = getattr(self, "_lock", None)
+        if lock is not None:
+            lock.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def path(self, context_type):
+        return self.context_dir + self.file_map[context_type]
+
+    def _key_for(self, context_type):
+        return edge_key if context_type in edge_types else node_key
+
+    def add_node(self, node, context_type):
+        """Insert the node, or replace the node with the same id in place."""
+        self.add_nodes([node], context_type)
+
+    def add_edge(self, edge, context_type):
+        """Insert the edge, or replace the edge with the same source, target and stix-id in place."""
+        self.add_edges([edge], context_type)
+
+    def add_nodes(self, nodes, context_type):
+        """Insert or replace a batch of nodes."""
+        raise NotImplementedError
+
+    def add_edges(self, edges, context_type):
+        """Insert or replace a batch of edges."""
+        raise NotImplementedError
+
+    def delete_node(self, node_id, context_type):
+        """Remove the node with this id, returning True if it was present."""
+        raise NotImplementedError
+
+    def delete_edges(self, keys, context_type):
+        """Remove the edges with these (source, target, stix-id) keys, returning the number that were present."""
+        raise NotImplementedError
+
+    def save_objects(self, saves):
+        """
+        Save converted objects, writing only the nodes and edges that changed since each object was last saved.
+
+        A node, or an edge, is written only if it differs from the stored one. The edges an object had
+        when it was last saved, but no longer has, e.g. from a removed reference, are deleted. An object
+        given more than once is saved as its last conversion.
+
+        Args:
+            saves (List[Tuple[str, Dict, Dict, Dict]]): Per object, the context type of its node list, its node,
+                its edges by edge list, and its edges by edge list as last saved, or None if that is not known.
+
+        Returns:
+            Dict[str, int]: The number of "nodes" and "edges" written, and of edges "removed".
+        """
+        latest = {}
+        for save in saves:
+            latest[(save[0], node_key(save[1]))] = save
+        nodes_by_type = {}
+        edges_by_type = {}
+        removed_by_type = {}
+        for node_type, node, edge_lists, previous_edge_lists in latest.values():
+            if self.get(node_type, node_key(node)) != node:
+                nodes_by_type.setdefault(node_type, []).append(node)
+            for edge_type, edges in edge_lists.items():
+                for edge in edges:
+                    if self.get(edge_type, edge_key(edge)) != edge:
+                        edges_by_type.setdefault(edge_type, []).append(edge)
+            for edge_type, edges in (previous_edge_lists or {}).items():
+                current = {edge_key(x) for x in edge_lists.get(edge_type, [])}
+                removed_by_type.setdefault(edge_type, []).extend(
+                    edge_key(x) for x in edges if edge_key(x) not in current)
+        counts = {"nodes": 0, "edges": 0, "removed": 0}
+        # removals go first, so an edge one object dropped and another still has is kept
+        for edge_type, keys in removed_by_type.items():
+            counts["removed"] += self.delete_edges(keys, edge_type)
+        for node_type, nodes in nodes_by_type.items():
+            self.add_nodes(nodes, node_type)
+            counts["nodes"] += len(nodes)
+        for edge_type, edges in edges_by_type.items():
+            self.add_edges(edges, edge_type)
+            counts["edges"] += len(edges)
+        return counts
+
+    def exists(self, context_type):
+        raise NotImplementedError
+
+    def get(self, context_type, key, default=None):
+        raise NotImplementedError
+
+    def get_list(self, context_type):
+        raise NotImplementedError
+
+    def get_ids(self, context_type):
+        raise NotImplementedError
+
+    def _run_commit_hooks(self):
+        for hook in self._commit_hooks:
+            hook()
+
+    def commit(self):
+        """Make the mutations so far durable as one group, running the commit hooks first."""
+        raise NotImplementedError
+
+    def compact(self, context_type=None):
+        """Commit, then export the JSON list for one, or all changed, context types."""
+        raise NotImplementedError
+
+    def _export(self, context_type):
+        # Write the JSON list, keeping its records for the snapshot
+        records = self.get_list(context_type)
+        atomic_write(self.path(context_type), json.dumps(records))
+        if self.snapshot:
+            self._exported[self.file_map[context_type]] = (file_stamp(self.path(context_type)), records)
+
+    def _close_backend(self):
+        pass
+
+    def close(self):
+        """Close the store, or for a nested open of it, export the lists and leave it open for the outer open."""
+        if self._opens > 1:
+            self._opens -= 1
+            self.compact()
+            return
+        self._opens = 0
+        try:
+            self.compact()
+            if self.snapshot:
+                write_snapshot(self.context_dir, self.file_map, self._exported)
+        finally:
+            self._exported = {}
+            registry = process_registry()
+            with registry.guard:
+                store_ref = registry.stores.get(os.path.abspath(self.context_dir))
+                if store_ref is not None and store_ref() is self:
+                    del registry.stores[os.path.abspath(self.context_dir)]
+            self._lock.release()
+            self._close_backend()
+
+
+class ContextStore(ContextStorage):
+    """
+    Journaled, indexed store over one context memory directory, exporting JSON lists.
+
+    Mutations are buffered and written to the directory's write-ahead journal in
+    groups, each group ending with a commit record and fsynced once. A journal left
+    behind by a run that never closed its store is replayed when the directory is
+    next opened, applying only the groups that were completely committed.
+
+    Args:
+        context_dir (str): The context directory, e.g. the current incident directory.
+        file_map (Dict[str, str]): Context type to file name, e.g. incident_data.
+        compact_threshold (int): Number of journaled mutations after which the lists are exported.
+        lock_timeout (float): Seconds to wait for the context directory lock.
+        group_commit_size (int): Number of buffered mutations after which a group is committed.
+    """
+
+    def __init__(self, context_dir, file_map, compact_threshold=default_compact_threshold,
+                 lock_timeout=default_lock_timeout, group_commit_size=default_group_commit_size):
+        super().__init__(context_dir, file_map, lock_timeout)
+        self.compact_threshold = compact_threshold
+        self.group_commit_size = group_commit_size
+        self.journal_path = context_dir + journal_file
+        self._tables = {}
+        self._dirty = set()
+        self._pending = []
+        self._journal = None
+        self._journal_count = 0
+        self._committing = False
+        recover_journal(context_dir)
+
+    def _table(self, context_type):
+        table = self._tables.get(context_type)
+        if table is not None:
+            return table
+        table = {}
+        key_for = self._key_for(context_type)
+        if os.path.exists(self.path(context_type)):
+            with open(self.path(context_type), "r") as mem_input:
+                for record in json.load(mem_input):
+                    table[key_for(record)] = record
+        self._tables[context_type] = table
+        return table
+
+    def _record(self, context_type, lines):
+        # Buffer journal lines until the group is committed
+        self._pending.extend(lines)
+        self._dirty.add(context_type)
+        if len(self._pending) >= self.group_commit_size and not self._committing:
+            self.commit()
+
+    ###################################################################################
+    #
+    # Mutations
+    #
+    ###################################################################################
+
+    def add_nodes(self, nodes, context_type):
+        """Insert or replace a batch of nodes, journaling them in the current group."""
+        if not nodes:
+            return
+        table = self._table(context_type)
+        file_name = self.file_map[context_type]
+        lines = []
+        for node in nodes:
+            # the node is serialised once for the journal, and the table's own copy is read back from that text,
+            # so later changes to the caller's objects reach neither
+            record_text = json.dumps(node)
+            table[node_key(node)] = json.loads(record_text)
+            lines.append(journal_put(file_name, False, record_text))
+        self._record(context_type, lines)
+
+    def add_edges(self, edges, context_type):
+        """Insert or replace a batch of edges, journaling them in the current group."""
+        if not edges:
+            return
+        table = self._table(context_type)
+        file_name = self.file_map[context_type]
+        lines = []
+        for edge in edges:
+            # the table keeps its own copy of the edge, as it does of a node
+            record = copy_edge(edge)
+            table[edge_key(record)] = record
+            lines.append(journal_line({"op": "put", "file": file_name, "edge": True, "record": record}))
+        self._record(context_type, lines)
+
+    def delete_node(self, node_id, context_type):
+        """Remove the node with this id, returning True if it was present."""
+        table = self._table(context_type)
+        if node_id not in table:
+            return False
+        del table[node_id]
+        self._record(context_type, [journal_line({"op": "del", "file": self.file_map[context_type], "edge": False,
+                                                  "key": node_id})])
+        return True
+
+    def delete_edges(self, keys, context_type):
+        """Remove the edges with these keys, journaling the removals in the current group."""
+        table = self._table(context_type)
+        file_name = self.file_map[context_type]
+        entries = []
+        for key in keys:
+            if table.pop(key, None) is not None:
+                entries.append(journal_line({"op": "del", "file": file_name, "edge": True, "key": list(key)}))
+        if entries:
+            self._record(context_type, entries)
+        return len(entries)
+
+    ###################################################################################
+    #
+    # Lookups
+    #
+    ###################################################################################
+
+    def exists(self, context_type):
+        return context_type in self._tables or os.path.exists(self.path(context_type))
+
+    def get(self, context_type, key, default=None):
+        return self._table(context_type).get(key, default)
+
+    def get_list(self, context_type):
+        return list(self._table(context_type).values())
+
+    def get_ids(self, context_type):
+        return list(self._table(context_type).keys())
+
+    ###################################################################################
+    #
+    # Group Commit, Compaction and Export
+    #
+    ###################################################################################
+
+    def commit(self):
+        """
+        Write the buffered mutations to the journal as one group, with a single fsync.
+        """
+        self._committing = True
+        try:
+            self._run_commit_hooks()
+        finally:
+            self._committing = False
+        if not self._pending:
+            return
+        if self._journal is None:
+            self._journal = open(self.journal_path, "a")
+        self._journal.write("".join(self._pending) + journal_line({"op": "commit"}))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_count += len(self._pending)
+        self._pending = []
+        if self._journal_count >= self.compact_threshold:
+            self.compact()
+
+    def compact(self, context_type=None):
+        """
+        Commit the buffered mutations, export the JSON list for one, or all dirty, context types,
+        and truncate the journal once every list it covers has been exported.
+        """
+        self.commit()
+        context_types = [context_type] if context_type else list(self._dirty)
+        for c_type in context_types:
+            if c_type not in self._dirty:
+                continue
+            self._export(c_type)
+            self._dirty.discard(c_type)
+        if not self._dirty and self._journal is not None:
+            self._journal.close()
+            self._journal = None
+            self._journal_count = 0
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+
+    def _close_backend(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+class SQLiteContextStore(ContextStorage):
+    """
+    Transactional, indexed store over one context memory directory, held in SQLite.
+
+    Each row belongs to a list, named by its context file, so stores opened with
+    different file maps on the same directory share the rows of the files they share.
+    A list is imported from its JSON file when the file has changed since the store
+    last exported it, so blocks that still write the JSON lists stay in step.
+
+    Args:
+        context_dir (str): The context directory, e.g. the current incident directory.
+        file_map (Dict[str, str]): Context type to file name, e.g. incident_data.
+        db_path (str): The database file, defaults to context_mem.sqlite3 in the context directory.
+        lock_timeout (float): Seconds to wait for the context directory lock.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS lists (
+            list TEXT PRIMARY KEY,
+            stamp TEXT
+        );
+        CREATE TABLE IF NOT EXISTS objects (
+            hash TEXT PRIMARY KEY,
+            record TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS nodes (
+            list TEXT NOT NULL,
+            id TEXT NOT NULL,
+            type TEXT,
+            seq INTEGER NOT NULL,
+            record TEXT NOT NULL,
+            object_hash TEXT,
+            PRIMARY KEY (list, id)
+        );
+        CREATE INDEX IF NOT EXISTS nodes_seq ON nodes (list, seq);
+        CREATE INDEX IF NOT EXISTS nodes_id ON nodes (id);
+        CREATE INDEX IF NOT EXISTS nodes_type ON nodes (type);
+        CREATE INDEX IF NOT EXISTS nodes_object ON nodes (object_hash);
+    """
+    # Node records with their original object joined back in from the objects table
+    node_select = "SELECT nodes.record, objects.record FROM nodes LEFT JOIN objects ON objects.hash = nodes.object_hash"
+    edge_schema = """
+        CREATE TABLE IF NOT EXISTS {table} (
+            list TEXT NOT NULL,
+            source TEXT NOT NULL,
+            target TEXT NOT NULL,
+            id TEXT,
+            type TEXT,
+            seq INTEGER NOT NULL,
+            record TEXT NOT NULL,
+            stix_id TEXT NOT NULL,
+            PRIMARY KEY (list, source, target, stix_id)
+        );
+        CREATE INDEX IF NOT EXISTS {table}_seq ON {table} (list, seq);
+        CREATE INDEX IF NOT EXISTS {table}_source ON {table} (source);
+        CREATE INDEX IF NOT EXISTS {table}_target ON {table} (target);
+        CREATE INDEX IF NOT EXISTS {table}_id ON {table} (id);
+        CREATE INDEX IF NOT EXISTS {table}_stix_id ON {table} (stix_id);
+    """
+    # Bumped when the tables change, an older database is rebuilt from the JSON lists
+    schema_version = 3
+
+    def __init__(self, context_dir, file_map, db_path=None, lock_timeout=default_lock_timeout):
+        super().__init__(context_dir, file_map, lock_timeout)
+        self.db_path = db_path if db_path else context_dir + sqlite_file
+        self._conn = sqlite3.connect(self.db_path)
+        # SQLite's own write-ahead log, so a commit appends to the log instead of rewriting pages
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != self.schema_version:
+            for table in ["lists", "objects", "nodes"] + edge_types:
+                self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self._conn.execute(f"PRAGMA user_version = {self.schema_version}")
+        self._conn.executescript(self.schema + "".join(self.edge_schema.format(table=t) for t in edge_types))
+        self._conn.commit()
+        self._synced = set()
+        self._seqs = {}
+        self._dirty = set()
+
+    def _table_name(self, context_type):
+        return context_type if context_type in edge_types else "nodes"
+
+    def _file_stamp(self, context_type):
+        return file_stamp(self.path(context_type))
+
+    def _sync(self, context_type):
+        # Import the JSON list if it was written since this database last exported it
+        if context_type in self._synced:
+            return
+        list_name = self.file_map[context_type]
+        table = self._table_name(context_type)
+        row = self._conn.execute("SELECT stamp FROM lists WHERE list = ?", (list_name,)).fetchone()
+        stamp = self._file_stamp(context_type)
+        if row is None or row[0] != stamp:
+            self._conn.execute(f"DELETE FROM {table} WHERE list = ?", (list_name,))
+            self._seqs[context_type] = 0
+            if stamp is not None:
+                with open(self.path(context_type), "r") as mem_input:
+                    records = json.load(mem_input)
+                self._write(context_type, records)
+            self._conn.execute("INSERT OR REPLACE INTO lists (list, stamp) VALUES (?, ?)", (list_name, stamp))
+        else:
+            seq = self._conn.execute(f"SELECT MAX(seq) FROM {table} WHERE list = ?", (list_name,)).fetchone()[0]
+            self._seqs[context_type] = seq or 0
+        self._synced.add(context_type)
+
+    def _write(self, context_type, records):
+        # Upsert the records, a replaced record keeps its position in the list
+        list_name = self.file_map[context_type]
+        seq = self._seqs[context_type]
+        if context_type in edge_types:
+            rows = []
+            for record in records:
+                seq += 1
+                rows.append((list_name, record["source"], record["target"], record.get("stix-id") or "",
+                             record.get("id"), record.get("type"), seq, json.dumps(record)))
+            self._conn.executemany(
+                f"INSERT INTO {context_type} (list, source, target, stix_id, id, type, seq, record) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (list, source, target, stix_id) "
+                "DO UPDATE SET id = excluded.id, type = excluded.type, record = excluded.record",
+                rows)
+        else:
+            # each original object is stored once by content, and node records reference it
+            rows = []
+            objects = {}
+            for record in records:
+                seq += 1
+                record, object_hash, original = split_original(record)
+                if object_hash is not None and object_hash not in objects:
+                    objects[object_hash] = json.dumps(original)
+                rows.append((list_name, record["id"], record.get("type"), seq, json.dumps(record), object_hash))
+            self._conn.executemany("INSERT OR IGNORE INTO objects (hash, record) VALUES (?, ?)", objects.items())
+            self._conn.executemany(
+                "INSERT INTO nodes (list, id, type, seq, record, object_hash) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (list, id) DO UPDATE SET type = excluded.type, record = excluded.record, "
+                "object_hash = excluded.object_hash",
+                rows)
+        self._seqs[context_type] = seq
+
+    ###################################################################################
+    #
+    # Mutations
+    #
+    ###################################################################################
+
+    def add_nodes(self, nodes, context_type):
+        """Insert or replace a batch of nodes, within the open transaction."""
+        if not nodes:
+            return
+        self._sync(context_type)
+        self._write(context_type, nodes)
+        self._dirty.add(context_type)
+
+    def add_edges(self, edges, context_type):
+        """Insert or replace a batch of edges, within the open transaction."""
+        if not edges:
+            return
+        self._sync(context_type)
+        self._write(context_type, edges)
+        self._dirty.add(context_type)
+
+    def delete_node(self, node_id, context_type):
+        """Remove the node with this id, returning True if it was present."""
+        self._sync(context_type)
+        cursor = self._conn.execute("DELETE FROM nodes WHERE list = ? AND id = ?",
+                                    (self.file_map[context_type], node_id))
+        if cursor.rowcount == 0:
+            return False
+        self._dirty.add(context_type)
+        return True
+
+    def delete_edges(self, keys, context_type):
+        """Remove the edges with these keys, within the open transaction."""
+        self._sync(context_type)
+        list_name = self.file_map[context_type]
+        removed = 0
+        for source, target, stix_id in keys:
+            cursor = self._conn.execute(
+                f"DELETE FROM {context_type} WHERE list = ? AND source = ? AND target = ? AND stix_id = ?",
+                (list_name, source, target, stix_id or ""))
+            removed += cursor.rowcount
+        if removed:
+            self._dirty.add(context_type)
+        return removed
+
+    ###################################################################################
+    #
+    # Lookups
+    #
+    ###################################################################################
+
+    def exists(self, context_type):
+        if os.path.exists(self.path(context_type)):
+            return True
+        self._sync(context_type)
+        return context_type in self._dirty
+
+    def get(self, context_type, key, default=None):
+        self._sync(context_type)
+        list_name = self.file_map[context_type]
+        if context_type in edge_types:
+            row = self._conn.execute(
+                f"SELECT record FROM {context_type} WHERE list = ? AND source = ? AND target = ? AND stix_id = ?",
+                (list_name, key[0], key[1], key[2] or "")).fetchone()
+        else:
+            row = self._conn.execute(self.node_select + " WHERE nodes.list = ? AND nodes.id = ?",
+                                     (list_name, key)).fetchone()
+            return self._node_from_row(row) if row else default
+        return json.loads(row[0]) if row else default
+
+    def _node_from_row(self, row):
+        record = json.loads(row[0])
+        if row[1] is not None:
+            record = join_original(record, {record["original"][object_ref]: json.loads(row[1])})
+        return record
+
+    def get_list(self, context_type):
+        self._sync(context_type)
+        list_name = self.file_map[context_type]
+        if context_type in edge_types:
+            rows = self._conn.execute(f"SELECT record FROM {context_type} WHERE list = ? ORDER BY seq", (list_name,))
+            return [json.loads(row[0]) for row in rows]
+        rows = self._conn.execute(self.node_select + " WHERE nodes.list = ? ORDER BY nodes.seq", (list_name,))
+        return [self._node_from_row(row) for row in rows]
+
+    def get_ids(self, context_type):
+        self._sync(context_type)
+        list_name = self.file_map[context_type]
+        if context_type in edge_types:
+            rows = self._conn.execute(f"SELECT source, target, stix_id FROM {context_type} WHERE list = ? ORDER BY seq",
+                                      (list_name,))
+            return [(row[0], row[1], row[2] or None) for row in rows]
+        rows = self._conn.execute("SELECT id FROM nodes WHERE list = ? ORDER BY seq", (list_name,))
+        return [row[0] for row in rows]
+
+    def get_by_type(self, context_type, stix_type):
+        """Return the nodes of one stix type from a list, through the type index."""
+        self._sync(context_type)
+        rows = self._conn.execute(self.node_select + " WHERE nodes.list = ? AND nodes.type = ? ORDER BY nodes.seq",
+                                  (self.file_map[context_type], stix_type))
+        return [self._node_from_row(row) for row in rows]
+
+    def get_edges_for(self, context_type, stix_id):
+        """Return the edges in a list that have this id as their source or target."""
+        self._sync(context_type)
+        rows = self._conn.execute(
+            f"SELECT record FROM {context_type} WHERE list = ? AND (source = ? OR target = ?) ORDER BY seq",
+            (self.file_map[context_type], stix_id, stix_id))
+        return [json.loads(row[0]) for row in rows]
+
+    ###################################################################################
+    #
+    # Commit and Export
+    #
+    ###################################################################################
+
+    def commit(self):
+        """
+        Commit the open transaction, which holds every mutation since the last commit.
+        """
+        self._run_commit_hooks()
+        self._conn.commit()
+
+    def compact(self, context_type=None):
+        """
+        Commit, then export the JSON list for one, or all changed, context types.
+        """
+        self.commit()
+        context_types = [context_type] if context_type else list(self._dirty)
+        for c_type in context_types:
+            if c_type not in self._dirty:
+                continue
+            self._export(c_type)
+            self._conn.execute("INSERT OR REPLACE INTO lists (list, stamp) VALUES (?, ?)",
+                               (self.file_map[c_type], self._file_stamp(c_type)))
+            self._dirty.discard(c_type)
+        if context_types:
+            # drop the objects no node refers to any more
+            self._conn.execute("DELETE FROM objects WHERE hash NOT IN "
+                               "(SELECT object_hash FROM nodes WHERE object_hash IS NOT NULL)")
+        self._conn.commit()
+
+    def _close_backend(self):
+        self._conn.close()
+
+
+class IncidentRefs:
+    """
+    Buffers the ids registered on the incident ref lists, and writes them to the
+    incident object with a single update when flushed, or when the store commits,
+    so a committed group holds both the saved objects and their registration.
+
+    Args:
+        store (ContextStorage): The store over the incident context directory.
+        field_names (Dict[str, str]): Context type to ref list field, e.g. "task" -> "task_refs".
+    """
+
+    def __init__(self, store, field_names):
+        self.store = store
+        self.field_names = field_names
+        # dicts are used as insertion-ordered sets, so the ref lists keep the registration order
+        self._pending = {}
+        store._commit_hooks.append(self.flush)
+
+    def add(self, stix_id, field):
+        self._pending.setdefault(field, {})[stix_id] = None
+
+    def flush(self):
+        """
+        Merge the buffered ids into the incident ref lists, returning True if the incident was updated.
+
+        In a directory with no incident yet the ids stay buffered, for the incident saved later in the run.
+        """
+        if not self._pending:
+            return False
+        incidents = self.store.get_list("incident")
+        if not incidents:
+            return False
+        wrapped_incident = incidents[0]
+        incident_ext = wrapped_incident["original"]["extensions"][incident_ext_id]
+        for field, ids in self._pending.items():
+            id_list = incident_ext.setdefault(self.field_names[field], [])
+            existing = set(id_list)
+            id_list.extend(id for id in ids if id not in existing)
+        self.store.add_node(wrapped_incident, "incident")
+        self._pending = {}
+        return True
+
+
+def convert_object(stix_object, n_and_e):
+    """
+    Convert a single object to its node, plus its edges grouped by edge list, for save_objects().
+
+    A context node, which already holds its original, is returned as it is, with no edges.
+
+    Args:
+        stix_object (Dict): The stix object, or context node.
+        n_and_e (module): The convert_n_and_e common file, which this module cannot import itself.
+
+    Returns:
+        Tuple[Dict, Dict[str, List[Dict]]]: The node, and the edges by edge list.
+    """
+    edge_lists = {}
+    if "original" in stix_object:
+        return stix_object, edge_lists
+    if stix_object["type"] == "relationship":
+        nodes, edges, relation_edges, relation_replacement_edges = n_and_e.convert_relns(stix_object)
+        edge_lists["relation_edges"] = relation_edges
+        edge_lists["relation_replacement_edges"] = relation_replacement_edges
+    elif stix_object["type"] == "sighting":
+        nodes, edges = n_and_e.convert_sighting(stix_object)
+    else:
+        nodes, edges = n_and_e.convert_node(stix_object)
+    edge_lists["edges"] = edges
+    return nodes[0], edge_lists
+
+
+def previous_edge_lists(store, node_type, stix_object, edge_lists, n_and_e):
+    """
+    Return the edges of an object as it was last saved, by converting its stored original again.
+
+    Args:
+        store (ContextStorage): The store the object is saved in.
+        node_type (str): The context type of the object's node list.
+        stix_object (Dict): The stix object being saved, or a context node.
+        edge_lists (Dict[str, List[Dict]]): The edges of the object being saved, from convert_object().
+        n_and_e (module): The convert_n_and_e common file.
+
+    Returns:
+        Dict[str, List[Dict]]: The edges by edge list, or None if they are not known, e.g. for a context node.
+    """
+    if "original" in stix_object:
+        return None
+    previous = store.get(node_type, stix_object["id"])
+    if previous is None or not isinstance(previous.get("original"), dict):
+        return None
+    if previous["original"] == stix_object:
+        return edge_lists
+    return convert_object(previous["original"], n_and_e)[1]
+
+
+def open_context_store(context_dir, file_map, compact_threshold=default_compact_threshold, backend=None,
+                       lock_timeout=default_lock_timeout, group_commit_size=default_group_commit_size, snapshot=None):
+    """
+    Open the context store for a context directory.
+
+    Args:
+        context_dir (str): The context directory, e.g. the current incident directory.
+        file_map (Dict[str, str]): Context type to file name, e.g. incident_data.
+        compact_threshold (int): Number of journaled mutations after which the lists are exported, for the json backend.
+        backend (str): "json" or "sqlite", defaults to the TR_CONTEXT_BACKEND variable, then to "json".
+        lock_timeout (float): Seconds to wait for another block run to release the context directory.
+        group_commit_size (int): Number of buffered mutations after which a group is committed, for the json backend.
+        snapshot (bool): Whether closing the store writes the directory snapshot, defaults to False unless the
+            TR_CONTEXT_SNAPSHOT variable is "1".
+
+    A thread that already has a store open on the directory is given that store, with its own
+    file_map added, and the other arguments are ignored. Each open must be closed, and the store
+    is closed, releasing the directory, when its last open is closed.
+
+    Raises:
+        ValueError: If the backend is unknown, or if a nested open maps a context type to a different
+            file than the open store already uses for it.
+
+    Returns:
+        ContextStorage: The store, which holds the directory lock and must be closed to export the JSON lists.
+    """
+    registry = process_registry()
+    with registry.guard:
+        store_ref = registry.stores.get(os.path.abspath(context_dir))
+        store = store_ref() if store_ref is not None else None
+        if store is not None and store._opens > 0 and store._lock.locked and \
+                store._lock.owner == threading.get_ident():
+            conflicts = sorted(key for key, file_name in file_map.items()
+                               if store.file_map.get(key, file_name) != file_name)
+            if conflicts:
+                raise ValueError(f"context types {conflicts} are already mapped to other files in the open store "
+                                 f"for {context_dir}")
+            store._opens += 1
+            store.file_map = {**file_map, **store.file_map}
+            return store
+    if backend is None:
+        backend = os.environ.get("TR_CONTEXT_BACKEND", default_backend)
+    if snapshot is None:
+        snapshot = os.environ.get("TR_CONTEXT_SNAPSHOT", "0") == "1"
+    if backend == "sqlite":
+        store = SQLiteContextStore(context_dir, file_map, lock_timeout=lock_timeout)
+    elif backend == "json":
+        store = ContextStore(context_dir, file_map, compact_threshold, lock_timeout, group_commit_size)
+    else:
+        raise ValueError(f"unknown context store backend {backend}, use json or sqlite")
+    store.snapshot = snapshot
+    with registry.guard:
+        registry.stores[os.path.abspath(context_dir)] = weakref.ref(store)
+    return store
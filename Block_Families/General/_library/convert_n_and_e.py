@@ -1,16 +1,138 @@
 
-from stixorm.module.authorise import authorised_mappings, import_type_factory
-from stixorm.module.typedb_lib.factories.auth_factory import get_auth_factory_instance
-import copy
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import multiprocessing
 from posixpath import basename
+from types import MappingProxyType
 import json
 import os
+import sys
 
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
+# The stixorm import type, loaded with stixorm on first use by stix_import_type()
+_import_type = None
+# Lookup tables derived from the stixorm authorisation, built on first use by auth_tables()
+_auth_tables = None
+# The node renderers by group and stix type, built on first use by icon_renderers()
+_icon_renderers = None
+icon_registry_file = "icon_registry.csv"
+# The number of objects each worker process converts at a time, in convert_many(..., workers=n)
+convert_chunk_size = 500
+
+
+def stix_import_type():
+    """Return the stixorm import type, importing stixorm on first use rather than when this module is loaded."""
+    global _import_type
+    if _import_type is None:
+        from stixorm.module.authorise import import_type_factory
+        _import_type = import_type_factory.get_all_imports()
+    return _import_type
+
+
+def __getattr__(name):
+    # import_type is still readable as a module attribute, but is only loaded when it is first read
+    if name == "import_type":
+        return stix_import_type()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def build_auth_tables():
+    """
+    Build the read-only lookup tables the conversion functions use, from the stixorm authorisation.
+
+    Returns:
+        Mapping[str, Mapping]: The tables,
+            "relation_roles": relationship_type -> (source role, target role),
+            "types": family, e.g. "sdo" or "sco" -> frozenset of stix types,
+            "embedded_names": frozenset of the embedded reference field names,
+            "embedded_relations": embedded reference field name -> (edge label, owner is source),
+            "embedded_plans": stix type -> the extraction plan of its properties, see compile_plans().
+    """
+    from stixorm.module.authorise import authorised_mappings
+    from stixorm.module.typedb_lib.factories.auth_factory import get_auth_factory_instance
+    import_type = stix_import_type()
+    # the relationship roles come from the factory, the rest from the mappings, as the functions used before
+    auth_factory = get_auth_factory_instance()
+    factory_auth = auth_factory.get_auth_for_import(import_type)
+    auth = authorised_mappings(import_type)
+    relation_roles = {}
+    for record in factory_auth["reln"]["standard_relations"]:
+        relation_roles[record["stix"]] = (record["source"], record["target"])
+    embedded_relations = {}
+    for ex in auth["reln"]["embedded_relations"]:
+        embedded_relations[ex["rel"]] = (ex["label"], ex["owner-is-source"])
+    return MappingProxyType({
+        "relation_roles": MappingProxyType(relation_roles),
+        "types": MappingProxyType({family: frozenset(types) for family, types in auth["types"].items()}),
+        "embedded_names": frozenset(auth["reln_name"]["embedded_relations"]),
+        "embedded_relations": MappingProxyType(embedded_relations),
+        "embedded_plans": compile_plans(auth)
+    })
+
+
+def compile_plans(auth):
+    """
+    Compile the embedded reference extraction plan of each stix type, from the stixorm authorisation.
+
+    A plan maps the properties of an object, or of a sub-object, to a step,
+        "ref": an embedded reference field, made into edges,
+        "skip": an attribute, or a dictionary of key-value pairs, which hold no references,
+        ("list", plan): a list of sub-objects, each walked with the plan,
+        ("dict", plan): a single sub-object, walked with the plan,
+        ("extensions", {extension: plan}): the extensions, each walked with the plan of its extension.
+    Every plan names all the embedded reference fields, as the common properties are not in the authorisation.
+    Other properties a plan does not name, e.g. custom properties, are walked in full.
+
+    Returns:
+        Mapping[str, Mapping]: stix type -> plan.
+    """
+    embedded_names = set(auth["reln_name"]["embedded_relations"])
+    key_value_names = {x["name"] for x in auth["reln"]["key_value_relations"]}
+    list_objects = {x["name"]: x["object"] for x in auth["reln"]["list_of_objects"]}
+    extension_objects = {x["stix"]: x["object"] for x in auth["reln"]["extension_relations"]}
+    # sub-object name -> plan, registered before it is filled, so a sub-object that contains itself reuses it
+    sub_plans = {}
+
+    def sub_plan(object_name):
+        if object_name not in sub_plans:
+            sub_plans[object_name] = {}
+            sub_plans[object_name].update(plan_for(auth["sub_objects"].get(object_name, {})))
+        return sub_plans[object_name]
+
+    def plan_for(properties):
+        # every reference field is named, so a property missing from the plan only needs walking if it is a container
+        plan = dict.fromkeys(embedded_names, "ref")
+        for key, typeql in properties.items():
+            if key in embedded_names:
+                plan[key] = "ref"
+            elif key in key_value_names:
+                plan[key] = "skip"
+            elif key in list_objects:
+                plan[key] = ("list", sub_plan(list_objects[key]))
+            elif key in extension_objects:
+                plan[key] = ("dict", sub_plan(extension_objects[key]))
+            elif typeql:
+                plan[key] = "skip"
+        return plan
+
+    extensions = ("extensions", {key: sub_plan(name) for key, name in extension_objects.items()})
+    plans = {}
+    for stix_type, properties in auth["objects"].items():
+        plan = plan_for(properties)
+        plan["extensions"] = extensions
+        plans[stix_type] = plan
+    return MappingProxyType(plans)
+
+
+def auth_tables():
+    """Return the lookup tables, building them once per process."""
+    global _auth_tables
+    if _auth_tables is None:
+        _auth_tables = build_auth_tables()
+    return _auth_tables
 
 
 
@@ -24,6 +146,11 @@ import_type = import_type_factory.get_all_imports()
 
 
 def convert_relns(obj):
+    """
+    Convert a relationship to its node, embedded edges, relation edges and relation replacement edges.
+
+    The node's "original" is obj itself, not a copy, so a caller that goes on changing obj must copy it first.
+    """
     nodes = []
     edges = []
     nodes, relation_edges, relation_replacement_edges = setup_relationship(obj)
@@ -33,6 +160,11 @@ def convert_relns(obj):
 
 
 def convert_sighting(obj):
+    """
+    Convert a sighting to its node and edges.
+
+    The node's "original" is obj itself, not a copy, so a caller that goes on changing obj must copy it first.
+    """
     nodes = []
     edges = []
     nodes, edges = setup_sighting(obj, nodes, edges)
@@ -42,6 +174,11 @@ def convert_sighting(obj):
 
 
 def convert_node(obj):
+    """
+    Convert any other stix object to its node and embedded edges.
+
+    The node's "original" is obj itself, not a copy, so a caller that goes on changing obj must copy it first.
+    """
     nodes = []
     edges = []
     nodes, edges = setup_nodes(obj, nodes, edges)
@@ -51,22 +188,136 @@ def convert_node(obj):
 
 
 def refine_edges(nodes, original_edges):
-    node_ids = [x["id"] for x in nodes]
-    edges = [x for x in original_edges if (x["source"] in node_ids and x["target"] in node_ids)]
-    return edges
+    return list(iter_refined_edges(nodes, original_edges))
+
+
+def iter_refined_edges(nodes, original_edges):
+    """
+    Yield the edges whose source and target are both nodes, streaming the edges.
+
+    Args:
+        nodes (Iterable[Dict]): The nodes, read once into a set of ids before the first edge.
+        original_edges (Iterable[Dict]): The edges, which may be a generator.
+    """
+    node_ids = {x["id"] for x in nodes}
+    for edge in original_edges:
+        if edge["source"] in node_ids and edge["target"] in node_ids:
+            yield edge
 
 
 def generate_legend(nodes):
-    check_icons = []
-    legend = []
+    return list(iter_legend(nodes))
+
+
+def iter_legend(nodes):
+    """
+    Yield a legend layer for each icon, from the first node with that icon, streaming the nodes.
+
+    Args:
+        nodes (Iterable[Dict]): The nodes, which may be a generator.
+    """
+    check_icons = set()
     for node in nodes:
         if node["icon"] not in check_icons:
-            check_icons.append(node["icon"])
+            check_icons.add(node["icon"])
             layer = {}
             layer["icon"] = node["icon"]
             layer["name"] = node["name"]
-            legend.append(layer)
-    return legend
+            yield layer
+
+
+def convert_many(objects, workers=None, chunk_size=None):
+    """
+    Convert a list of stix objects, e.g. a bundle, to the nodes, edges and legend of one graph, in one pass.
+
+    Objects are converted with convert_relns, convert_sighting or convert_node by type. Context
+    nodes may be passed in place of objects, in which case they are converted again from their
+    original. An object that appears more than once keeps the place of its first appearance and
+    the conversion of its last, and edges whose source or target is not one of the nodes are dropped.
+    When converted here, each node's "original" is the object passed in, not a copy.
+
+    Args:
+        objects (List[Dict]): The stix objects, or context nodes.
+        workers (int): The number of worker processes to convert the objects in, None or 1 to convert them here.
+        chunk_size (int): The number of objects a worker converts at a time, default convert_chunk_size.
+
+    Returns:
+        Dict[str, List[Dict]]: The "nodes", "edges", "relation_edges", "relation_replacement_edges" and "legend",
+            the same whether the objects were converted in parallel or not.
+    """
+    if workers is not None and workers > 1:
+        conversions = convert_parallel(objects, workers, chunk_size or convert_chunk_size)
+    else:
+        conversions = convert_objects(objects)
+    # object id -> (nodes, edges, relation_edges, relation_replacement_edges) for the object
+    converted = {}
+    for obj_id, conversion in conversions:
+        converted[obj_id] = conversion
+    node_map = {}
+    for nodes, _, _, _ in converted.values():
+        for node in nodes:
+            node_map[node["id"]] = node
+    graph = {"nodes": list(node_map.values()), "edges": [], "relation_edges": [], "relation_replacement_edges": []}
+    for conversion in converted.values():
+        for edge_type, edges in zip(["edges", "relation_edges", "relation_replacement_edges"], conversion[1:]):
+            graph[edge_type].extend(x for x in edges if x["source"] in node_map and x["target"] in node_map)
+    graph["legend"] = generate_legend(graph["nodes"])
+    return graph
+
+
+def convert_objects(objects):
+    """
+    Convert stix objects, or context nodes, one by one, as convert_many does.
+
+    Returns:
+        List[Tuple[str, Tuple]]: (object id, (nodes, edges, relation_edges, relation_replacement_edges)), in order.
+    """
+    converted = []
+    for obj in objects:
+        if "original" in obj:
+            obj = obj["original"]
+        if obj["type"] == "relationship":
+            converted.append((obj["id"], convert_relns(obj)))
+        elif obj["type"] == "sighting":
+            nodes, edges = convert_sighting(obj)
+            converted.append((obj["id"], (nodes, edges, [], [])))
+        else:
+            nodes, edges = convert_node(obj)
+            converted.append((obj["id"], (nodes, edges, [], [])))
+    return converted
+
+
+def convert_parallel(objects, workers, chunk_size):
+    """
+    Convert stix objects in chunks across worker processes, yielding the conversions in the order of the objects.
+    """
+    objects = list(objects)
+    chunks = [objects[i:i + chunk_size] for i in range(0, len(objects), chunk_size)]
+    if len(chunks) < 2:
+        yield from convert_objects(objects)
+        return
+    if getattr(sys.modules.get(__name__), "convert_objects", None) is not convert_objects:
+        # the workers find convert_objects by module name, which only works if the module was imported under it
+        logger.warning("convert_n_and_e is not in sys.modules as %s, converting in this process", __name__)
+        yield from convert_objects(objects)
+        return
+    if "fork" not in multiprocessing.get_all_start_methods():
+        # spawned workers, e.g. on Windows, would have to import this module, which the blocks load by file path
+        logger.warning("the fork start method is not available, converting in this process")
+        yield from convert_objects(objects)
+        return
+    # forked workers share this module, even when it was loaded from a file path
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=multiprocessing.get_context("fork"),
+                             initializer=init_convert_worker) as executor:
+        # map returns the chunks in the order they were given, whichever worker finishes first
+        for converted in executor.map(convert_objects, chunks):
+            yield from converted
+
+
+def init_convert_worker():
+    # build the stixorm lookup tables and the renderers as the worker starts, rather than on its first object
+    auth_tables()
+    icon_renderers()
 
 
 # def make_nodes_and_edges(obj_list):
@@ -99,18 +350,11 @@ def generate_legend(nodes):
 
 
 def setup_relationship(obj):
-    source_role = ""
-    target_role = ""
-    auth_factory = get_auth_factory_instance()
-    auth = auth_factory.get_auth_for_import(import_type)
     if "icon" in obj:
         obj_orig = obj['original']
     else:
         obj_orig = obj
-    for record in auth["reln"]["standard_relations"]:
-        if record['stix'] == obj["relationship_type"]:
-            source_role = record['source']
-            target_role = record['target']
+    source_role, target_role = auth_tables()["relation_roles"].get(obj["relationship_type"], ("", ""))
     source_type = obj_orig['source_ref'].split('--')[0]
     target_type = obj_orig['target_ref'].split('--')[0]
     # setup lists needed for SRO
@@ -147,7 +391,7 @@ def setup_relationship(obj):
     # sort out node
     node = {}
     node["id"] = obj_orig["id"]
-    node["original"] = copy.deepcopy(obj_orig)
+    node["original"] = obj_orig
     node["name"] = obj_orig["relationship_type"].title()
     node['heading'] = obj_orig["relationship_type"].title() + ' - SRO'
     node['description'] = '<br>' + source_role.title() + ' -> ' + source_type.title() + '<br>' + target_role.title() + ' -> ' + target_type.title()
@@ -198,7 +442,7 @@ def setup_sighting(obj, nodes, edges):
     node = {}
     node["id"] = obj["id"]
     node["type"] = "sighting"
-    node["original"] = copy.deepcopy(obj)
+    node["original"] = obj
     sighting_type = "generic"
     if "extensions" in obj:
         for key, value in obj["extensions"].items():
@@ -224,1315 +468,1222 @@ def setup_nodes(obj, nodes, edges):
     node = {}
     node["id"] = obj_id
     node["type"] = obj["type"]
-    node["original"] = copy.deepcopy(obj)
+    node["original"] = obj
     node = find_icon(obj, node)
     nodes.append(node)
     return nodes, edges
 
 
 def find_embedded(obj, edges, obj_id, exclusion_list=[]):
-    auth = authorised_mappings(import_type)
+    # Follow the extraction plan of the object's type, so only the properties that can hold references are visited
+    plan = auth_tables()["embedded_plans"].get(obj.get("type"), {})
+    return walk_plan(obj, plan, edges, obj_id, exclusion_list)
+
+
+def walk_plan(obj, plan, edges, obj_id, exclusion_list=[]):
     for key, prop in obj.items():
         if key in exclusion_list:
             continue
-        elif key in auth["reln_name"]["embedded_relations"]:
+        step = plan.get(key)
+        if step is None:
+            if isinstance(prop, (list, dict)):
+                edges = walk_property(key, prop, edges, obj_id)
+        elif step == "ref":
             edges = extract_ids(key, prop, edges, obj_id)
-        elif isinstance(prop, list):
-            edges = embedded_list(key, prop, edges, obj_id)
-        elif isinstance(prop, dict):
-            edges = find_embedded(prop, edges, obj_id)
-        else:
+        elif step == "skip":
             continue
+        elif step[0] == "list" and isinstance(prop, list):
+            for pro in prop:
+                if isinstance(pro, dict):
+                    edges = walk_plan(pro, step[1], edges, obj_id)
+        elif step[0] == "dict" and isinstance(prop, dict):
+            edges = walk_plan(prop, step[1], edges, obj_id)
+        elif step[0] == "extensions" and isinstance(prop, dict):
+            for ext_key, ext in prop.items():
+                ext_plan = step[1].get(ext_key)
+                if ext_plan is not None and isinstance(ext, dict):
+                    edges = walk_plan(ext, ext_plan, edges, obj_id)
+                else:
+                    edges = walk_property(ext_key, ext, edges, obj_id)
+        else:
+            edges = walk_property(key, prop, edges, obj_id)
+    return edges
+
+
+def walk_property(key, prop, edges, obj_id):
+    # Walk a property the plan does not describe, looking for embedded references at any depth
+    if key in auth_tables()["embedded_names"]:
+        edges = extract_ids(key, prop, edges, obj_id)
+    elif isinstance(prop, list):
+        edges = embedded_list(key, prop, edges, obj_id)
+    elif isinstance(prop, dict):
+        edges = walk_embedded(prop, edges, obj_id)
+    return edges
+
+
+def walk_embedded(obj, edges, obj_id):
+    for key, prop in obj.items():
+        edges = walk_property(key, prop, edges, obj_id)
     return edges
 
 
 def embedded_list(key, prop, edges, obj_id):
-    logger.debug(f"embedded_list {key} {prop}")
+    logger.debug("embedded_list %s %s", key, prop)
     for pro in prop:
         if isinstance(pro, dict):
-            edges = find_embedded(pro, edges, obj_id)
+            edges = walk_embedded(pro, edges, obj_id)
         else:
             continue
     return edges
 
 
 def extract_ids(key, prop, edges, obj_id):
-    auth = authorised_mappings(import_type)
-    for ex in auth["reln"]["embedded_relations"]:
-        if ex["rel"] == key:
-            label = ex["label"]
-            source_owner = ex["owner-is-source"]
-    edge = {"name": label, "type": "embedded"}
+    label, source_owner = auth_tables()["embedded_relations"][key]
     if isinstance(prop, list):
         for pro in prop:
             if pro.split('--')[0] == "relationship":
                 continue
-            elif source_owner:
-                edge["source"] = obj_id
-                edge["target"] = pro
-                edge["id"] = obj_id + '-' + pro
-                edges.append(copy.deepcopy(edge))
-            else:
-                edge["source"] = pro
-                edge["target"] = obj_id
-                edge["id"] = pro + '-' + obj_id
-                edges.append(copy.deepcopy(edge))
+            edges.append(embedded_edge(label, source_owner, obj_id, pro))
     else:
-        if source_owner:
-            edge["source"] = obj_id
-            edge["target"] = prop
-            edge["id"] = obj_id + '-' + prop
-        else:
-            edge["source"] = prop
-            edge["target"] = obj_id
-            edge["id"] = prop + '-' + obj_id
-        edges.append(copy.deepcopy(edge))
+        edges.append(embedded_edge(label, source_owner, obj_id, prop))
     return edges
 
 
+def embedded_edge(label, source_owner, obj_id, ref):
+    # the edge only holds strings, so each one is built fresh rather than deep copied from a template
+    if source_owner:
+        return {"name": label, "type": "embedded", "source": obj_id, "target": ref, "id": obj_id + '-' + ref}
+    return {"name": label, "type": "embedded", "source": ref, "target": obj_id, "id": ref + '-' + obj_id}
+
+
 def find_icon(stix_object, node):
-    auth = authorised_mappings(import_type)
-    logger.debug(f'stix object type {stix_object["type"]}<br>')
-    auth_types = copy.deepcopy(auth["types"])
-    if stix_object["type"] in auth_types["sdo"]:
-        logger.debug(f' going into sdo ---? {stix_object}')
+    stix_type = stix_object["type"]
+    logger.debug('stix object type %s<br>', stix_type)
+    auth_types = auth_tables()["types"]
+    if stix_type in auth_types["sdo"]:
+        logger.debug(' going into sdo ---? %s', stix_object)
         node = sdo_icon(stix_object, node)
-    elif stix_object["type"] in auth_types["sco"]:
-        logger.debug(f' going into sco ---> {stix_object}')
+    elif stix_type in auth_types["sco"]:
+        logger.debug(' going into sco ---> %s', stix_object)
         node = sco_icon(stix_object, node)
-    elif stix_object["type"] == 'marking-definition':
+    elif stix_type == 'marking-definition':
         node = meta_icon(stix_object, node)
+    # types only the icon registry knows, e.g. x-oca and attack flow objects, render from their registry row
+    elif stix_type in icon_renderers()["sdo"]:
+        node = sdo_icon(stix_object, node)
+    elif stix_type in icon_renderers()["sco"]:
+        node = sco_icon(stix_object, node)
     else:
-        logger.error(f'object type not supported: {stix_object.type}, import type {import_type}')
+        logger.error(f'object type not supported: {stix_type}, import type {stix_import_type()}')
     return node
 
 
 def sdo_icon(stix_object, node):
+    # ATT&CK objects are rendered as ATT&CK forms, the rest by the renderer for their type
+    if stix_object.get("x_mitre_version", False):
+        return attack_icon(stix_object, node)
+    render = icon_renderers()["sdo"].get(stix_object["type"], default_sdo_icon)
+    return render(stix_object, node)
+
+
+def set_node(node, icon_type, name, heading, description, object_form, object_group, object_family):
+    node["icon"] = icon_type
+    node["name"] = name
+    node["heading"] = heading
+    node["description"] = description
+    node["object_form"] = object_form
+    node["object_group"] = object_group
+    node["object_family"] = object_family
+    return node
+
+
+def sdo_defaults(stix_object):
+    # The name, heading, icon, description, form, group and family an SDO node starts from
+    name = str.title(stix_object["type"].replace("_", " "))
+    return name, name + " - SDO", "", "", "", "sdo-forms", "stix-forms"
+
+
+def sco_defaults(stix_object):
+    # The name, heading, icon, description, form, group and family an SCO node starts from
+    return "", "", "", "", "", "sco-forms", "stix-forms"
+
+
+def attack_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
     sdo_type = stix_object["type"]
-    name = str.title(sdo_type.replace("_", " "))
-    heading = name + " - SDO"
-    icon_type = ""
-    description = ""
-    object_form = ""
-    object_group = "sdo-forms"
-    object_family = ""
-    attack_object = False if not stix_object.get("x_mitre_version", False) else True
-    if attack_object:
-        object_family = "attack-forms"
-        attack_type = ""
-        sub_technique = False if not stix_object.get("x_mitre_is_subtechnique", False) else True
-        if sdo_type[:7] == "x-mitre":
-            attack_type = sdo_type[8:]
-            name = str.title(attack_type.replace("_", " "))
-            heading = "ATT&CK Matrix - " + name
-            if sdo_type == "x-mitre-matrix":
-                aname = stix_object.get("name", "")
-                object_form = "matrix"
-                aversion = stix_object.get("x_mitre_version", "")
-                heading = "ATT&CK Matrix - " + aname + " - v" + aversion
-                description = '<br>' + stix_object.get("description", "")
-            elif sdo_type == "x-mitre-tactic":
-                aname = stix_object.get("name", "")
-                object_form = "tactic"
-                T_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
-                heading = "ATT&CK Tactic - " + aname + " - " + T_id
-                description = '<br>' + stix_object.get("description", "")
-            elif sdo_type == "x-mitre-collection":
-                aname = stix_object.get("name", "")
-                object_form = "collection"
-                aversion = stix_object.get("x_mitre_version", "")
-                heading = "ATT&CK Collection - " + aname + " - v" + aversion
-                description = '<br>' + stix_object.get("description", "")
-            elif sdo_type == "x-mitre-data-source":
-                aname = stix_object.get("name", "")
-                object_form = "data-source"
-                T_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
-                heading = "ATT&CK Data Source - " + aname + " - " + T_id
-                description = '<br>' + stix_object.get("description", "")
-            elif sdo_type == "x-mitre-data-component":
-                aname = stix_object.get("name", "")
-                object_form = "data-component"
-                heading = "ATT&CK Data Source - " + aname
-                description = '<br>' + stix_object.get("description", "")
-            elif sdo_type == "x-mitre-asset":
-                description = '<br>' + "ATT&CK Asset"
-                object_form = ""
-        elif sdo_type == "attack-pattern":
-            T_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+    object_family = "attack-forms"
+    attack_type = ""
+    sub_technique = False if not stix_object.get("x_mitre_is_subtechnique", False) else True
+    if sdo_type[:7] == "x-mitre":
+        attack_type = sdo_type[8:]
+        name = str.title(attack_type.replace("_", " "))
+        heading = "ATT&CK Matrix - " + name
+        if sdo_type == "x-mitre-matrix":
+            aname = stix_object.get("name", "")
+            object_form = "matrix"
+            aversion = stix_object.get("x_mitre_version", "")
+            heading = "ATT&CK Matrix - " + aname + " - v" + aversion
             description = '<br>' + stix_object.get("description", "")
-            name = "Technique"
-            attack_type = "technique"
-            heading = name + ' - ' + T_id + " - ATT&CK"
-            object_form = "technique"
-            if sub_technique:
-                attack_type = "subtechnique"
-                name = "Sub-Technique"
-                heading = name + ' - ' + T_id + " - ATT&CK"
-                object_form = "sub-technique"
-        elif sdo_type == "course-of-action":
-            M_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+        elif sdo_type == "x-mitre-tactic":
+            aname = stix_object.get("name", "")
+            object_form = "tactic"
+            T_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+            heading = "ATT&CK Tactic - " + aname + " - " + T_id
             description = '<br>' + stix_object.get("description", "")
-            attack_type = "mitigation"
-            object_form = "mitigation"
-            name = "Mitigation"
-            heading = name + ' - ' + M_id + " - ATT&CK"
-        elif sdo_type == "intrusion-set":
-            G_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
-            G_name = stix_object.get("external_references", [{}])[1].get("source_name", "")
+        elif sdo_type == "x-mitre-collection":
+            aname = stix_object.get("name", "")
+            object_form = "collection"
+            aversion = stix_object.get("x_mitre_version", "")
+            heading = "ATT&CK Collection - " + aname + " - v" + aversion
             description = '<br>' + stix_object.get("description", "")
-            object_form = "attack-group"
-            attack_type = "group"
-            name = "Group"
-            heading = name + ' - ' + G_id + ' - ' + G_name + " - ATT&CK"
-        elif sdo_type == "malware" or sdo_type == "tool":
-            S_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+        elif sdo_type == "x-mitre-data-source":
             aname = stix_object.get("name", "")
+            object_form = "data-source"
+            T_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+            heading = "ATT&CK Data Source - " + aname + " - " + T_id
             description = '<br>' + stix_object.get("description", "")
-            attack_type = "software"
-            if sdo_type == "malware":
-                object_form = "software-malware"
-            else:
-                object_form = "software-tool"
-            name = "Software"
-            heading = "ATT&CK Software - " + aname + " - " + S_id
-        elif sdo_type == "campaign":
-            attack_type = "campaign"
-            object_form = "attack-campaign"
+        elif sdo_type == "x-mitre-data-component":
             aname = stix_object.get("name", "")
+            object_form = "data-component"
+            heading = "ATT&CK Data Source - " + aname
             description = '<br>' + stix_object.get("description", "")
-            name = "Campaign"
-            heading = "ATT&CK Campaign - " + aname
+        elif sdo_type == "x-mitre-asset":
+            description = '<br>' + "ATT&CK Asset"
+            object_form = ""
+    elif sdo_type == "attack-pattern":
+        T_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+        description = '<br>' + stix_object.get("description", "")
+        name = "Technique"
+        attack_type = "technique"
+        heading = name + ' - ' + T_id + " - ATT&CK"
+        object_form = "technique"
+        if sub_technique:
+            attack_type = "subtechnique"
+            name = "Sub-Technique"
+            heading = name + ' - ' + T_id + " - ATT&CK"
+            object_form = "sub-technique"
+    elif sdo_type == "course-of-action":
+        M_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+        description = '<br>' + stix_object.get("description", "")
+        attack_type = "mitigation"
+        object_form = "mitigation"
+        name = "Mitigation"
+        heading = name + ' - ' + M_id + " - ATT&CK"
+    elif sdo_type == "intrusion-set":
+        G_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+        G_name = stix_object.get("external_references", [{}])[1].get("source_name", "")
+        description = '<br>' + stix_object.get("description", "")
+        object_form = "attack-group"
+        attack_type = "group"
+        name = "Group"
+        heading = name + ' - ' + G_id + ' - ' + G_name + " - ATT&CK"
+    elif sdo_type == "malware" or sdo_type == "tool":
+        S_id = stix_object.get("external_references", [{}])[0].get("external_id", "")
+        aname = stix_object.get("name", "")
+        description = '<br>' + stix_object.get("description", "")
+        attack_type = "software"
+        if sdo_type == "malware":
+            object_form = "software-malware"
         else:
-            attack_type = "unknown"
-            name = "Unknown"
-            object_form = "default"
-            heading = name + " - ATT&CK"
+            object_form = "software-tool"
+        name = "Software"
+        heading = "ATT&CK Software - " + aname + " - " + S_id
+    elif sdo_type == "campaign":
+        attack_type = "campaign"
+        object_form = "attack-campaign"
+        aname = stix_object.get("name", "")
+        description = '<br>' + stix_object.get("description", "")
+        name = "Campaign"
+        heading = "ATT&CK Campaign - " + aname
+    else:
+        attack_type = "unknown"
+        name = "Unknown"
+        object_form = "default"
+        heading = name + " - ATT&CK"
 
-        if "attack-" in attack_type:
-            pass
-        else:
-            attack_type = "attack-" + attack_type
-        icon_type = attack_type
+    if "attack-" in attack_type:
+        pass
+    else:
+        attack_type = "attack-" + attack_type
+    icon_type = attack_type
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
 
+
+def identity_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    object_form = "identity"
+    if "extensions" in stix_object:
+        icon_type = "identity-contact"
+        aname = stix_object.get("name", "")
+        S_description = stix_object.get("description", "")
+        if S_description:
+            description = "<br>" + S_description
+        name = "Individual"
+        heading = name + " - " + aname
     else:
-        object_family = "stix-forms"
-        if sdo_type == "attack-pattern":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            object_form = ""
-            a_description = stix_object.get("description", "")
-            al_list = stix_object.get("aliases", [])
-            kill_list = stix_object.get("kill_chain_phases", [])
-            kill_list = stix_object.get("kill_chain_phases", [])
-            name = "Attack Pattern"
-            heading = name + " - " + aname
-            if a_description:
-                description = "<br>" + a_description
-            if al_list:
-                description += "<br>Alternative Names -> " + str(al_list)
-            if kill_list:
-                description += "<br>" + str.title(kill_list[0]['kill_chain_name'].replace("_", " "))
-                description += " -> " + kill_list[0]['phase_name'].replace("_", " ")
-        elif sdo_type == "campaign":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            a_description = stix_object.get("description", "")
-            al_list = stix_object.get("aliases", [])
-            objective  = stix_object.get("objective", "")
-            name = "Campaign"
-            object_form = "campaign"
-            heading = name + " - " + aname
-            if a_description:
-                description = "<br>" + a_description
-            if al_list:
-                description += "<br>Alternative Names -> " + str(al_list)
-            if objective:
-                description += "<br> Objective -> " + objective
-        elif sdo_type == "course-of-action":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            a_description = stix_object.get("description", "")
-            name = "Course of Action"
-            object_form = "course-of-action"
-            heading = name + " - " + aname
-            if a_description:
-                description = "<br>" + a_description
-        elif sdo_type == "grouping":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            object_form = "grouping"
-            a_description = stix_object.get("description", "")
-            context  = stix_object.get("context", "")
-            name = "Grouping"
-            if aname:
-                heading = name + " - " + aname
-            if a_description:
-                description = "<br>" + a_description
-            if context:
-                description += "<br>OS_Triage -> " + str(context)
-        elif sdo_type == "identity":
-            object_form = "identity"
-            if "extensions" in stix_object:
-                icon_type = "identity-contact"
+        if stix_object.get("identity_class", False):
+            if stix_object["identity_class"] == "individual":
+                icon_type = "identity-individual"
                 aname = stix_object.get("name", "")
-                S_description = stix_object.get("description", "")
-                if S_description:
-                    description = "<br>" + S_description
+                a_description = stix_object.get("description", "")
+                if a_description:
+                    description = '<br>' + a_description
                 name = "Individual"
                 heading = name + " - " + aname
-            else:
-                if stix_object.get("identity_class", False):
-                    if stix_object["identity_class"] == "individual":
-                        icon_type = "identity-individual"
-                        aname = stix_object.get("name", "")
-                        a_description = stix_object.get("description", "")
-                        if a_description:
-                            description = '<br>' + a_description
-                        name = "Individual"
-                        heading = name + " - " + aname
-                    elif stix_object["identity_class"] == "organization":
-                        icon_type = "identity-organization"
-                        aname = stix_object.get("name", "")
-                        a_description = stix_object.get("description", "")
-                        if a_description:
-                            description = '<br>' + a_description
-                        name = "Organization"
-                        heading = name + " - " + aname
-                    elif stix_object["identity_class"] == "class":
-                        icon_type = "identity-class"
-                        aname = stix_object.get("name", "")
-                        a_description = stix_object.get("description", "")
-                        if a_description:
-                            description = '<br>' + a_description
-                        name = "Identity Class"
-                        heading = name + " - " + aname
-                    elif stix_object["identity_class"] == "system":
-                        icon_type = "identity-system"
-                        aname = stix_object.get("name", "")
-                        a_description = stix_object.get("description", "")
-                        if a_description:
-                            description = '<br>' + a_description
-                        ext_ref = stix_object.get("external_references", [{}])
-                        if ext_ref:
-                            S_name = ext_ref[0].get("source_name", "")
-                            S_description = ext_ref[0].get("description", "")
-                            description += '<br>' + S_name + "<br>" + S_description
-                        name = "Software System"
-                        heading = name
-                        if aname:
-                            heading = heading + " - " + aname
-                    elif stix_object["identity_class"] == "asset":
-                        icon_type = "identity-asset"
-                        aname = stix_object.get("name", "")
-                        a_description = stix_object.get("description", "")
-                        if a_description:
-                            description = '<br>' + a_description
-                        ext_ref = stix_object.get("external_references", [{}])
-                        if ext_ref:
-                            S_name = ext_ref[0].get("source_name", "")
-                            S_description = ext_ref[0].get("description", "")
-                            description += '<br>' + S_name + "<br>" + S_description
-                        name = "Hardware Asset"
-                        heading = name
-                        if aname:
-                            heading = heading + " - " + aname
-                    elif stix_object["identity_class"] == "group":
-                        icon_type = "identity-group"
-                        aname = stix_object.get("name", "")
-                        a_description = stix_object.get("description", "")
-                        if a_description:
-                            description = '<br>' + a_description
-                        name = "Group"
-                        heading = name
-                        if aname:
-                            heading = heading + " - " + aname
-                    else:
-                        icon_type = "identity-unknown"
-                        aname = stix_object.get("name", "")
-                        a_description = stix_object.get("description", "")
-                        if a_description:
-                            description = '<br>' + a_description
-                        name = "Unknown"
-                        heading = name
-                        if aname:
-                            heading = heading + " - " + aname
-                else:
-                    icon_type = "identity-unknown"
-                    aname = stix_object.get("name", "")
-                    a_description = stix_object.get("description", "")
-                    if a_description:
-                        description = '<br>' + a_description
-                    name = "Unknown"
-                    if aname:
-                        heading = name + " - " + aname
-        elif sdo_type == "incident":
-            icon_type = "incident"
-            object_form = "incident"
-            aname = str.title(stix_object.get("name", ""))
-            a_description = stix_object.get("description", "")
-            name = "Std Incident"
-            heading = name
-            if a_description:
-                description = '<br>' + a_description
-            if aname:
+            elif stix_object["identity_class"] == "organization":
+                icon_type = "identity-organization"
+                aname = stix_object.get("name", "")
+                a_description = stix_object.get("description", "")
+                if a_description:
+                    description = '<br>' + a_description
+                name = "Organization"
                 heading = name + " - " + aname
-            if "extensions" in stix_object:
-                icon_type = "incident-ext"
-                ext = stix_object["extensions"]
-                types = ext.get("incident_types", [])
-                status = ext.get("investigation_status", "")
-                determin = ext.get("determination", "")
-                if determin:
-                    description = '<br>' + "Determination -> " + determin
-                if status:
-                    description += ", Status -> " + status
-                if types:
-                    description += "<br>Incident Types -> "
-                    for t in types:
-                        description += t + ", "
-                name = "Incident Extension"
+            elif stix_object["identity_class"] == "class":
+                icon_type = "identity-class"
+                aname = stix_object.get("name", "")
+                a_description = stix_object.get("description", "")
+                if a_description:
+                    description = '<br>' + a_description
+                name = "Identity Class"
+                heading = name + " - " + aname
+            elif stix_object["identity_class"] == "system":
+                icon_type = "identity-system"
+                aname = stix_object.get("name", "")
+                a_description = stix_object.get("description", "")
+                if a_description:
+                    description = '<br>' + a_description
+                ext_ref = stix_object.get("external_references", [{}])
+                if ext_ref:
+                    S_name = ext_ref[0].get("source_name", "")
+                    S_description = ext_ref[0].get("description", "")
+                    description += '<br>' + S_name + "<br>" + S_description
+                name = "Software System"
                 heading = name
-        elif sdo_type == "indicator":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            a_description = stix_object.get("description", "")
-            pattern  = stix_object.get("pattern", "")
-            kill_list = stix_object.get("kill_chain_phases", [])
-            pattern_type  = stix_object.get("pattern_type", "")
-            types = stix_object.get("indicator_types", [])
-            name = "Indicator"
-            object_form = "indicator"
-            heading = name
-            if aname:
-                heading += " - " + aname
-            if a_description:
-                description += "<br>" + a_description
-            description += "<br>Pattern Type -> " + pattern_type
-            if types:
-                description += "Indicator Types -> " + str(types)
-            description += "<br>Pattern -> " + pattern
-            if kill_list:
-                description += "<br>" + str.title(kill_list[0]['kill_chain_name'].replace("_", " "))
-        elif sdo_type == "infrastructure":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            object_form = "infrastructure"
-            a_description = stix_object.get("description", "")
-            types = stix_object.get("infrastructure_types", "")
-            kill_list = stix_object.get("kill_chain_phases", [])
-            aliases = stix_object.get("aliases", [])
-            name = "Infrastructure"
-            heading = name + " - " + aname
-            if a_description:
-                description = "<br>" + a_description
-            if types:
-                description += "/Infrastructure Type -> " + types
-            if aliases:
-                description += ", Aliases -> " + aliases
-            if kill_list:
-                description += "<br>" + str.title(kill_list[0]['kill_chain_name'].replace("_", " "))
-        elif sdo_type == "intrusion-set":
-            icon_type = sdo_type
+                if aname:
+                    heading = heading + " - " + aname
+            elif stix_object["identity_class"] == "asset":
+                icon_type = "identity-asset"
+                aname = stix_object.get("name", "")
+                a_description = stix_object.get("description", "")
+                if a_description:
+                    description = '<br>' + a_description
+                ext_ref = stix_object.get("external_references", [{}])
+                if ext_ref:
+                    S_name = ext_ref[0].get("source_name", "")
+                    S_description = ext_ref[0].get("description", "")
+                    description += '<br>' + S_name + "<br>" + S_description
+                name = "Hardware Asset"
+                heading = name
+                if aname:
+                    heading = heading + " - " + aname
+            elif stix_object["identity_class"] == "group":
+                icon_type = "identity-group"
+                aname = stix_object.get("name", "")
+                a_description = stix_object.get("description", "")
+                if a_description:
+                    description = '<br>' + a_description
+                name = "Group"
+                heading = name
+                if aname:
+                    heading = heading + " - " + aname
+            else:
+                icon_type = "identity-unknown"
+                aname = stix_object.get("name", "")
+                a_description = stix_object.get("description", "")
+                if a_description:
+                    description = '<br>' + a_description
+                name = "Unknown"
+                heading = name
+                if aname:
+                    heading = heading + " - " + aname
+        else:
+            icon_type = "identity-unknown"
             aname = stix_object.get("name", "")
-            object_form = "intrusion-set"
             a_description = stix_object.get("description", "")
-            resource_level  = stix_object.get("resource_level", "")
-            goals = stix_object.get("goals", [])
-            primary_motivation = stix_object.get("primary_motivation", "")
-            secondary_motivations = stix_object.get("secondary_motivations", [])
-            name = "Intrusion Set"
-            heading = name + " - " + aname
             if a_description:
-                description = "<br>" + a_description
-            if a_description:
-                description = "<br>" + a_description
-            if resource_level:
-                description += "<br>Intruder Resources -> " + resource_level
-            if goals:
-                description += ", Goals -> " + str(goals)
-            if primary_motivation:
-                description += "<br>Primary Motivation -> " + primary_motivation
-            if secondary_motivations:
-                description += "<br>Secondary Motivations ->" + str(secondary_motivations)
-        elif sdo_type == "location":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            object_form = "location"
-            a_description = stix_object.get("description", "")
-            region = stix_object.get("region", "")
-            country = stix_object.get("country", "")
-            administrative_area  = stix_object.get("administrative_area ", "")
-            city = stix_object.get("city", "")
-            street_address = stix_object.get("street_address", "")
-            postal_code = stix_object.get("postal_code", "")
-            name = "Location"
-            heading = name
-            if aname:
-                heading += " - " + aname
-            if a_description:
-                description = "<br>" + a_description
-            if street_address:
-                description += "<br>Street Address -> " + street_address
-            if city:
-                description += ", City -> " + city
-            if postal_code:
-                description += ", Postal Code -> " + postal_code
-            if administrative_area:
-                description += ", Administrative Area -> " + administrative_area
-            if country:
-                description += ", Country -> " + country
-            if region:
-                description += ", Region -> " + region
-        elif sdo_type == "malware":
-            icon_type = "malware"
-            aname = stix_object.get("name", "")
-            object_form = "malware"
-            type_list = stix_object.get("malware_types", [])
-            sample_list = stix_object.get("sample_refs", [])
-            if type_list:
-                description = '<br>' + "Malware Types -> "
-                for typ in type_list:
-                    description = description + typ + ' '
-            if sample_list:
-                description = '<br>' + "Sample Refs -> "
-                for sam in sample_list:
-                    description = description + sam + ', '
-            name = "Malware"
-            heading = name
+                description = '<br>' + a_description
+            name = "Unknown"
             if aname:
-                heading += " - " + aname
-            if stix_object.get("is_family", False):
-                icon_type = "malware-family"
-                aname = stix_object.get("name", "")
-                name = "Malware Family"
                 heading = name + " - " + aname
-        elif sdo_type == "malware-analysis":
-            icon_type = sdo_type
-            object_form = "malware-analysis"
-            modules  = stix_object.get("modules ", [])
-            analysis_engine_version = stix_object.get("analysis_engine_version", "")
-            analysis_definition_version = stix_object.get("analysis_definition_version", "")
-            configuration_version = stix_object.get("configuration_version", "")
-            result = stix_object.get("result", "")
-            result_name = stix_object.get("result_name", "")
-            version = stix_object.get("version", "")
-            aname = stix_object.get("product", "")
-            name = "Malware Analysis"
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def incident_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    icon_type = "incident"
+    object_form = "incident"
+    aname = str.title(stix_object.get("name", ""))
+    a_description = stix_object.get("description", "")
+    name = "Std Incident"
+    heading = name
+    if a_description:
+        description = '<br>' + a_description
+    if aname:
+        heading = name + " - " + aname
+    if "extensions" in stix_object:
+        icon_type = "incident-ext"
+        ext = stix_object["extensions"]
+        types = ext.get("incident_types", [])
+        status = ext.get("investigation_status", "")
+        determin = ext.get("determination", "")
+        if determin:
+            description = '<br>' + "Determination -> " + determin
+        if status:
+            description += ", Status -> " + status
+        if types:
+            description += "<br>Incident Types -> "
+            for t in types:
+                description += t + ", "
+        name = "Incident Extension"
+        heading = name
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def malware_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    icon_type = "malware"
+    aname = stix_object.get("name", "")
+    object_form = "malware"
+    type_list = stix_object.get("malware_types", [])
+    sample_list = stix_object.get("sample_refs", [])
+    if type_list:
+        description = '<br>' + "Malware Types -> "
+        for typ in type_list:
+            description = description + typ + ' '
+    if sample_list:
+        description = '<br>' + "Sample Refs -> "
+        for sam in sample_list:
+            description = description + sam + ', '
+    name = "Malware"
+    heading = name
+    if aname:
+        heading += " - " + aname
+    if stix_object.get("is_family", False):
+        icon_type = "malware-family"
+        aname = stix_object.get("name", "")
+        name = "Malware Family"
+        heading = name + " - " + aname
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def malware_analysis_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    sdo_type = stix_object["type"]
+    icon_type = sdo_type
+    object_form = "malware-analysis"
+    modules  = stix_object.get("modules ", [])
+    analysis_engine_version = stix_object.get("analysis_engine_version", "")
+    analysis_definition_version = stix_object.get("analysis_definition_version", "")
+    configuration_version = stix_object.get("configuration_version", "")
+    result = stix_object.get("result", "")
+    result_name = stix_object.get("result_name", "")
+    version = stix_object.get("version", "")
+    aname = stix_object.get("product", "")
+    name = "Malware Analysis"
+    heading = name
+    if aname:
+        heading += " - " + aname
+    if version:
+        description += "<br>Version -> " + version
+    if modules:
+        description += ", Modules -> " + str(modules)
+    if result:
+        description += "<br>Result is -> " + result
+    if result_name:
+        description += ", Malware Name -> " + result_name
+    if version:
+        description += "<br>Version -> " + version
+    if configuration_version or analysis_engine_version or analysis_definition_version:
+        description += "<br>"
+        if configuration_version:
+            description += "Config Version -> " + configuration_version
+        if analysis_engine_version:
+            description += ", Engine Version -> " + analysis_engine_version
+        if analysis_definition_version:
+            description += ", Definition Version -> " + analysis_definition_version
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def threat_actor_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    sdo_type = stix_object["type"]
+    icon_type = sdo_type
+    object_form = "threat-actor"
+    aname = stix_object.get("name", "")
+    a_description = stix_object.get("description", "")
+    sophistication = stix_object.get("sophistication", "")
+    resource_level = stix_object.get("resource_level", "")
+    goals = stix_object.get("goals", [])
+    primary_motivation = stix_object.get("primary_motivation", "")
+    secondary_motivations = stix_object.get("secondary_motivations", [])
+    personal_motivations = stix_object.get("personal_motivations", [])
+    name = "Threat Actor"
+    heading = name + " - " + aname
+    if a_description:
+        description = "<br>" + a_description
+    if resource_level or goals:
+        description += "/Actor Resources -> " + resource_level + ", Goals -> " + str(goals)
+    if primary_motivation:
+        description += "<br>Primary Motivation -> " + primary_motivation
+    if secondary_motivations:
+        description += "<br>Secondary Motivations ->" + str(secondary_motivations)
+    if personal_motivations:
+        description += "<br>Personal Motivations ->" + str(personal_motivations)
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def impact_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    object_form = "impact"
+    object_family = "extension-forms"
+    if "extensions" in stix_object:
+        for key, value in stix_object["extensions"].items():
+            if key == "extension-definition--7cc33dd6-f6a1-489b-98ea-522d351d71b9":
+                continue
+            else:
+                icon_type = "impact-" + key
+                if key == "monetary":
+                    adescription = stix_object.get("description", "")
+                    variety = value.get("variety", "")
+                    currency_actual = value.get("currency_actual", "")
+                    max_amount = value.get("max_amount", 0)
+                    min_amount = value.get("min_amount", 0)
+                    if adescription:
+                        description = '<br>' + adescription
+                    if variety:
+                        description += "<br>" + "Variety -> " + variety + "<br>" + "Currency -> "
+                    if currency_actual:
+                        description += currency_actual
+                    if max_amount:
+                        description += "<br>" + "Max Amount -> $" + str(max_amount)
+                    if min_amount:
+                        description += "<br>" + "Min Amount -> $" + str(min_amount)
+                    name = "Monetary Impact"
+                    heading = name
+                elif key == "availability":
+                    adescription = stix_object.get("description", "")
+                    impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
+                    avail = value.get("availability_impact", 0)
+                    description = '<br>' + adescription + "<br>" + "Total Impact ->" + str(avail) + "<br>Impacted Entities -> "
+                    if adescription:
+                        description += '<br>' + adescription
+                    if avail:
+                        description += "<br>" + "Variety -> " + str(avail)
+                    for k, v in impacted_entity_counts.items():
+                        description += k + " -> " + str(v)
+                        if len(impacted_entity_counts.items()) > 1:
+                            description = description + ", "
+                    name = "Availability Impact"
+                    heading = name
+                elif key == "integrity":
+                    adescription = stix_object.get("description", "")
+                    impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
+                    info = value.get("information_type", "")
+                    altrd = value.get("alteration", "")
+                    r_c = value.get("record_count", 0)
+                    r_s = value.get("record_size", 0)
+                    if adescription:
+                        description = '<br>' + adescription
+                    if variety:
+                        description += "<br>" + "Variety -> " + variety + "<br>" + "Currency -> "
+                    if currency_actual:
+                        description += currency_actual
+                    if max_amount:
+                        description += "<br>" + "Max Amount -> $" + str(max_amount)
+                    if min_amount:
+                        description += "<br>" + "Min Amount -> $" + str(min_amount)
+                    description = '<br>' + adescription + "<br>" + "Info Type -> " + info + "Alteration Type -> "
+                    description += altrd + "<br>" + "Number of Records -> " + str(r_c)
+                    description +=  "  Size of Records -> " + str(r_s)
+                    description += "<br>Impacted Entities -> "
+                    for k, v in impacted_entity_counts.items():
+                        description += k + " -> " + str(v)
+                        if len(impacted_entity_counts.items()) > 1:
+                            description = description + ", "
+                    name = "Integrity Impact"
+                    heading = name
+                elif key == "confidentiality":
+                    adescription = stix_object.get("description", "")
+                    impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
+                    info = value.get("information_type", "")
+                    loss_type = value.get("loss_type", "")
+                    r_c = value.get("record_count", 0)
+                    r_s = value.get("record_size", 0)
+                    description = '<br>' + adescription + "<br>" + "Info Type -> " + info + "Loss Type -> "
+                    description += loss_type + "<br>" + "Number of Records -> " + str(r_c)
+                    description +=  "  Size of Records -> " + str(r_s)
+                    description += "<br>Impacted Entities -> "
+                    for k, v in impacted_entity_counts.items():
+                        description += k + " -> " + str(v)
+                        if len(impacted_entity_counts.items()) > 1:
+                            description = description + ", "
+                    name = "Integrity Impact"
+                    heading = name
+                elif key == "physical":
+                    adescription = stix_object.get("description", "")
+                    impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
+                    impact_type = value.get("impact_type", "")
+                    asset_type = value.get("asset_type", "")
+                    description = '<br>' + adescription + "<br> Asset Type -> " +  asset_type
+                    description += ", Physical Impact -> " + impact_type
+                    description += "<br>Impacted Entities -> "
+                    for k, v in impacted_entity_counts.items():
+                        description += k + " -> " + str(v)
+                        if len(impacted_entity_counts.items()) > 1:
+                            description = description + ", "
+                    name = "Physical Impact"
+                    heading = name
+                elif key == "external":
+                    adescription = stix_object.get("description", "")
+                    impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
+                    loss = value.get("impact_type", "")
+                    description = '<br>' + adescription + "<br>" + "Actual Loss -> " + loss
+                    description += "<br>Impacted Entities -> "
+                    for k, v in impacted_entity_counts.items():
+                        description += k + " -> " + str(v)
+                        if len(impacted_entity_counts.items()) > 1:
+                            description = description + ", "
+                    name = "External Impact"
+                    heading = name
+                elif key == "traceability":
+                    adescription = stix_object.get("description", "")
+                    impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
+                    tracking = value.get("traceability_impact", "")
+                    description = '<br>' + adescription + "<br>" + "Ability to Trace -> " + tracking
+                    description += "<br>Impacted Entities -> "
+                    for k, v in impacted_entity_counts.items():
+                        description += k + " -> " + str(v)
+                        if len(impacted_entity_counts.items()) > 1:
+                            description = description + ", "
+                    name = "Traceability Impact"
+                    heading = name
+    else:
+        icon_type = "impact"
+        name = icon_type
+        heading = name
+        description = heading
+        object_form = "impact"
+        object_family = "extension-forms"
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def sequence_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    object_form = "sequence"
+    object_family = "extension-forms"
+    if stix_object["step_type"] == "start_step" or stix_object["step_type"] == "end_step":
+        icon_type = "step-terminal"
+        seq_type = stix_object.get("sequence_type", "")
+        name = str.title(stix_object["step_type"].replace("_", " "))
+        heading = name + ' for ' + str.title(seq_type)
+    elif stix_object["step_type"] == "single_step":
+        if "on_completion" in stix_object:
+            icon_type = "step-single"
+            seq_type = stix_object.get("sequence_type", "")
+            name = str.title(stix_object["step_type"].replace("_", " "))
+            heading = name + ' for ' + str.title(seq_type)
+        elif "on_success" in stix_object:
+            icon_type = "step-xor"
+            seq_type = stix_object.get("sequence_type", "")
+            name = str.title(stix_object["step_type"].replace("_", " "))
+            heading = name + ' for ' + str.title(seq_type)
+        else:
+            icon_type = "step-single"
+            seq_type = stix_object.get("sequence_type", "")
+            name = str.title(stix_object["step_type"].replace("_", " "))
+            heading = name + ' for ' + str.title(seq_type)
+    else:
+        icon_type = "step-parallel"
+        seq_type = stix_object.get("sequence_type", "")
+        name = str.title(stix_object["step_type"].replace("_", " "))
+        heading = name + ' for ' + str.title(seq_type)
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def task_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    sdo_type = stix_object["type"]
+    icon_type = sdo_type
+    object_form = "task"
+    object_family = "extension-forms"
+    aname = stix_object.get("name", "")
+    outcome = stix_object.get("outcome", "")
+    impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
+    a_description = stix_object.get("description", "")
+    priority = stix_object.get("priority", None)
+    task_types = stix_object.get("task_types", [])
+    name = "Task"
+    heading = name
+    if aname:
+        heading += " -> " + aname
+    if outcome:
+        description += "<br>Outcome -> " + outcome
+    if priority:
+        description += ", Priority -> " + priority
+    if task_types:
+        description += "<br>Task Types -> " + task_types
+    if a_description:
+        description += "<br>" + a_description
+    if impacted_entity_counts:
+        description += "<br>Impacted Entities -> "
+        for k, v in impacted_entity_counts.items():
+            description += k + " -> " + str(v)
+            if len(impacted_entity_counts.items()) > 1:
+                description = description + ", "
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def default_sdo_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sdo_defaults(stix_object)
+    sdo_type = stix_object["type"]
+    icon_type = sdo_type
+    name = icon_type
+    heading = name
+    description = heading
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def sco_icon(stix_object, node):
+    render = icon_renderers()["sco"].get(stix_object["type"], default_sco_icon)
+    return render(stix_object, node)
+
+
+def email_message_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sco_defaults(stix_object)
+    icon_type = "email-message"
+    object_form = icon_type
+    content_type = stix_object.get("content_type", "")
+    received_lines = stix_object.get("received_lines", [])
+    body = stix_object.get("body", "")
+    subject = stix_object.get("subject", "")
+    message_id = stix_object.get("message_id", "")
+    date = stix_object.get("date", None)
+    additional_header_fields = stix_object.get("additional_header_fields", {})
+    is_multipart = stix_object.get("is_multipart", False)
+    name = "Email Message"
+    heading = name
+    if content_type:
+        heading += " -> " + content_type
+    if subject:
+        description += "<br>Subject -> " + subject
+    if date:
+        description += ", Date -> " + date
+    if body:
+        description += "<br>Body -> " + body
+    if message_id:
+        description += "<br>Message ID -> " + message_id
+    if received_lines:
+        description += "<br>Received Header -> "
+        for v in received_lines:
+            description += "<br> - " + str(v)
+    if is_multipart:
+        icon_type = "email-message-mime"
+        body_multipart = stix_object.get("body_multipart", [])
+        name = "MIME " + name
+        heading = name
+        if content_type:
+            heading += " -> " + content_type
+        if body_multipart:
+            description += "<br>MIME Parts -> "
+            for v in body_multipart:
+                description += "<br> - " + str(v)
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def file_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sco_defaults(stix_object)
+    icon_type = "file"
+    object_form = "file"
+    aname = stix_object.get("name", "")
+    hashes = stix_object.get("hashes", {})
+    name_enc = stix_object.get("name_enc", "")
+    ctime = stix_object.get("ctime", None)
+    mtime = stix_object.get("mtime", None)
+    atime = stix_object.get("atime", None)
+    mime_type = stix_object.get("mime_type", "")
+    name = "File"
+    heading = name
+    if aname:
+        heading += " -> " + aname
+    if name_enc:
+        description += "<br>Priority -> " + name_enc
+    if mime_type:
+        description += "MIME Type -> " + mime_type
+    if ctime:
+        description += "<br>Created -> " + ctime
+    if mtime:
+        description += "<br>Modified -> " + mtime
+    if atime:
+        description += "<br>Accessed" + atime
+    if hashes:
+        description += "<br>Hashes -> "
+        for k, v in hashes.items():
+            description += "<br>  - " + k + " -> " + str(v)
+    if "extensions" in stix_object:
+        if stix_object["extensions"].get("archive-ext", False):
+            icon_type = "file-archive"
+            archive = stix_object.get("archive-ext", {})
+            comment = archive.get("comment", "")
+            name = "Archive " + name
             heading = name
             if aname:
-                heading += " - " + aname
-            if version:
-                description += "<br>Version -> " + version
-            if modules:
-                description += ", Modules -> " + str(modules)
-            if result:
-                description += "<br>Result is -> " + result
-            if result_name:
-                description += ", Malware Name -> " + result_name
-            if version:
-                description += "<br>Version -> " + version
-            if configuration_version or analysis_engine_version or analysis_definition_version:
-                description += "<br>"
-                if configuration_version:
-                    description += "Config Version -> " + configuration_version
-                if analysis_engine_version:
-                    description += ", Engine Version -> " + analysis_engine_version
-                if analysis_definition_version:
-                    description += ", Definition Version -> " + analysis_definition_version
-        elif sdo_type == "note":
-            icon_type = sdo_type
-            object_form = "note"
-            abstract = stix_object.get("abstract", "")
-            content = stix_object.get("content", "")
-            object_refs = stix_object.get("object_refs", [])
-            obj_list = ""
-            for i, obj in enumerate(object_refs):
-                obj_list += str.title(obj.split('--')[0].replace("_", " "))
-                if i < len(object_refs) - 1:
-                    obj_list = obj_list + ", "
-            name = "Note"
-            heading = name
-            if abstract:
-                description = "<br> Abstract -> " + abstract
-            if content:
-                description += "<br>Content -> " + content
-            if object_refs:
-                description += "<br>Applies to -> " + str(obj_list)
-        elif sdo_type == "observed-data":
-            icon_type = sdo_type
-            object_form = "observed-data"
-            first_observed = stix_object.get("first_observed", None)
-            last_observed = stix_object.get("last_observed", None)
-            number_observed   = stix_object.get("number_observed ", None)
-            object_refs = stix_object.get("object_refs", [])
-            obj_list = ""
-            for i, obj in enumerate(object_refs):
-                obj_list += str.title(obj.split('--')[0].replace("_", " "))
-                if i < len(object_refs) - 1:
-                    obj_list = obj_list + ", "
-            name = "Observed Data"
+                heading += " -> " + aname
+            if comment:
+                description += "<br>Comment -> " + comment
+        elif stix_object["extensions"].get("pdf-ext", False):
+            icon_type = "file-pdf"
+            pdf = stix_object.get("pdf-ext", {})
+            doc_info_dict = pdf.get("document_info_dict", {})
+            name = "PDF " + name
             heading = name
-            if number_observed:
-                description = "<br>" + number_observed
-            if number_observed and obj_list:
-                description += "x "
-            if number_observed:
-                description += "Observations of - " + obj_list
-            if first_observed:
-                description += "<br>First Observed -> " + first_observed
-            if last_observed:
-                description += ", Last Observed -> " + last_observed
-        elif sdo_type == "opinion":
-            icon_type = sdo_type
-            object_form = "opinion"
-            opinion = stix_object.get("opinion", "")
-            authors  = stix_object.get("authors", [])
-            explanation = stix_object.get("explanation", "")
-            object_refs = stix_object.get("object_refs", [])
-            obj_list = ""
-            for i, obj in enumerate(object_refs):
-                obj_list += str.title(obj.split('--')[0].replace("_", " "))
-                if i < len(object_refs) - 1:
-                    obj_list = obj_list + ", "
-            name = "Opinion"
-            heading = name + " on - " + obj_list
-            description = "<br>" + opinion
-            if explanation:
-                description += "<br>Due to -> " + explanation
-            if authors:
-                description += "<br>Reported by -> " + str(authors)
-        elif sdo_type == "report":
-            icon_type = sdo_type
-            object_form = "report"
-            aname = stix_object.get("name", "")
-            a_description = stix_object.get("description", "")
-            published = stix_object.get("published", None)
-            report_types = stix_object.get("report_types", [])
-            object_refs = stix_object.get("object_refs", [])
-            obj_list = ""
-            for i, obj in enumerate(object_refs):
-                obj_list += str.title(obj.split('--')[0].replace("_", " "))
-                if i < len(object_refs) - 1:
-                    obj_list = obj_list + ", "
-            name = "Report"
-            heading = name + " - " + aname
-            if report_types:
-                description += "<br>Report Type -> " + str(report_types)
-            if a_description:
-                description += "<br>" + a_description
-            if published:
-                description += "<br>Published on -> " + published
-        elif sdo_type == "threat-actor":
-            icon_type = sdo_type
-            object_form = "threat-actor"
-            aname = stix_object.get("name", "")
-            a_description = stix_object.get("description", "")
-            sophistication = stix_object.get("sophistication", "")
-            resource_level = stix_object.get("resource_level", "")
-            goals = stix_object.get("goals", [])
-            primary_motivation = stix_object.get("primary_motivation", "")
-            secondary_motivations = stix_object.get("secondary_motivations", [])
-            personal_motivations = stix_object.get("personal_motivations", [])
-            name = "Threat Actor"
-            heading = name + " - " + aname
-            if a_description:
-                description = "<br>" + a_description
-            if resource_level or goals:
-                description += "/Actor Resources -> " + resource_level + ", Goals -> " + str(goals)
-            if primary_motivation:
-                description += "<br>Primary Motivation -> " + primary_motivation
-            if secondary_motivations:
-                description += "<br>Secondary Motivations ->" + str(secondary_motivations)
-            if personal_motivations:
-                description += "<br>Personal Motivations ->" + str(personal_motivations)
-        elif sdo_type == "tool":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            object_form = "tool"
-            a_description = stix_object.get("description", "")
-            kill_list = stix_object.get("kill_chain_phases", [])
-            tool_version = stix_object.get("tool_version", "")
-            aliases = stix_object.get("aliases", [])
-            tool_types = stix_object.get("tool_types", [])
-            name = "Tool"
-            heading = name + " - " + aname + " - " + tool_version
-            if a_description:
-                description += "<br>" + a_description
-            if tool_types:
-                description += "/Tool Types -> " + tool_types
-            if aliases:
-                description += "<br>Aliases -> " + aliases
-            if kill_list:
-                description += "<br>" + str.title(kill_list[0]['kill_chain_name'].replace("_", " "))
-        elif sdo_type == "vulnerability":
-            icon_type = sdo_type
-            aname = stix_object.get("name", "")
-            object_form = "vulnerability"
-            a_description = stix_object.get("description", "")
-            external_references = stix_object.get("external_references", [])
-            name = "Vulnerability"
+            if aname:
+                heading += " -> " + aname
+            if doc_info_dict:
+                for k, v in doc_info_dict.items():
+                    description += "<br>" + k + " -> " + str(v)
+        elif stix_object["extensions"].get("raster-image-ext", False):
+            icon_type = "file-img"
+            img = stix_object.get("raster-image-ext", {})
+            exif_tags = img.get("exif_tags", {})
+            name = "Image " + name
             heading = name
             if aname:
                 heading += " -> " + aname
-            if a_description:
-                description = "<br>" + a_description
-            if external_references:
-                description += "<br>" + str.title(external_references[0]['kill_chain_name'].replace("_", " "))
-        elif sdo_type == "event":
-            icon_type = sdo_type
-            object_form = "event"
-            object_family = "extension-forms"
-            aname = stix_object.get("name", "")
-            a_description = stix_object.get("description", "")
-            goal = stix_object.get("goal", "")
-            status = stix_object.get("status", "")
-            name = "Event"
+            if exif_tags:
+                for k, v in exif_tags.items():
+                    description += "<br>" + k + " -> " + str(v)
+        elif stix_object["extensions"].get("windows-pebinary-ext", False):
+            icon_type = "file-bin"
+            binary = stix_object.get("windows-pebinary-ext", {})
+            pe_type = binary.get("pe_type", "")
+            number_of_sections = binary.get("number_of_sections", None)
+            name = "Binary " + name
             heading = name
             if aname:
                 heading += " -> " + aname
-            heading += ", Status -> " + status
-            if a_description:
-                description += "<br>" + a_description
-            if goal:
-                description += "<br>Goal -> " + goal
-        elif sdo_type == "impact":
-            object_form = "impact"
-            object_family = "extension-forms"
-            if "extensions" in stix_object:
-                for key, value in stix_object["extensions"].items():
-                    if key == "extension-definition--7cc33dd6-f6a1-489b-98ea-522d351d71b9":
-                        continue
-                    else:
-                        icon_type = "impact-" + key
-                        if key == "monetary":
-                            adescription = stix_object.get("description", "")
-                            variety = value.get("variety", "")
-                            currency_actual = value.get("currency_actual", "")
-                            max_amount = value.get("max_amount", 0)
-                            min_amount = value.get("min_amount", 0)
-                            if adescription:
-                                description = '<br>' + adescription
-                            if variety:
-                                description += "<br>" + "Variety -> " + variety + "<br>" + "Currency -> "
-                            if currency_actual:
-                                description += currency_actual
-                            if max_amount:
-                                description += "<br>" + "Max Amount -> $" + str(max_amount)
-                            if min_amount:
-                                description += "<br>" + "Min Amount -> $" + str(min_amount)
-                            name = "Monetary Impact"
-                            heading = name
-                        elif key == "availability":
-                            adescription = stix_object.get("description", "")
-                            impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
-                            avail = value.get("availability_impact", 0)
-                            description = '<br>' + adescription + "<br>" + "Total Impact ->" + str(avail) + "<br>Impacted Entities -> "
-                            if adescription:
-                                description += '<br>' + adescription
-                            if avail:
-                                description += "<br>" + "Variety -> " + str(avail)
-                            for k, v in impacted_entity_counts.items():
-                                description += k + " -> " + str(v)
-                                if len(impacted_entity_counts.items()) > 1:
-                                    description = description + ", "
-                            name = "Availability Impact"
-                            heading = name
-                        elif key == "integrity":
-                            adescription = stix_object.get("description", "")
-                            impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
-                            info = value.get("information_type", "")
-                            altrd = value.get("alteration", "")
-                            r_c = value.get("record_count", 0)
-                            r_s = value.get("record_size", 0)
-                            if adescription:
-                                description = '<br>' + adescription
-                            if variety:
-                                description += "<br>" + "Variety -> " + variety + "<br>" + "Currency -> "
-                            if currency_actual:
-                                description += currency_actual
-                            if max_amount:
-                                description += "<br>" + "Max Amount -> $" + str(max_amount)
-                            if min_amount:
-                                description += "<br>" + "Min Amount -> $" + str(min_amount)
-                            description = '<br>' + adescription + "<br>" + "Info Type -> " + info + "Alteration Type -> "
-                            description += altrd + "<br>" + "Number of Records -> " + str(r_c)
-                            description +=  "  Size of Records -> " + str(r_s)
-                            description += "<br>Impacted Entities -> "
-                            for k, v in impacted_entity_counts.items():
-                                description += k + " -> " + str(v)
-                                if len(impacted_entity_counts.items()) > 1:
-                                    description = description + ", "
-                            name = "Integrity Impact"
-                            heading = name
-                        elif key == "confidentiality":
-                            adescription = stix_object.get("description", "")
-                            impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
-                            info = value.get("information_type", "")
-                            loss_type = value.get("loss_type", "")
-                            r_c = value.get("record_count", 0)
-                            r_s = value.get("record_size", 0)
-                            description = '<br>' + adescription + "<br>" + "Info Type -> " + info + "Loss Type -> "
-                            description += loss_type + "<br>" + "Number of Records -> " + str(r_c)
-                            description +=  "  Size of Records -> " + str(r_s)
-                            description += "<br>Impacted Entities -> "
-                            for k, v in impacted_entity_counts.items():
-                                description += k + " -> " + str(v)
-                                if len(impacted_entity_counts.items()) > 1:
-                                    description = description + ", "
-                            name = "Integrity Impact"
-                            heading = name
-                        elif key == "physical":
-                            adescription = stix_object.get("description", "")
-                            impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
-                            impact_type = value.get("impact_type", "")
-                            asset_type = value.get("asset_type", "")
-                            description = '<br>' + adescription + "<br> Asset Type -> " +  asset_type
-                            description += ", Physical Impact -> " + impact_type
-                            description += "<br>Impacted Entities -> "
-                            for k, v in impacted_entity_counts.items():
-                                description += k + " -> " + str(v)
-                                if len(impacted_entity_counts.items()) > 1:
-                                    description = description + ", "
-                            name = "Physical Impact"
-                            heading = name
-                        elif key == "external":
-                            adescription = stix_object.get("description", "")
-                            impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
-                            loss = value.get("impact_type", "")
-                            description = '<br>' + adescription + "<br>" + "Actual Loss -> " + loss
-                            description += "<br>Impacted Entities -> "
-                            for k, v in impacted_entity_counts.items():
-                                description += k + " -> " + str(v)
-                                if len(impacted_entity_counts.items()) > 1:
-                                    description = description + ", "
-                            name = "External Impact"
-                            heading = name
-                        elif key == "traceability":
-                            adescription = stix_object.get("description", "")
-                            impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
-                            tracking = value.get("traceability_impact", "")
-                            description = '<br>' + adescription + "<br>" + "Ability to Trace -> " + tracking
-                            description += "<br>Impacted Entities -> "
-                            for k, v in impacted_entity_counts.items():
-                                description += k + " -> " + str(v)
-                                if len(impacted_entity_counts.items()) > 1:
-                                    description = description + ", "
-                            name = "Traceability Impact"
-                            heading = name
-            else:
-                icon_type = "impact"
-                name = icon_type
-                heading = name
-                description = heading
-                object_form = "impact"
-                object_family = "extension-forms"
-        elif sdo_type == "sequence":
-            object_form = "sequence"
-            object_family = "extension-forms"
-            if stix_object["step_type"] == "start_step" or stix_object["step_type"] == "end_step":
-                icon_type = "step-terminal"
-                seq_type = stix_object.get("sequence_type", "")
-                name = str.title(stix_object["step_type"].replace("_", " "))
-                heading = name + ' for ' + str.title(seq_type)
-            elif stix_object["step_type"] == "single_step":
-                if "on_completion" in stix_object:
-                    icon_type = "step-single"
-                    seq_type = stix_object.get("sequence_type", "")
-                    name = str.title(stix_object["step_type"].replace("_", " "))
-                    heading = name + ' for ' + str.title(seq_type)
-                elif "on_success" in stix_object:
-                    icon_type = "step-xor"
-                    seq_type = stix_object.get("sequence_type", "")
-                    name = str.title(stix_object["step_type"].replace("_", " "))
-                    heading = name + ' for ' + str.title(seq_type)
-                else:
-                    icon_type = "step-single"
-                    seq_type = stix_object.get("sequence_type", "")
-                    name = str.title(stix_object["step_type"].replace("_", " "))
-                    heading = name + ' for ' + str.title(seq_type)
-            else:
-                icon_type = "step-parallel"
-                seq_type = stix_object.get("sequence_type", "")
-                name = str.title(stix_object["step_type"].replace("_", " "))
-                heading = name + ' for ' + str.title(seq_type)
-        elif sdo_type == "task":
-            icon_type = sdo_type
-            object_form = "task"
-            object_family = "extension-forms"
-            aname = stix_object.get("name", "")
-            outcome = stix_object.get("outcome", "")
-            impacted_entity_counts = stix_object.get("impacted_entity_counts", [])
-            a_description = stix_object.get("description", "")
-            priority = stix_object.get("priority", None)
-            task_types = stix_object.get("task_types", [])
-            name = "Task"
+            if pe_type:
+                description += "<br>Executable Type -> " + pe_type
+            if number_of_sections:
+                description += ", Number of Sections -> " + number_of_sections
+        elif stix_object["extensions"].get("ntfs-ext", False):
+            icon_type = "file-ntfs"
+            ntfs = stix_object.get("ntfs-ext", "")
+            alt_list = ntfs.get("alternate_data_streams", [])
+            name = "NTFS " + name
             heading = name
             if aname:
                 heading += " -> " + aname
-            if outcome:
-                description += "<br>Outcome -> " + outcome
-            if priority:
-                description += ", Priority -> " + priority
-            if task_types:
-                description += "<br>Task Types -> " + task_types
-            if a_description:
-                description += "<br>" + a_description
-            if impacted_entity_counts:
-                description += "<br>Impacted Entities -> "
-                for k, v in impacted_entity_counts.items():
-                    description += k + " -> " + str(v)
-                    if len(impacted_entity_counts.items()) > 1:
-                        description = description + ", "
-        else:
-            icon_type = sdo_type
-            name = icon_type
+            if alt_list:
+                description += "<br>Number of Streams -> " + len(alt_list)
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def network_traffic_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sco_defaults(stix_object)
+    sco_type = stix_object["type"]
+    icon_type = "network-traffic"
+    object_form = sco_type
+    protocols = stix_object.get("protocols", [])
+    ipfix = stix_object.get("ipfix", {})
+    name = "Network Traffic"
+    heading = name
+    if protocols:
+        description += "<br>Protocols -> " + protocols
+    if ipfix:
+        for k, v in ipfix.items():
+            description += "<br> - " + k + " -> " + str(v)
+    if "extensions" in stix_object:
+        if stix_object["extensions"].get("http-request-ext", False):
+            icon_type = "network-traffic-http"
+            http = stix_object.get("http-request-ext", "")
+            request_method = http.get("request_method", "")
+            request_value = http.get("request_value", "")
+            request_version = http.get("request_version", "")
+            request_header = http.get("request_header", {})
+            name = "HTTP " + name
             heading = name
-            description = heading
-    node["icon"] = icon_type
-    node["name"] = name
-    node["heading"] = heading
-    node["description"] = description
-    node["object_form"] = object_form
-    node["object_group"] = object_group
-    node["object_family"] = object_family
-    return node
+            if request_method:
+                description += "<br>HTTP Method -> " + request_method
+            if request_value:
+                description += ", Request Value -> " + request_value
+            if request_version:
+                description += "<br>Request Version -> " + request_version
+            if request_header:
+                for k, v in request_header.items():
+                    description += "<br> - " + k + " -> " + str(v)
+        elif stix_object["extensions"].get("icmp-ext", False):
+            icon_type = "network-traffic-icmp"
+            name = "ICMP " + name
+            heading = name
+        elif stix_object["extensions"].get("tcp-ext", False):
+            icon_type = "network-traffic-tcp"
+            name = "TCP " + name
+            heading = name
+        elif stix_object["extensions"].get("socket-ext", False):
+            icon_type = "network-traffic-sock"
+            name = "Socket " + name
+            heading = name
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
 
 
-def sco_icon(stix_object, node):
+def process_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sco_defaults(stix_object)
     sco_type = stix_object["type"]
-    name = ""
-    heading = ""
-    icon_type = ""
-    description = ""
-    object_form = ""
-    object_group = "sco-forms"
-    object_family = "stix-forms"
-    if sco_type == "anecdote":
-        icon_type = sco_type
-        value = stix_object.get("value", "")
-        report_date = stix_object.get("report_date", None)
-        name = "Anecdote"
-        heading = name
-        object_form = "anecdote"
-        object_family = "extension-forms"
-        if report_date:
-            heading += " -> " + str(report_date)
-        description += "/Statement -> " + value
-    elif sco_type == "artifact":
-        icon_type = sco_type
-        mime_type = stix_object.get("mime_type", "")
-        url = stix_object.get("url", "")
-        hashes = stix_object.get("hashes", {})
-        encryption_algorithm = stix_object.get("encryption_algorithm", "")
-        decryption_key = stix_object.get("priority", None)
-        name = "Artifact"
-        object_form = "artifact"
-        heading = name
-        if mime_type:
-            heading += " -> " + mime_type
-        if encryption_algorithm:
-            description += "<br>Encryption Algorithm -> " + encryption_algorithm
-        if decryption_key:
-            description += ", Decryption Key -> " + decryption_key
-        if url:
-            description += ", URL -> " + url
-        if hashes:
-            description += "<br>Hashes -> "
-            for k, v in hashes.items():
-                description += "<br>  - " + k + " -> " + str(v)
-    elif sco_type == "autonomous-system":
-        icon_type = sco_type
-        object_form = "autonomous-system"
-        aname = stix_object.get("name", "")
-        number = stix_object.get("number", None)
-        rir = stix_object.get("rir", "")
-        name = "Autonomous System"
-        heading = name
-        if aname:
-            heading += " -> " + aname
-        description += "<br>Number -> " + number
-        if rir:
-            description += "<br>Regional Internet Registry (RIR) -> " + rir
-    elif sco_type == "directory":
-        object_form = "directory"
-        icon_type = sco_type
-        path = stix_object.get("path", "")
-        path_enc = stix_object.get("path_enc", "")
-        ctime = stix_object.get("ctime", None)
-        mtime = stix_object.get("mtime", None)
-        atime = stix_object.get("atime", None)
-        name = "Directory"
-        heading = name
-        if path_enc:
-            heading += " -> " + path_enc
-        description += "<br>Path -> " + path
-        if ctime:
-            description += "<br>Created -> " + ctime
-        if mtime:
-            description += "<br>Modified -> " + mtime
-        if atime:
-            description += "<br>Accessed" + atime
-    elif sco_type == "domain-name":
-        icon_type = "domain"
-        object_form = "domain-name"
-        value = stix_object.get("value", "")
-        resolves_to_refs = stix_object.get("resolves_to_refs", [])
-        name = "Domain Name"
-        heading = name
-        if value:
-            heading += " -> " + value
-    elif sco_type == "email-addr":
-        icon_type = sco_type
-        object_form = "email-addr"
-        value = stix_object.get("value", "")
-        display_name = stix_object.get("display_name", "")
-        name = "Email Address"
-        heading = name
-        if display_name:
-            heading += " -> " + display_name
-        description += "<br>Value -> " + value
-    elif sco_type == "email-message":
-        icon_type = "email-message"
-        object_form = icon_type
-        content_type = stix_object.get("content_type", "")
-        received_lines = stix_object.get("received_lines", [])
-        body = stix_object.get("body", "")
-        subject = stix_object.get("subject", "")
-        message_id = stix_object.get("message_id", "")
-        date = stix_object.get("date", None)
-        additional_header_fields = stix_object.get("additional_header_fields", {})
-        is_multipart = stix_object.get("is_multipart", False)
-        name = "Email Message"
-        heading = name
-        if content_type:
-            heading += " -> " + content_type
-        if subject:
-            description += "<br>Subject -> " + subject
-        if date:
-            description += ", Date -> " + date
-        if body:
-            description += "<br>Body -> " + body
-        if message_id:
-            description += "<br>Message ID -> " + message_id
-        if received_lines:
-            description += "<br>Received Header -> "
-            for v in received_lines:
-                description += "<br> - " + str(v)
-        if is_multipart:
-            icon_type = "email-message-mime"
-            body_multipart = stix_object.get("body_multipart", [])
-            name = "MIME " + name
+    icon_type = sco_type
+    object_form = sco_type
+    pid = stix_object.get("pid", "")
+    cwd = stix_object.get("cwd", "")
+    command_line = stix_object.get("command_line", "")
+    environment_variables = stix_object.get("environment_variables", {})
+    name = "Process"
+    heading = name
+    if pid:
+        description += "Process ID -> " + str(pid)
+    if command_line:
+        description += ", Command Line -> " + command_line
+    if cwd:
+        description += "<br>CWD -> " + cwd
+    if environment_variables:
+        description += "<br>IEnvironment Variables -> "
+        for k, v in environment_variables.items():
+            description += "<br> - " + k + " -> " + str(v)
+    if "extensions" in stix_object:
+        if stix_object["extensions"].get("windows-process-ext", False):
+            windows = stix_object.get("windows-process-ext", "")
+            window_title = windows.get("window_title", "")
+            integrity_level = windows.get("integrity_level", "")
+            startup_info = windows.get("startup_info", {})
+            name = "Windows " + name
             heading = name
-            if content_type:
-                heading += " -> " + content_type
-            if body_multipart:
-                description += "<br>MIME Parts -> "
-                for v in body_multipart:
-                    description += "<br> - " + str(v)
-    elif sco_type == "file":
-        icon_type = "file"
-        object_form = "file"
-        aname = stix_object.get("name", "")
-        hashes = stix_object.get("hashes", {})
-        name_enc = stix_object.get("name_enc", "")
-        ctime = stix_object.get("ctime", None)
-        mtime = stix_object.get("mtime", None)
-        atime = stix_object.get("atime", None)
-        mime_type = stix_object.get("mime_type", "")
-        name = "File"
-        heading = name
-        if aname:
-            heading += " -> " + aname
-        if name_enc:
-            description += "<br>Priority -> " + name_enc
-        if mime_type:
-            description += "MIME Type -> " + mime_type
-        if ctime:
-            description += "<br>Created -> " + ctime
-        if mtime:
-            description += "<br>Modified -> " + mtime
-        if atime:
-            description += "<br>Accessed" + atime
-        if hashes:
-            description += "<br>Hashes -> "
-            for k, v in hashes.items():
-                description += "<br>  - " + k + " -> " + str(v)
-        if "extensions" in stix_object:
-            if stix_object["extensions"].get("archive-ext", False):
-                icon_type = "file-archive"
-                archive = stix_object.get("archive-ext", {})
-                comment = archive.get("comment", "")
-                name = "Archive " + name
-                heading = name
-                if aname:
-                    heading += " -> " + aname
-                if comment:
-                    description += "<br>Comment -> " + comment
-            elif stix_object["extensions"].get("pdf-ext", False):
-                icon_type = "file-pdf"
-                pdf = stix_object.get("pdf-ext", {})
-                doc_info_dict = pdf.get("document_info_dict", {})
-                name = "PDF " + name
-                heading = name
-                if aname:
-                    heading += " -> " + aname
-                if doc_info_dict:
-                    for k, v in doc_info_dict.items():
-                        description += "<br>" + k + " -> " + str(v)
-            elif stix_object["extensions"].get("raster-image-ext", False):
-                icon_type = "file-img"
-                img = stix_object.get("raster-image-ext", {})
-                exif_tags = img.get("exif_tags", {})
-                name = "Image " + name
-                heading = name
-                if aname:
-                    heading += " -> " + aname
-                if exif_tags:
-                    for k, v in exif_tags.items():
-                        description += "<br>" + k + " -> " + str(v)
-            elif stix_object["extensions"].get("windows-pebinary-ext", False):
-                icon_type = "file-bin"
-                binary = stix_object.get("windows-pebinary-ext", {})
-                pe_type = binary.get("pe_type", "")
-                number_of_sections = binary.get("number_of_sections", None)
-                name = "Binary " + name
-                heading = name
-                if aname:
-                    heading += " -> " + aname
-                if pe_type:
-                    description += "<br>Executable Type -> " + pe_type
-                if number_of_sections:
-                    description += ", Number of Sections -> " + number_of_sections
-            elif stix_object["extensions"].get("ntfs-ext", False):
-                icon_type = "file-ntfs"
-                ntfs = stix_object.get("ntfs-ext", "")
-                alt_list = ntfs.get("alternate_data_streams", [])
-                name = "NTFS " + name
-                heading = name
-                if aname:
-                    heading += " -> " + aname
-                if alt_list:
-                    description += "<br>Number of Streams -> " + len(alt_list)
-    elif sco_type == "ipv4-addr":
-        icon_type = sco_type
-        object_form = sco_type
-        value = stix_object.get("value", "")
-        name = "IPv4 Address"
-        heading = name
-        description += "<br>Value -> " + value
-    elif sco_type == "ipv6-addr":
-        icon_type = sco_type
-        object_form = sco_type
-        value = stix_object.get("value", "")
-        name = "IPv6 Address"
-        heading = name
-        description += "<br>Value -> " + value
-    elif sco_type == "mac-addr":
-        icon_type = sco_type
-        object_form = sco_type
-        value = stix_object.get("value", "")
-        name = "MAC Address"
-        heading = name
-        description += "<br>Value -> " + value
-    elif sco_type == "mutex":
-        icon_type = sco_type
-        object_form = sco_type
-        aname = stix_object.get("name", "")
-        name = "Mutex"
-        heading = name
-        description += "<br>Name -> " + aname
-    elif sco_type == "network-traffic":
-        icon_type = "network-traffic"
-        object_form = sco_type
-        protocols = stix_object.get("protocols", [])
-        ipfix = stix_object.get("ipfix", {})
-        name = "Network Traffic"
-        heading = name
-        if protocols:
-            description += "<br>Protocols -> " + protocols
-        if ipfix:
-            for k, v in ipfix.items():
-                description += "<br> - " + k + " -> " + str(v)
-        if "extensions" in stix_object:
-            if stix_object["extensions"].get("http-request-ext", False):
-                icon_type = "network-traffic-http"
-                http = stix_object.get("http-request-ext", "")
-                request_method = http.get("request_method", "")
-                request_value = http.get("request_value", "")
-                request_version = http.get("request_version", "")
-                request_header = http.get("request_header", {})
-                name = "HTTP " + name
-                heading = name
-                if request_method:
-                    description += "<br>HTTP Method -> " + request_method
-                if request_value:
-                    description += ", Request Value -> " + request_value
-                if request_version:
-                    description += "<br>Request Version -> " + request_version
-                if request_header:
-                    for k, v in request_header.items():
-                        description += "<br> - " + k + " -> " + str(v)
-            elif stix_object["extensions"].get("icmp-ext", False):
-                icon_type = "network-traffic-icmp"
-                name = "ICMP " + name
-                heading = name
-            elif stix_object["extensions"].get("tcp-ext", False):
-                icon_type = "network-traffic-tcp"
-                name = "TCP " + name
-                heading = name
-            elif stix_object["extensions"].get("socket-ext", False):
-                icon_type = "network-traffic-sock"
-                name = "Socket " + name
-                heading = name
+            if window_title:
+                description += "<br>Windows Title -> " + window_title
+            if integrity_level:
+                description += "<br>Task Types -> " + integrity_level
+            if startup_info:
+                description += "<br>Startup Info -> "
+                for k, v in startup_info.items():
+                    description += "<br>" + k + " -> " + str(v)
+        elif stix_object["extensions"].get("windows-service-ext", False):
+            service = stix_object.get("windows-service-ext", "")
+            display_name = service.get("display_name", "")
+            service_name = service.get("service_name", "")
+            start_type = service.get("start_type", "")
+            service_type = service.get("service_type", "")
+            service_status = service.get("service_status", "")
+            name = "Windows Service"
+            heading = name
+            if display_name:
+                description += "<br>Display Name -> " + display_name
+            if service_name:
+                description += ", Service Name -> " + service_name
+            if service_status:
+                description += "<br>Service Status -> " + service_status
+            if service_type:
+                description += ", Service Type -> " + service_type
+            if start_type:
+                description += "<br>Service Status -> " + start_type
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def user_account_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sco_defaults(stix_object)
+    sco_type = stix_object["type"]
+    icon_type = sco_type
+    object_form = sco_type
+    user_id = stix_object.get("user_id", "")
+    credential = stix_object.get("credential", "")
+    account_login = stix_object.get("account_login", "")
+    account_type = stix_object.get("account_type", "")
+    display_name = stix_object.get("display_name", "")
+    name = "User Account"
+    heading = name
+    if display_name:
+        description += "<br>Display Name -> " + display_name
+    if account_type:
+        description += "<br>Account Type -> " + account_type
+    if user_id:
+        description += ", User ID -> " + user_id
+    if account_login:
+        description += "<br>Login String ->" + account_login
+    if credential:
+        description += ", Credential -> " + credential
+    if "extensions" in stix_object:
+        if stix_object["extensions"].get("unix-account-ext", False):
+            icon_type = "user-account-unix"
+            name = "Unix " + name
+            heading = name
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def windows_registry_key_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sco_defaults(stix_object)
+    sco_type = stix_object["type"]
+    key = stix_object.get("key", "")
+    object_form = sco_type
+    values = stix_object.get("values", [])
+    name = "Windows Registry Key"
+    heading = name
+    if key:
+        description += "<br>Registry Key -> " + key
+    if values:
+        description += "<br>Windows Registry Key Values -> "
+        for i, v in enumerate(values):
+            description += "<br>"
+            name = v.get("name", "")
+            data = v.get("data", "")
+            data_type = v.get("data_type", "")
+            if name:
+                description += "Value Name -> " + name
+            if data_type:
+                description += ", Data Type -> " + data_type
+            if data:
+                description += ", Registry Data -> " + data
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def x509_certificate_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sco_defaults(stix_object)
+    sco_type = stix_object["type"]
+    object_form = sco_type
+    issuer = stix_object.get("issuer", "")
+    subject = stix_object.get("subject", "")
+    name = "X.509 Certificate"
+    heading = name
+    if issuer:
+        description += "<br>Issuer -> " + issuer
+    if subject:
+        description += "<br>Subject -> " + subject
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
+
+
+def default_sco_icon(stix_object, node):
+    name, heading, icon_type, description, object_form, object_group, object_family = sco_defaults(stix_object)
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
 
-    elif sco_type == "process":
-        icon_type = sco_type
-        object_form = sco_type
-        pid = stix_object.get("pid", "")
-        cwd = stix_object.get("cwd", "")
-        command_line = stix_object.get("command_line", "")
-        environment_variables = stix_object.get("environment_variables", {})
-        name = "Process"
-        heading = name
-        if pid:
-            description += "Process ID -> " + str(pid)
-        if command_line:
-            description += ", Command Line -> " + command_line
-        if cwd:
-            description += "<br>CWD -> " + cwd
-        if environment_variables:
-            description += "<br>IEnvironment Variables -> "
-            for k, v in environment_variables.items():
-                description += "<br> - " + k + " -> " + str(v)
-        if "extensions" in stix_object:
-            if stix_object["extensions"].get("windows-process-ext", False):
-                windows = stix_object.get("windows-process-ext", "")
-                window_title = windows.get("window_title", "")
-                integrity_level = windows.get("integrity_level", "")
-                startup_info = windows.get("startup_info", {})
-                name = "Windows " + name
-                heading = name
-                if window_title:
-                    description += "<br>Windows Title -> " + window_title
-                if integrity_level:
-                    description += "<br>Task Types -> " + integrity_level
-                if startup_info:
-                    description += "<br>Startup Info -> "
-                    for k, v in startup_info.items():
-                        description += "<br>" + k + " -> " + str(v)
-            elif stix_object["extensions"].get("windows-service-ext", False):
-                service = stix_object.get("windows-service-ext", "")
-                display_name = service.get("display_name", "")
-                service_name = service.get("service_name", "")
-                start_type = service.get("start_type", "")
-                service_type = service.get("service_type", "")
-                service_status = service.get("service_status", "")
-                name = "Windows Service"
-                heading = name
-                if display_name:
-                    description += "<br>Display Name -> " + display_name
-                if service_name:
-                    description += ", Service Name -> " + service_name
-                if service_status:
-                    description += "<br>Service Status -> " + service_status
-                if service_type:
-                    description += ", Service Type -> " + service_type
-                if start_type:
-                    description += "<br>Service Status -> " + start_type
-    elif sco_type == "software":
-        icon_type = sco_type
-        object_form = sco_type
-        aname = stix_object.get("name", "")
-        cpe = stix_object.get("cpe", "")
-        swid = stix_object.get("swid", "")
-        vendor = stix_object.get("vendor", "")
-        version = stix_object.get("version", "")
-        name = "Software"
-        heading = name
-        if aname:
-            heading += " -> " + aname
-        if cpe:
-            description += "<br>CPE -> " + cpe
-        if swid:
-            description += "<br>SWID -> " + swid
-        if vendor:
-            description += "<br>" + vendor + ' - ' + aname
-        if version:
-            description += ", Version" + version
-    elif sco_type == "url":
-        icon_type = sco_type
-        object_form = sco_type
-        value = stix_object.get("value", "")
-        name = "URL"
-        heading = name
-        description += "<br>Value -> " + value
-    elif sco_type == "user-account":
-        icon_type = sco_type
-        object_form = sco_type
-        user_id = stix_object.get("user_id", "")
-        credential = stix_object.get("credential", "")
-        account_login = stix_object.get("account_login", "")
-        account_type = stix_object.get("account_type", "")
-        display_name = stix_object.get("display_name", "")
-        name = "User Account"
-        heading = name
-        if display_name:
-            description += "<br>Display Name -> " + display_name
-        if account_type:
-            description += "<br>Account Type -> " + account_type
-        if user_id:
-            description += ", User ID -> " + user_id
-        if account_login:
-            description += "<br>Login String ->" + account_login
-        if credential:
-            description += ", Credential -> " + credential
-        if "extensions" in stix_object:
-            if stix_object["extensions"].get("unix-account-ext", False):
-                icon_type = "user-account-unix"
-                name = "Unix " + name
-                heading = name
-    elif sco_type == "windows-registry-key":
-        key = stix_object.get("key", "")
-        object_form = sco_type
-        values = stix_object.get("values", [])
-        name = "Windows Registry Key"
-        heading = name
-        if key:
-            description += "<br>Registry Key -> " + key
-        if values:
-            description += "<br>Windows Registry Key Values -> "
-            for i, v in enumerate(values):
-                description += "<br>"
-                name = v.get("name", "")
-                data = v.get("data", "")
-                data_type = v.get("data_type", "")
-                if name:
-                    description += "Value Name -> " + name
-                if data_type:
-                    description += ", Data Type -> " + data_type
-                if data:
-                    description += ", Registry Data -> " + data
-    elif sco_type == "x509-certificate":
-        object_form = sco_type
-        issuer = stix_object.get("issuer", "")
-        subject = stix_object.get("subject", "")
-        name = "X.509 Certificate"
-        heading = name
-        if issuer:
-            description += "<br>Issuer -> " + issuer
-        if subject:
-            description += "<br>Subject -> " + subject
-    else:
-        pass
-    node["icon"] = icon_type
-    node["name"] = name
-    node["heading"] = heading
-    node["description"] = description
-    node["object_form"] = object_form
-    node["object_group"] = object_group
-    node["object_family"] = object_family
-    return node
 
+# The hand-written renderers, by stix type, which take precedence over the registry rows. These are the
+# types whose heading and description depend on which extensions or properties an object has, so their
+# output cannot be given by one registry row
+sdo_icons = {
+    "identity": identity_icon,
+    "incident": incident_icon,
+    "malware": malware_icon,
+    "malware-analysis": malware_analysis_icon,
+    "threat-actor": threat_actor_icon,
+    "impact": impact_icon,
+    "sequence": sequence_icon,
+    "task": task_icon
+}
+sco_icons = {
+    "email-message": email_message_icon,
+    "file": file_icon,
+    "network-traffic": network_traffic_icon,
+    "process": process_icon,
+    "user-account": user_account_icon,
+    "windows-registry-key": windows_registry_key_icon,
+    "x509-certificate": x509_certificate_icon
+}
+
+
+def read_registry_rows():
+    # The rows of the icon registry, which sits beside this module in the common files directory
+    registry_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), icon_registry_file)
+    if not os.path.exists(registry_path):
+        logger.warning(f"{icon_registry_file} not found, only the hand-written renderers are used")
+        return []
+    # the registry has some non-UTF-8 characters, which the display columns do not use
+    with open(registry_path, "r", encoding="utf-8-sig", errors="ignore") as registry_file:
+        return list(csv.DictReader(registry_file))
+
+
+###################################################################################
+#
+# Registry Templates - the node_name, node_heading and node_description columns
+#
+###################################################################################
+
+# The formats a template may give a value, e.g. {kill_chain_phases.[0].kill_chain_name:title}
+template_formats = {
+    "": str,
+    "title": lambda value: str.title(value.replace("_", " ")),
+    "spaced": lambda value: value.replace("_", " "),
+    "types": lambda refs: ", ".join(str.title(ref.split('--')[0].replace("_", " ")) for ref in refs),
+    "items": lambda value: "".join("<br>  - " + k + " -> " + str(v) for k, v in value.items()),
+}
+
+
+def value_part(path, format_name=""):
+    """
+    Make the template part that writes the value at a registry field path, e.g. external_references.[0].external_id.
+
+    The part returns None when the object has no value there, or its value is empty.
+    """
+    keys = tuple(int(key[1:-1]) if key.startswith("[") else key for key in path.split("."))
+    format_value = template_formats[format_name]
+    if len(keys) == 1 and isinstance(keys[0], str):
+        key = keys[0]
+
+        def part(stix_object):
+            value = stix_object.get(key)
+            return format_value(value) if value else None
+        return part
+
+    def part(stix_object):
+        value = stix_object
+        for key in keys:
+            if isinstance(key, int):
+                value = value[key] if isinstance(value, list) and len(value) > key else None
+            else:
+                value = value.get(key) if isinstance(value, dict) else None
+            if not value:
+                return None
+        return format_value(value)
+    return part
+
+
+def optional_part(parts, condition=None):
+    """
+    Make the part of an optional segment, from its parts, each text or a value_part.
+
+    The segment is written when its condition value is not empty, with its empty values written as "",
+    or, with no condition, when none of its values are empty.
+    """
+    if condition is None and len(parts) == 2 and isinstance(parts[0], str):
+        # the usual segment, a label then a value, e.g. [<br>Goal -> {goal}]
+        label, value_of = parts
+
+        def part(stix_object):
+            value = value_of(stix_object)
+            return label + value if value else ""
+        return part
+    parts = [(lambda stix_object, text=x: text) if isinstance(x, str) else x for x in parts]
+
+    def part(stix_object):
+        if condition is not None:
+            if condition(stix_object) is None:
+                return ""
+            return "".join([x(stix_object) or "" for x in parts])
+        texts = [x(stix_object) for x in parts]
+        return "" if None in texts else "".join(texts)
+    return part
+
+
+def parse_template(template, position=0, optional=False):
+    # Parse the parts of a template, or of the optional segment starting at position, returning them and the end
+    parts = []
+    text = ""
+    while position < len(template):
+        char = template[position]
+        if char == "{":
+            end = template.index("}", position)
+            path, _, format_name = template[position + 1:end].partition(":")
+            parts += [text] if text else []
+            parts.append(value_part(path, format_name))
+            text = ""
+            position = end + 1
+        elif char == "[" and not optional:
+            condition = None
+            field, mark, _ = template[position + 1:].partition("?")
+            if mark and all(x not in field for x in "{[]"):
+                condition = value_part(field)
+                position += len(field) + 1
+            segment, position = parse_template(template, position + 1, optional=True)
+            parts += [text] if text else []
+            parts.append(optional_part(segment, condition))
+            text = ""
+        elif char == "]" and optional:
+            parts += [text] if text else []
+            return parts, position + 1
+        else:
+            text += char
+            position += 1
+    if optional:
+        raise ValueError(f"unclosed [ in registry template {template!r}")
+    parts += [text] if text else []
+    return parts, position
+
+
+def join_parts(parts):
+    # A function of a stix object, joining the text its parts render for it
+    if all(isinstance(part, str) for part in parts):
+        text = "".join(parts)
+        return lambda stix_object: text
+    parts = [(lambda stix_object, text=x: text) if isinstance(x, str) else x for x in parts]
+    if len(parts) == 1:
+        part = parts[0]
+        return lambda stix_object: part(stix_object) or ""
+    return lambda stix_object: "".join([part(stix_object) or "" for part in parts])
+
+
+def compile_template(template):
+    """
+    Compile a registry template into a function of a stix object, returning the text it renders for the object.
+
+    Text is written as it is, {path} or {path:format} is replaced by the value at the field path, written by one of
+    the template_formats, and [...] is an optional segment, written only when none of its values are empty.
+    [path?...] is written when the value at path is not empty, and its own empty values are written as "".
+    e.g. "Indicator[ - {name}]" renders "Indicator - Evil URL" for a named indicator, and "Indicator" otherwise.
+    """
+    return join_parts(parse_template(template)[0])
+
+
+def row_templates(row):
+    """
+    Compile the name, heading and description of an icon registry row.
+
+    A row with a node_name renders from its node_name, node_heading and node_description templates.
+    Any other row is named by its head, and described by each prior_string0..6 label followed
+    by the value of the matching post_field0..6 path, when the object has a value there.
+    """
+    if row.get("node_name"):
+        return (compile_template(row["node_name"]), compile_template(row["node_heading"]),
+                compile_template(row["node_description"]))
+    head = row["head"] or str.title(row["stix_type"].replace("_", " "))
+    steps = []
+    for i in range(7):
+        field = (row.get(f"post_field{i}") or "").strip()
+        if field:
+            label = "<br>" + (row.get(f"prior_string{i}") or "").strip() + " "
+            steps.append(optional_part([label, value_part(field)]))
+    name = join_parts([head])
+    return name, name, join_parts(steps)
+
+
+def registry_icon(row):
+    """Make the renderer of an icon registry row, for a stix type that has no hand-written renderer."""
+    name, heading, description = row_templates(row)
+    icon_type = row["icon"]
+    object_form = row["node_form"] if row.get("node_name") else row["form"]
+    object_group = row["group"] + "-forms"
+    object_family = row.get("node_family") or "stix-forms"
+    # an SDO with no heading is headed as sdo_defaults() heads it
+    default_heading = str.title(row["stix_type"].replace("_", " ")) + " - SDO" if row["group"] == "sdo" else ""
+
+    def render(stix_object, node):
+        return set_node(node, icon_type, name(stix_object), heading(stix_object) or default_heading,
+                        description(stix_object), object_form, object_group, object_family)
+    return render
+
+
+def build_icon_renderers():
+    # Registry rows without a condition give the renderer for their stix type, unless it has a hand-written one
+    renderers = {"sdo": {}, "sco": {}}
+    for row in read_registry_rows():
+        group = renderers.get(row["group"])
+        if group is None or row["condition1"] or row["stix_type"] in group:
+            continue
+        group[row["stix_type"]] = registry_icon(row)
+    renderers["sdo"].update(sdo_icons)
+    renderers["sco"].update(sco_icons)
+    return MappingProxyType({group: MappingProxyType(types) for group, types in renderers.items()})
+
+
+def icon_renderers():
+    """Return the node renderers by group, "sdo" or "sco", then stix type, building them once per process."""
+    global _icon_renderers
+    if _icon_renderers is None:
+        _icon_renderers = build_icon_renderers()
+    return _icon_renderers
 
 
 def meta_icon(stix_object, node):
@@ -1553,12 +1704,5 @@ def meta_icon(stix_object, node):
         statement = definition.get("statement", "")
         heading = heading + " -> Statement"
         description = '<br>' + statement
-    node["icon"] = icon_type
-    node["name"] = name
-    node["heading"] = heading
-    node["description"] = description
-    node["object_form"] = object_form
-    node["object_group"] = object_group
-    node["object_family"] = object_family
-    return node
+    return set_node(node, icon_type, name, heading, description, object_form, object_group, object_family)
 
@@ -0,0 +1,313 @@
+# Generated from icon_registry.csv by parse.write_registry_snapshot(), do not edit
+
+registry_sha256 = '3b28b3401f2795d5d3d0ba1ad040f109d575bd5bb0a40e0a3f350bb4c84c6640'
+
+rows = (
+    {'icon': 'anecdote', 'stix_type': 'anecdote', 'protocol': 'os-threat', 'group': 'sco', 'typeql': 'anecdote', 'form': 'anecdote', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Anecdote', 'prior_string0': 'Report Date -> ', 'post_field0': 'report_date', 'prior_string1': 'Statement -> ', 'post_field1': 'value', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Anecdote', 'node_heading': 'Anecdote[ -> {report_date}]', 'node_description': '/Statement -> {value}', 'node_form': 'anecdote', 'node_family': 'extension-forms', 'python_class': 'Anecdote'},
+    {'icon': 'artifact', 'stix_type': 'artifact', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'artifact', 'form': 'artifact', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Artifact', 'prior_string0': 'MIME Type ->', 'post_field0': 'mime_type', 'prior_string1': 'Encryption Algorithm -> ', 'post_field1': 'encryption_algorithm', 'prior_string2': 'URL -> ', 'post_field2': 'url', 'prior_string3': 'Hashes -> ', 'post_field3': 'hashes', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Artifact', 'node_heading': 'Artifact[ -> {mime_type}]', 'node_description': '[<br>Encryption Algorithm -> {encryption_algorithm}][, Decryption Key -> {priority}][, URL -> {url}][<br>Hashes -> {hashes:items}]', 'node_form': 'artifact', 'node_family': 'stix-forms', 'python_class': 'Artifact'},
+    {'icon': 'attack-action', 'stix_type': 'attack-action', 'protocol': 'flow', 'group': 'sdo', 'typeql': 'flow-action', 'form': 'flow-action', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Action', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'Execution Start -> ', 'post_field2': 'execution_start', 'prior_string3': 'Execution End -> ', 'post_field3': 'execution_end', 'prior_string4': 'Comands ->', 'post_field4': 'command_ref', 'prior_string5': 'Assets -> ', 'post_field5': 'asset_refs', 'prior_string6': 'Effects ->', 'post_field6': 'effect_refs', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'FlowAction'},
+    {'icon': 'attack-asset', 'stix_type': 'attack-asset', 'protocol': 'flow', 'group': 'sdo', 'typeql': 'flow-asset', 'form': 'flow-asset', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Asset', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'Stix Object ->', 'post_field2': 'object_ref', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'FlowAsset'},
+    {'icon': 'attack-condition', 'stix_type': 'attack-condition', 'protocol': 'flow', 'group': 'sdo', 'typeql': 'flow-condition', 'form': 'flow-condition', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Condition', 'prior_string0': 'Pattern_Type', 'post_field0': 'pattern_type', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'On True ->', 'post_field2': 'on_true_refs', 'prior_string3': 'On False ->', 'post_field3': 'on_false_refs', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'FlowCondition'},
+    {'icon': 'attack-flow', 'stix_type': 'attack-flow', 'protocol': 'flow', 'group': 'sdo', 'typeql': 'attack-flow', 'form': 'flow-start', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Flow', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'Effects ->', 'post_field2': 'effect_refs', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'AttackFlow'},
+    {'icon': 'attack-operator', 'stix_type': 'attack-operator', 'protocol': 'flow', 'group': 'sdo', 'typeql': 'flow-operator', 'form': 'flow-operator', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Operator', 'prior_string0': 'Operator -> ', 'post_field0': 'operator', 'prior_string1': 'Effects -> ', 'post_field1': 'effect_refs', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'FlowOperator'},
+    {'icon': 'atlas-subtechnique', 'stix_type': 'attack-pattern', 'protocol': 'atlas', 'group': 'sdo', 'typeql': 'sub-technique', 'form': 'atlas-subtechnique', 'condition1': 'EQUALS', 'field1': 'external_references.[0].source_name', 'value1': 'mitre-atlas', 'condition2': 'EQUALS', 'field2': 'x_mitre_is_subtechnique', 'value2': 'TRUE', 'head': 'Atlas-Subtechnique', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Atlas ID -> ', 'post_field1': 'external_references.[0].external_id', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'SubTechnique'},
+    {'icon': 'atlas-technique', 'stix_type': 'attack-pattern', 'protocol': 'atlas', 'group': 'sdo', 'typeql': 'technique', 'form': 'atlas-technique', 'condition1': 'EQUALS', 'field1': 'external_references.[0].source_name', 'value1': 'mitre-atlas', 'condition2': 'NOT_EXISTS', 'field2': 'x_mitre_is_subtechnique', 'value2': '', 'head': 'Atlas-Technique', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Atlas ID -> ', 'post_field1': 'external_references.[0].external_id', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Technique'},
+    {'icon': 'attack-pattern', 'stix_type': 'attack-pattern', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'attack-pattern', 'form': 'attack-pattern', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Pattern', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Attack Pattern', 'node_heading': 'Attack Pattern - {name}', 'node_description': '[<br>{description}][<br>Alternative Names -> {aliases}][<br>{kill_chain_phases.[0].kill_chain_name:title} -> {kill_chain_phases.[0].phase_name:spaced}]', 'node_form': '', 'node_family': 'stix-forms', 'python_class': 'AttackPattern'},
+    {'icon': 'attack-technique', 'stix_type': 'attack-pattern', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'sub-technique', 'form': 'attack-technique', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': 'EQUALS', 'field2': 'x_mitre_is_subtechnique', 'value2': 'FALSE', 'head': 'Attack-Technique', 'prior_string0': 'Technique -> ', 'post_field0': 'external_references.[0].external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Technique'},
+    {'icon': 'attack-subtechnique', 'stix_type': 'attack-pattern', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'technique', 'form': 'attack-technique', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': 'EQUALS', 'field2': 'x_mitre_is_subtechnique', 'value2': 'TRUE', 'head': 'Attack-Subtechnique', 'prior_string0': 'Sub-Technique -> ', 'post_field0': 'external_references.[0].external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'SubTechnique'},
+    {'icon': 'autonomous-system', 'stix_type': 'autonomous-system', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'autonomous-system', 'form': 'autonomous-system', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Autonomous-System', 'prior_string0': 'Number -> ', 'post_field0': 'number', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'RIR Name -> ', 'post_field2': 'rir', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Autonomous System', 'node_heading': 'Autonomous System[ -> {name}]', 'node_description': '<br>Number -> {number}[<br>Regional Internet Registry (RIR) -> {rir}]', 'node_form': 'autonomous-system', 'node_family': 'stix-forms', 'python_class': 'AutonomousSystem'},
+    {'icon': 'attack-campaign', 'stix_type': 'campaign', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'attack-campaign', 'form': 'attack-campaign', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Campaign', 'prior_string0': 'Campaign ID -> ', 'post_field0': 'external_references.[0].external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': 'First Seen -> ', 'post_field3': 'x_mitre_first_seen_citation', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'AttackCampaign'},
+    {'icon': 'campaign', 'stix_type': 'campaign', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'campaign', 'form': 'campaign', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Campaign', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'Objective -> ', 'post_field2': 'objective', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Campaign', 'node_heading': 'Campaign - {name}', 'node_description': '[<br>{description}][<br>Alternative Names -> {aliases}][<br> Objective -> {objective}]', 'node_form': 'campaign', 'node_family': 'stix-forms', 'python_class': 'Campaign'},
+    {'icon': 'atlas-mitigation', 'stix_type': 'course-of-action', 'protocol': 'atlas', 'group': 'sdo', 'typeql': 'mitigation', 'form': 'atlas-mitigation', 'condition1': 'EQUALS', 'field1': 'external_references.[0].source_name', 'value1': 'mitre-atlas', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Atlas-Mitigation', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Atlas ID -> ', 'post_field1': 'external_references.[0].external_id', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Mitigation'},
+    {'icon': 'attack-mitigation', 'stix_type': 'course-of-action', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'mitigation', 'form': 'attack-mitigation', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Mitigation', 'prior_string0': 'Mitigation ID -> ', 'post_field0': 'external_references.[0].external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Mitigation'},
+    {'icon': 'oca-course-of-action-playbook-ext', 'stix_type': 'course-of-action', 'protocol': 'oca', 'group': 'sdo', 'typeql': 'course-of-action', 'form': 'course-of-action', 'condition1': 'EXISTS', 'field1': 'extensions.extension-definition--bbc1d5c8-7ddc-4e89-be9c-f33ad02d71dd', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-CoA-Playbook', 'prior_string0': 'Playbook Type -> ', 'post_field0': 'extensions.extension-definition--bbc1d5c8-7ddc-4e89-be9c-f33ad02d71dd.extension_type', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'CourseOfAction'},
+    {'icon': 'course-of-action', 'stix_type': 'course-of-action', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'course-of-action', 'form': 'course-of-action', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Course-Of-Action', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Course of Action', 'node_heading': 'Course of Action - {name}', 'node_description': '[<br>{description}]', 'node_form': 'course-of-action', 'node_family': 'stix-forms', 'python_class': 'CourseOfAction'},
+    {'icon': 'directory', 'stix_type': 'directory', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'directory', 'form': 'directory', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Directory', 'prior_string0': 'Path -> ', 'post_field0': 'path', 'prior_string1': 'Contains -> ', 'post_field1': 'contains_refs ', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Directory', 'node_heading': 'Directory[ -> {path_enc}]', 'node_description': '<br>Path -> {path}[<br>Created -> {ctime}][<br>Modified -> {mtime}][<br>Accessed{atime}]', 'node_form': 'directory', 'node_family': 'stix-forms', 'python_class': 'Directory'},
+    {'icon': 'domain', 'stix_type': 'domain-name', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'domain-name', 'form': 'domain-name', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Domain Name', 'prior_string0': 'Value -> ', 'post_field0': 'value', 'prior_string1': 'Resolves t0 -> ', 'post_field1': 'resolves_to_refs ', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Domain Name', 'node_heading': 'Domain Name[ -> {value}]', 'node_description': '', 'node_form': 'domain-name', 'node_family': 'stix-forms', 'python_class': 'DomainName'},
+    {'icon': 'email-addr', 'stix_type': 'email-addr', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'email-addr', 'form': 'email-addr', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Email-Addr', 'prior_string0': 'Value -> ', 'post_field0': 'value', 'prior_string1': 'Display Name -> ', 'post_field1': 'display_name', 'prior_string2': 'Belongs to -> ', 'post_field2': 'belongs_to_ref', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Email Address', 'node_heading': 'Email Address[ -> {display_name}]', 'node_description': '<br>Value -> {value}', 'node_form': 'email-addr', 'node_family': 'stix-forms', 'python_class': 'EmailAddress'},
+    {'icon': 'email-message-mime', 'stix_type': 'email-message', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'email-message', 'form': 'email-message', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Email-Message-Mime', 'prior_string0': 'From -> ', 'post_field0': 'from_ref', 'prior_string1': 'Subject', 'post_field1': 'subject', 'prior_string2': 'Body -> ', 'post_field2': 'body', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'EmailMessage'},
+    {'icon': 'email-message', 'stix_type': 'email-message', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'email-message', 'form': 'email-message', 'condition1': 'EQUALS', 'field1': 'is_multipart', 'value1': 'TRUE', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Email-Message', 'prior_string0': 'From -> ', 'post_field0': 'from_ref', 'prior_string1': 'Subject', 'post_field1': 'subject', 'prior_string2': 'Body -> ', 'post_field2': 'body', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'EmailMessage'},
+    {'icon': 'event', 'stix_type': 'event', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'event', 'form': 'event', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Event', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Event', 'node_heading': 'Event[ -> {name}], Status -> {status}', 'node_description': '[<br>{description}][<br>Goal -> {goal}]', 'node_form': 'event', 'node_family': 'extension-forms', 'python_class': 'Event'},
+    {'icon': 'extension-definition', 'stix_type': 'extension-definition', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'extension-definition', 'form': 'extension-definition', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Extension-Definition', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'ExtensionDefinition'},
+    {'icon': 'file', 'stix_type': 'file', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'oca-file', 'form': 'file', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'File', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Parent Directory ->', 'post_field1': 'parent_directory_ref ', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'File'},
+    {'icon': 'file-archive', 'stix_type': 'file', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'file', 'form': 'file', 'condition1': 'EXISTS', 'field1': 'extensions.archive-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'File-Archive', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Parent Directory ->', 'post_field1': 'parent_directory_ref ', 'prior_string2': '', 'post_field2': 'Archive -> ', 'prior_string3': 'extensions.archive-ext.comment', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'File'},
+    {'icon': 'file-ntfs', 'stix_type': 'file', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'file', 'form': 'file', 'condition1': 'EXISTS', 'field1': 'extensions.ntfs-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'File-NTFS', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Parent Directory ->', 'post_field1': 'parent_directory_ref ', 'prior_string2': '', 'post_field2': 'NTFS Version -> ', 'prior_string3': 'extensions.ntfs-ext.sid', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'File'},
+    {'icon': 'file-pdf', 'stix_type': 'file', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'file', 'form': 'file', 'condition1': 'EXISTS', 'field1': 'extensions.pdf-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'File-PDF', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Parent Directory ->', 'post_field1': 'parent_directory_ref ', 'prior_string2': '', 'post_field2': 'PDF Version -> ', 'prior_string3': 'extensions.pdf-ext.version', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'File'},
+    {'icon': 'file-bin', 'stix_type': 'file', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'file', 'form': 'file', 'condition1': 'EXISTS', 'field1': 'extensions.windows-pebinary-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'File-Binary', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Parent Directory ->', 'post_field1': 'parent_directory_ref ', 'prior_string2': '', 'post_field2': 'Binary Type -> ', 'prior_string3': 'extensions.windows-pebinary-ext.pe_type', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'File'},
+    {'icon': 'file-img', 'stix_type': 'file', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'file', 'form': 'file', 'condition1': 'EXISTS', 'field1': 'extensions.raster-image-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'File-IMG', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Parent Directory ->', 'post_field1': 'parent_directory_ref ', 'prior_string2': '', 'post_field2': 'Image Height ->', 'prior_string3': 'extensions.raster-image-ext.image_height', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'File'},
+    {'icon': 'oca-file', 'stix_type': 'file', 'protocol': 'oca', 'group': 'sco', 'typeql': 'file', 'form': 'OCAFile', 'condition1': 'STARTS_WITH', 'field1': '', 'value1': 'x_', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-File', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Parent Directory ->', 'post_field1': 'parent_directory_ref ', 'prior_string2': '', 'post_field2': '', 'prior_string3': 'extensions.', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCAFile'},
+    {'icon': 'grouping', 'stix_type': 'grouping', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'grouping', 'form': 'grouping', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Grouping', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Grouping', 'node_heading': '[Grouping - {name}]', 'node_description': '[<br>{description}][<br>OS_Triage -> {context}]', 'node_form': 'grouping', 'node_family': 'stix-forms', 'python_class': 'Grouping'},
+    {'icon': 'attack-identity', 'stix_type': 'identity', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'attack-identity', 'form': 'attack-identity', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Identity', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'AttackIdentity'},
+    {'icon': 'identity-ext', 'stix_type': 'identity', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'identity', 'form': 'identity', 'condition1': 'EXISTS', 'field1': 'extensions.extension-definition--66e2492a-bbd3-4be6-88f5-cc91a017a498', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Extended-Identity', 'prior_string0': 'First Name ->', 'post_field0': 'first_name', 'prior_string1': 'Last Name ->', 'post_field1': 'last_name', 'prior_string2': 'Name -> ', 'post_field2': 'name', 'prior_string3': 'Description ->', 'post_field3': 'description', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Identity'},
+    {'icon': 'identity-asset', 'stix_type': 'identity', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'identity', 'form': 'identity', 'condition1': 'EQUALS', 'field1': 'identity_class', 'value1': 'asset', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Identity-Asset', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Identity'},
+    {'icon': 'identity-system', 'stix_type': 'identity', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'identity', 'form': 'identity', 'condition1': 'EQUALS', 'field1': 'identity_class', 'value1': 'system', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Identity-System', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Identity'},
+    {'icon': 'identity-class', 'stix_type': 'identity', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'identity', 'form': 'identity', 'condition1': 'EQUALS', 'field1': 'identity_class', 'value1': 'class', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Identity-Class', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Identity'},
+    {'icon': 'identity-individual', 'stix_type': 'identity', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'identity', 'form': 'identity', 'condition1': 'EQUALS', 'field1': 'identity_class', 'value1': 'individual', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Identity-Individual', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Identity'},
+    {'icon': 'identity-group', 'stix_type': 'identity', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'identity', 'form': 'identity', 'condition1': 'EQUALS', 'field1': 'identity_class', 'value1': 'group', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Identity-Group', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Identity'},
+    {'icon': 'identity-unknown', 'stix_type': 'identity', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'identity', 'form': 'identity', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Identity-Unknown', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Identity'},
+    {'icon': 'identity-organization', 'stix_type': 'identity', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'identity', 'form': 'identity', 'condition1': 'EQUALS', 'field1': 'identity_class', 'value1': 'organization', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Identity-Organization', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Identity'},
+    {'icon': 'impact-confidentiality', 'stix_type': 'impact', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'impact', 'form': 'impact', 'condition1': 'EXISTS', 'field1': 'extensions.confidentiality', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Impact-Confidentiality', 'prior_string0': 'Type ->', 'post_field0': 'extensions.confidentiality.information_type', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Impact'},
+    {'icon': 'impact-availability', 'stix_type': 'impact', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'impact', 'form': 'impact', 'condition1': 'EXISTS', 'field1': 'extensions.availability', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Impact-Availability', 'prior_string0': 'Impact ->', 'post_field0': 'extensions.availability.availability_impact', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Impact'},
+    {'icon': 'impact-traceability', 'stix_type': 'impact', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'impact', 'form': 'impact', 'condition1': 'EXISTS', 'field1': 'extensions.traceability', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Impact-Traceability', 'prior_string0': 'Impact ->', 'post_field0': 'extensions.traceability.traceability_impact', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Impact'},
+    {'icon': 'impact-external', 'stix_type': 'impact', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'impact', 'form': 'impact', 'condition1': 'EXISTS', 'field1': 'extensions.external', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Impact-External', 'prior_string0': 'Type ->', 'post_field0': 'extensions.external.impact_type', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Impact'},
+    {'icon': 'impact-integrity', 'stix_type': 'impact', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'impact', 'form': 'impact', 'condition1': 'EXISTS', 'field1': 'extensions.integrity', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Impact-Integrity', 'prior_string0': 'Type ->', 'post_field0': 'extensions.integrity.information_type', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Impact'},
+    {'icon': 'impact-monetary', 'stix_type': 'impact', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'impact', 'form': 'impact', 'condition1': 'EXISTS', 'field1': 'extensions.monetary', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Impact-Monetary', 'prior_string0': 'Type ->', 'post_field0': 'extensions.monetary.variety', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Impact'},
+    {'icon': 'impact-physical', 'stix_type': 'impact', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'impact', 'form': 'impact', 'condition1': 'EXISTS', 'field1': 'extensions.physical', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Impact-Physical', 'prior_string0': 'Type ->', 'post_field0': 'extensions.physical.impact_type', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Impact'},
+    {'icon': 'incident-ext', 'stix_type': 'incident', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'incident', 'form': 'incident', 'condition1': 'EXISTS', 'field1': 'extensions.extension-definition--ef765651-680c-498d-9894-99799f2fa126', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Extended-Incident', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Incident'},
+    {'icon': 'incident', 'stix_type': 'incident', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'incident', 'form': 'incident', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Incident', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Incident'},
+    {'icon': 'indicator', 'stix_type': 'indicator', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'indicator', 'form': 'indicator', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Indicator', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Indicator', 'node_heading': 'Indicator[ - {name}]', 'node_description': '[<br>{description}]<br>Pattern Type -> {pattern_type}[Indicator Types -> {indicator_types}]<br>Pattern -> {pattern}[<br>{kill_chain_phases.[0].kill_chain_name:title}]', 'node_form': 'indicator', 'node_family': 'stix-forms', 'python_class': 'Indicator'},
+    {'icon': 'infrastructure', 'stix_type': 'infrastructure', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'infrastructure', 'form': 'infrastructure', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Infrastructure', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Infrastructure', 'node_heading': 'Infrastructure - {name}', 'node_description': '[<br>{description}][/Infrastructure Type -> {infrastructure_types}][, Aliases -> {aliases}][<br>{kill_chain_phases.[0].kill_chain_name:title}]', 'node_form': 'infrastructure', 'node_family': 'stix-forms', 'python_class': 'Infrastructure'},
+    {'icon': 'attack-group', 'stix_type': 'intrusion-set', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'intrusion-set', 'form': 'attack-group', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Group', 'prior_string0': 'Group ID -> ', 'post_field0': 'external_references.[0].external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Group'},
+    {'icon': 'intrusion-set', 'stix_type': 'intrusion-set', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'intrusion-set', 'form': 'intrusion-set', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Intrusion-Set', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Intrusion Set', 'node_heading': 'Intrusion Set - {name}', 'node_description': '[<br>{description}][<br>Intruder Resources -> {resource_level}][, Goals -> {goals}][<br>Primary Motivation -> {primary_motivation}][<br>Secondary Motivations ->{secondary_motivations}]', 'node_form': 'intrusion-set', 'node_family': 'stix-forms', 'python_class': 'IntrusionSet'},
+    {'icon': 'ipv4-addr', 'stix_type': 'ipv4-addr', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'ipv4-addr', 'form': 'ipv4-addr', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'IPv4-Addr', 'prior_string0': 'Value -> ', 'post_field0': 'value', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'IPv4 Address', 'node_heading': 'IPv4 Address', 'node_description': '<br>Value -> {value}', 'node_form': 'ipv4-addr', 'node_family': 'stix-forms', 'python_class': 'IPv4Address'},
+    {'icon': 'ipv6-addr', 'stix_type': 'ipv6-addr', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'ipv6-addr', 'form': 'ipv6-addr', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'IPv6-Addr', 'prior_string0': 'Value -> ', 'post_field0': 'value', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'IPv6 Address', 'node_heading': 'IPv6 Address', 'node_description': '<br>Value -> {value}', 'node_form': 'ipv6-addr', 'node_family': 'stix-forms', 'python_class': 'IPv6Address'},
+    {'icon': 'location', 'stix_type': 'location', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'location', 'form': 'location', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Location', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Location', 'node_heading': 'Location[ - {name}]', 'node_description': '[<br>{description}][<br>Street Address -> {street_address}][, City -> {city}][, Postal Code -> {postal_code}][, Country -> {country}][, Region -> {region}]', 'node_form': 'location', 'node_family': 'stix-forms', 'python_class': 'Location'},
+    {'icon': 'mac-addr', 'stix_type': 'mac-addr', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'mac-addr', 'form': 'mac-addr', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Mac-Addr', 'prior_string0': 'Value -> ', 'post_field0': 'value', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'MAC Address', 'node_heading': 'MAC Address', 'node_description': '<br>Value -> {value}', 'node_form': 'mac-addr', 'node_family': 'stix-forms', 'python_class': 'MACAddress'},
+    {'icon': 'attack-software', 'stix_type': 'malware', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'software-malware', 'form': 'attack-malware', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Software', 'prior_string0': 'Software ID -> ', 'post_field0': 'external_references.[0].external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'SoftwareMalware'},
+    {'icon': 'malware-ext', 'stix_type': 'malware', 'protocol': 'mbc', 'group': 'sdo', 'typeql': 'malware', 'form': 'malware', 'condition1': 'EXISTS', 'field1': 'extensions.extension-definition--8e9e338f-c9ee-4d4f-8cac-85b4dcfdf3c1', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Extended Malware', 'prior_string0': 'MBC ID -> ', 'post_field0': 'extensions.extension-definition--8e9e338f-c9ee-4d4f-8cac-85b4dcfdf3c.obj_defn.external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Malware'},
+    {'icon': 'malware', 'stix_type': 'malware', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'malware', 'form': 'malware', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Malware', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Malware'},
+    {'icon': 'malware-family', 'stix_type': 'malware', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'malware', 'form': 'malware', 'condition1': 'EQUALS', 'field1': 'is_family', 'value1': 'TRUE', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Malware-Family', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Malware'},
+    {'icon': 'malware-analysis', 'stix_type': 'malware-analysis', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'malware-analysis', 'form': 'malware-analysis', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Malware-Analysis', 'prior_string0': 'Engine ->', 'post_field0': 'product', 'prior_string1': 'Result -> ', 'post_field1': 'result', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'MalwareAnalysis'},
+    {'icon': 'mbc-malware-behavior', 'stix_type': 'malware-behavior', 'protocol': 'mbc', 'group': 'sdo', 'typeql': 'malware-behavior', 'form': 'malware-behavior', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'MBC-Malware-Behaviour', 'prior_string0': 'MBC ID -> ', 'post_field0': 'obj_defn.external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'MalwareBehaviour'},
+    {'icon': 'mbc-malware-method', 'stix_type': 'malware-method', 'protocol': 'mbc', 'group': 'sdo', 'typeql': 'malware-method', 'form': 'malware-method', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'MBC-Malware-Method', 'prior_string0': 'MBC ID -> ', 'post_field0': 'obj_defn.external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'MalwareMethod'},
+    {'icon': 'mbc-malware-objective', 'stix_type': 'malware-objective', 'protocol': 'mbc', 'group': 'sdo', 'typeql': 'malware-objective', 'form': 'malware-objective', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'MBC-Malware-Objective', 'prior_string0': 'MBC ID ->', 'post_field0': 'obj_defn.external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'MalwareObjective'},
+    {'icon': 'marking', 'stix_type': 'marking-definition', 'protocol': 'stix21', 'group': 'meta', 'typeql': 'marking-definition', 'form': 'marking-definition', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Marking', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Type -> ', 'post_field1': 'definition_type', 'prior_string2': 'Definition -> ', 'post_field2': 'definition', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'MarkingDefinition'},
+    {'icon': 'mutex', 'stix_type': 'mutex', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'mutex', 'form': 'mutex', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Mutex', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Mutex', 'node_heading': 'Mutex', 'node_description': '<br>Name -> {name}', 'node_form': 'mutex', 'node_family': 'stix-forms', 'python_class': 'Mutex'},
+    {'icon': 'oca-network-traffic', 'stix_type': 'network-traffic', 'protocol': 'oca', 'group': 'sco', 'typeql': 'oca-network-traffic', 'form': 'network-traffic', 'condition1': 'STARTS_WITH', 'field1': '', 'value1': 'x_', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA Network Traffic', 'prior_string0': 'Protocols -> ', 'post_field0': 'protocols', 'prior_string1': 'Network Name -> ', 'post_field1': 'x_name', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCANetworkTraffic'},
+    {'icon': 'oca-network-traffic-dns-ext', 'stix_type': 'network-traffic', 'protocol': 'oca', 'group': 'sco', 'typeql': 'network-traffic', 'form': 'network-traffic', 'condition1': 'EXISTS', 'field1': 'extensions.dns-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA Network Traffic DNS Extension', 'prior_string0': 'Protocols -> ', 'post_field0': 'protocols', 'prior_string1': 'Domain Name -> ', 'post_field1': 'extensions.dns-ext.question.name_ref', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'NetworkTraffic'},
+    {'icon': 'oca-network-traffic-rita-ext', 'stix_type': 'network-traffic', 'protocol': 'oca', 'group': 'sco', 'typeql': 'network-traffic', 'form': 'network-traffic', 'condition1': 'EXISTS', 'field1': 'extensions.extension-definition--3b7505ce-2a18-496e-aa58-311dac6c1473', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA Network Traffic Rita Extension', 'prior_string0': 'Protocols -> ', 'post_field0': 'protocols', 'prior_string1': 'Connections ->', 'post_field1': 'extensions.extension-definition--3b7505ce-2a18-496e-aa58-311dac6c1473.connections', 'prior_string2': 'Score -> ', 'post_field2': 'extensions.extension-definition--3b7505ce-2a18-496e-aa58-311dac6c1473.score', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'NetworkTraffic'},
+    {'icon': 'network-traffic', 'stix_type': 'network-traffic', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'network-traffic', 'form': 'network-traffic', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Network-Traffic', 'prior_string0': 'Protocols -> ', 'post_field0': 'protocols', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'NetworkTraffic'},
+    {'icon': 'network-traffic-http', 'stix_type': 'network-traffic', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'network-traffic', 'form': 'network-traffic', 'condition1': 'EXISTS', 'field1': 'extensions. http-request-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Network-Trafffic-HTTP', 'prior_string0': 'Protocols -> ', 'post_field0': 'protocols', 'prior_string1': 'Request Method -> ', 'post_field1': 'request_method ', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'NetworkTraffic'},
+    {'icon': 'network-traffic-icmp', 'stix_type': 'network-traffic', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'network-traffic', 'form': 'network-traffic', 'condition1': 'EXISTS', 'field1': 'extensions.icmp-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Network-Traffic-ICMP', 'prior_string0': 'Protocols -> ', 'post_field0': 'protocols', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'NetworkTraffic'},
+    {'icon': 'network-traffic-sock', 'stix_type': 'network-traffic', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'network-traffic', 'form': 'network-traffic', 'condition1': 'EXISTS', 'field1': 'extensions.socket-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Network-Traffic-SOCK', 'prior_string0': 'Protocols -> ', 'post_field0': 'protocols', 'prior_string1': 'Address Family -> ', 'post_field1': 'address_family ', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'NetworkTraffic'},
+    {'icon': 'network-traffic-tcp', 'stix_type': 'network-traffic', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'network-traffic', 'form': 'network-traffic', 'condition1': 'EXISTS', 'field1': 'extensions.tcp-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Network-Traffic-TCP', 'prior_string0': 'Protocols -> ', 'post_field0': 'protocols', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'NetworkTraffic'},
+    {'icon': 'note', 'stix_type': 'note', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'note', 'form': 'note', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Note', 'prior_string0': 'Abstract -> ', 'post_field0': 'abstract', 'prior_string1': 'Content -> ', 'post_field1': 'content', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Note', 'node_heading': 'Note', 'node_description': '[<br> Abstract -> {abstract}][<br>Content -> {content}][<br>Applies to -> {object_refs:types}]', 'node_form': 'note', 'node_family': 'stix-forms', 'python_class': 'Note'},
+    {'icon': 'observed-data', 'stix_type': 'observed-data', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'observed-data', 'form': 'observed-data', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Observed-Data', 'prior_string0': 'First Seen -> ', 'post_field0': 'first_observed', 'prior_string1': 'Last Seen -> ', 'post_field1': 'last_observed', 'prior_string2': 'Number of Times ->', 'post_field2': '', 'prior_string3': 'number_observed', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Observed Data', 'node_heading': 'Observed Data', 'node_description': '[<br>First Observed -> {first_observed}][, Last Observed -> {last_observed}]', 'node_form': 'observed-data', 'node_family': 'stix-forms', 'python_class': 'ObservedData'},
+    {'icon': 'opinion', 'stix_type': 'opinion', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'observed-data', 'form': 'opinion', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Opinion', 'prior_string0': 'Authors -> ', 'post_field0': 'authors', 'prior_string1': 'Opinion -> ', 'post_field1': 'opinion', 'prior_string2': 'Explanation -> ', 'post_field2': 'explanation', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Opinion', 'node_heading': 'Opinion on - {object_refs:types}', 'node_description': '<br>{opinion}[<br>Due to -> {explanation}][<br>Reported by -> {authors}]', 'node_form': 'opinion', 'node_family': 'stix-forms', 'python_class': 'Opinion'},
+    {'icon': 'oca-process', 'stix_type': 'process', 'protocol': 'oca', 'group': 'sco', 'typeql': 'observed-data', 'form': 'process', 'condition1': 'STARTS_WITH', 'field1': '', 'value1': 'x_', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-Process', 'prior_string0': 'Window Title -> ', 'post_field0': 'x_window_title', 'prior_string1': 'CWD -> ', 'post_field1': 'cwd', 'prior_string2': 'Command Line -> ', 'post_field2': 'command_line ', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCAProcess'},
+    {'icon': 'oca-process-ext', 'stix_type': 'process', 'protocol': 'oca', 'group': 'sco', 'typeql': 'observed-data', 'form': 'process', 'condition1': 'EXISTS', 'field1': 'extensions.extension-definition--f9dbe89c-0030-4a9d-8b78-0dcd0a0de874', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-Process Extension', 'prior_string0': 'Name -> ', 'post_field0': 'extensions.extension-definition--f9dbe89c-0030-4a9d-8b78-0dcd0a0de874.name', 'prior_string1': 'Type -> ', 'post_field1': 'extensions.extension-definition--f9dbe89c-0030-4a9d-8b78-0dcd0a0de874.operation_type', 'prior_string2': '', 'post_field2': '', 'prior_string3': 'CWD -> ', 'post_field3': 'cwd', 'prior_string4': 'Command Line -> ', 'post_field4': 'command_line ', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Process'},
+    {'icon': 'process', 'stix_type': 'process', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'observed-data', 'form': 'process', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Process', 'prior_string0': 'CWD -> ', 'post_field0': 'cwd', 'prior_string1': 'Command Line -> ', 'post_field1': 'command_line ', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Process'},
+    {'icon': 'attack-procedure', 'stix_type': 'relationship', 'protocol': 'attack', 'group': 'sro', 'typeql': 'attack-relation', 'form': 'attack-procedure', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Procedure', 'prior_string0': 'Type -> ', 'post_field0': 'relationship_type', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'Source -> ', 'post_field2': 'source_ref', 'prior_string3': 'Target -> ', 'post_field3': 'target_ref', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'AttackRelation'},
+    {'icon': 'relationship', 'stix_type': 'relationship', 'protocol': 'stix21', 'group': 'sro', 'typeql': 'relationship', 'form': 'relationship', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Relationship', 'prior_string0': 'Type -> ', 'post_field0': 'relationship_type', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'Source -> ', 'post_field2': 'source_ref', 'prior_string3': 'Target -> ', 'post_field3': 'target_ref', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Relationship'},
+    {'icon': 'report', 'stix_type': 'report', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'report', 'form': 'report', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Report', 'prior_string0': 'Type ->', 'post_field0': 'report_types', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Report', 'node_heading': 'Report - {name}', 'node_description': '[<br>Report Type -> {report_types}][<br>{description}][<br>Published on -> {published}]', 'node_form': 'report', 'node_family': 'stix-forms', 'python_class': 'Report'},
+    {'icon': 'step-terminal', 'stix_type': 'sequence', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'sequence', 'form': 'sequence', 'condition1': 'EQUALS', 'field1': 'step_type', 'value1': 'start_step', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Step-Terminal', 'prior_string0': 'For -> ', 'post_field0': 'sequence_type', 'prior_string1': 'Type -> ', 'post_field1': 'step_type', 'prior_string2': 'On Completion -> ', 'post_field2': 'on_completion_ref', 'prior_string3': 'On Success -> ', 'post_field3': 'on_success_ref', 'prior_string4': 'On Failure -> ', 'post_field4': 'on_failure_ref', 'prior_string5': 'Next Steps -> ', 'post_field5': 'next_step_refs', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sequence'},
+    {'icon': 'step-xor', 'stix_type': 'sequence', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'start-step', 'form': 'sequence', 'condition1': 'EXISTS', 'field1': 'on_success_ref', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Step - Choice', 'prior_string0': 'For -> ', 'post_field0': 'sequence_type', 'prior_string1': 'Type -> ', 'post_field1': 'step_type', 'prior_string2': 'On Completion -> ', 'post_field2': 'on_completion_ref', 'prior_string3': 'On Success -> ', 'post_field3': 'on_success_ref', 'prior_string4': 'On Failure -> ', 'post_field4': 'on_failure_ref', 'prior_string5': 'Next Steps -> ', 'post_field5': 'next_step_refs', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sequence'},
+    {'icon': 'step-parallel', 'stix_type': 'sequence', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'end-step', 'form': 'sequence', 'condition1': 'EQUALS', 'field1': 'step_type', 'value1': 'parallel_step', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Step-Parallel', 'prior_string0': 'For -> ', 'post_field0': 'sequence_type', 'prior_string1': 'Type -> ', 'post_field1': 'step_type', 'prior_string2': 'On Completion -> ', 'post_field2': 'on_completion_ref', 'prior_string3': 'On Success -> ', 'post_field3': 'on_success_ref', 'prior_string4': 'On Failure -> ', 'post_field4': 'on_failure_ref', 'prior_string5': 'Next Steps -> ', 'post_field5': 'next_step_refs', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sequence'},
+    {'icon': 'step-single', 'stix_type': 'sequence', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'single-step', 'form': 'sequence', 'condition1': 'EQUALS', 'field1': 'step_type', 'value1': 'single_step', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Step-Single', 'prior_string0': 'For -> ', 'post_field0': 'sequence_type', 'prior_string1': 'Type -> ', 'post_field1': 'step_type', 'prior_string2': 'On Completion -> ', 'post_field2': 'on_completion_ref', 'prior_string3': 'On Success -> ', 'post_field3': 'on_success_ref', 'prior_string4': 'On Failure -> ', 'post_field4': 'on_failure_ref', 'prior_string5': 'Next Steps -> ', 'post_field5': 'next_step_refs', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sequence'},
+    {'icon': 'sighting-alert', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': 'parallel-step', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.sighting-alert', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting-Alert', 'prior_string0': 'Name -> ', 'post_field0': 'extensions.sighting-alert.name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting-context', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': '', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.sighting-context', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting-Context', 'prior_string0': 'Name -> ', 'post_field0': 'extensions.sighting-context.name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting-exclusion', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': 'sighting', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.sighting-exclusion', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting-Exclusion', 'prior_string0': 'Name -> ', 'post_field0': 'extensions.sighting-exclusion.source', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting-enrichment', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': 'sighting', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.sighting-enrichment', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting-Enrichment', 'prior_string0': 'Name -> ', 'post_field0': 'extensions.sighting-enrichment.name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting--hunt', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': 'sighting', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.sighting-hunt', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting--Hunt', 'prior_string0': 'Name -> ', 'post_field0': 'extensions.sighting-hunt.name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting-framework', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': 'sighting', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.sighting-framework', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting-Framework', 'prior_string0': 'Framework ->', 'post_field0': 'extensions.sighting-framework.framework', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting-external', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': 'sighting', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.sighting-external', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting-External', 'prior_string0': 'Source ->', 'post_field0': 'extensions.sighting-external.source', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting-anecdote', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': 'sighting', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.sighting-anecdote', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting-Anecdote', 'prior_string0': 'Person  -> ', 'post_field0': 'extensions.sighting-anecdote.person_name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting-generic', 'stix_type': 'sighting', 'protocol': 'os-threat', 'group': 'sro', 'typeql': 'sighting', 'form': 'sighting', 'condition1': 'EXISTS', 'field1': 'extensions.', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting-Generic', 'prior_string0': 'Description ->', 'post_field0': 'description', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'sighting', 'stix_type': 'sighting', 'protocol': 'stix21', 'group': 'sro', 'typeql': 'sighting', 'form': 'sighting', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Sighting', 'prior_string0': 'Description ->', 'post_field0': 'description', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Sighting'},
+    {'icon': 'oca-software', 'stix_type': 'software', 'protocol': 'oca', 'group': 'sco', 'typeql': 'oca-software', 'form': 'software', 'condition1': 'STARTS_WITH', 'field1': '', 'value1': 'x_', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-Software', 'prior_string0': 'Description ->', 'post_field0': 'x_description', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Vendor -> ', 'post_field2': 'vendor', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCASoftware'},
+    {'icon': 'software', 'stix_type': 'software', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'software', 'form': 'software', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Software', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Vendor -> ', 'post_field1': 'vendor', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Software', 'node_heading': 'Software[ -> {name}]', 'node_description': '[<br>CPE -> {cpe}][<br>SWID -> {swid}][vendor?<br>{vendor} - {name}][, Version{version}]', 'node_form': 'software', 'node_family': 'stix-forms', 'python_class': 'Software'},
+    {'icon': 'task', 'stix_type': 'task', 'protocol': 'os-threat', 'group': 'sdo', 'typeql': 'task', 'form': 'task', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Task', 'prior_string0': 'Outcome -> ', 'post_field0': 'outcome', 'prior_string1': 'Type -> ', 'post_field1': 'task_types', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Task'},
+    {'icon': 'threat-actor', 'stix_type': 'threat-actor', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'threat-actor', 'form': 'threat-actor', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Threat-Actor', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'Type ->', 'post_field2': 'threat_actor_types', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'ThreatActor'},
+    {'icon': 'attack-software', 'stix_type': 'tool', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'software-tool', 'form': 'attack-software', 'condition1': 'EXISTS', 'field1': 'x_mitre_attack_spec_version', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Software', 'prior_string0': 'Software ID -> ', 'post_field0': 'external_references.[0].external_id', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': 'Type ->', 'post_field3': 'tool_types', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'SoftwareTool'},
+    {'icon': 'oca-tool-hvt-ext', 'stix_type': 'tool', 'protocol': 'oca', 'group': 'sdo', 'typeql': 'tool', 'form': 'tool', 'condition1': 'EXISTS', 'field1': 'extensions.extension-definition--fb58a27d-32d2-4b8d-9705-e3cfd2d3dcdf', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'High Value Tool', 'prior_string0': 'Attributes -> ', 'post_field0': 'extensions.extension-definition--fb58a27d-32d2-4b8d-9705-e3cfd2d3dcdf.high_value_target_attributes', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': 'Type ->', 'post_field3': 'tool_types', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Tool'},
+    {'icon': 'tool', 'stix_type': 'tool', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'tool', 'form': 'tool', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Tool', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': 'Type ->', 'post_field2': 'tool_types', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Tool', 'node_heading': 'Tool - {name} - {tool_version}', 'node_description': '[<br>{description}][/Tool Types -> {tool_types}][<br>Aliases -> {aliases}][<br>{kill_chain_phases.[0].kill_chain_name:title}]', 'node_form': 'tool', 'node_family': 'stix-forms', 'python_class': 'Tool'},
+    {'icon': 'url', 'stix_type': 'url', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'url', 'form': 'url', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'URL', 'prior_string0': 'Value -> ', 'post_field0': 'value', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'URL', 'node_heading': 'URL', 'node_description': '<br>Value -> {value}', 'node_form': 'url', 'node_family': 'stix-forms', 'python_class': 'URL'},
+    {'icon': 'oca-user-account', 'stix_type': 'user-account', 'protocol': 'oca', 'group': 'sco', 'typeql': 'oca-user-account', 'form': 'user-account', 'condition1': 'STARTS_WITH', 'field1': '', 'value1': 'x_', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-User-Account', 'prior_string0': 'Name -> ', 'post_field0': 'x_group.name', 'prior_string1': 'ID -> ', 'post_field1': 'user_id', 'prior_string2': 'Display Name -> ', 'post_field2': 'display_name', 'prior_string3': 'Type -> ', 'post_field3': 'account_type', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCAUserAccount'},
+    {'icon': 'user-account', 'stix_type': 'user-account', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'user-account', 'form': 'user-account', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'User-Account', 'prior_string0': 'ID -> ', 'post_field0': 'user_id', 'prior_string1': 'Display Name -> ', 'post_field1': 'display_name', 'prior_string2': 'Type -> ', 'post_field2': 'account_type', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'UserAccount'},
+    {'icon': 'user-account-unix', 'stix_type': 'user-account', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'user-account', 'form': 'user-account', 'condition1': 'EXISTS', 'field1': 'extensions.unix-account-ext', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'User-Account-Unix', 'prior_string0': 'Home Dir -> ', 'post_field0': 'extensions.unix-account-ext.home_dir', 'prior_string1': 'ID -> ', 'post_field1': 'user_id', 'prior_string2': 'Display Name -> ', 'post_field2': 'display_name', 'prior_string3': 'Type -> ', 'post_field3': 'account_type', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'UserAccount'},
+    {'icon': 'vulnerability', 'stix_type': 'vulnerability', 'protocol': 'stix21', 'group': 'sdo', 'typeql': 'vulnerability', 'form': 'vulnerability', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Vulnerability', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': 'Vulnerability', 'node_heading': 'Vulnerability[ -> {name}]', 'node_description': '[<br>{description}][<br>{external_references.[0].kill_chain_name:title}]', 'node_form': 'vulnerability', 'node_family': 'stix-forms', 'python_class': 'Vulnerability'},
+    {'icon': 'oca-windows-registry-key-ext', 'stix_type': 'windows-registry-key', 'protocol': 'oca', 'group': 'sco', 'typeql': 'windows-registry-key', 'form': 'windows-registry-key', 'condition1': 'EXISTS', 'field1': 'extensions.extension-definition--2cf8c8c2-69f5-40f7-aa34-efcef2b912b1', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-Windows-Registry-Key-Extension', 'prior_string0': 'Operation Type -> ', 'post_field0': 'extensions.extension-definition--2cf8c8c2-69f5-40f7-aa34-efcef2b912b1.operation_type', 'prior_string1': 'Key -> ', 'post_field1': 'key', 'prior_string2': 'Name -> ', 'post_field2': 'values.[0].name', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'WindowsRegistryKey'},
+    {'icon': 'windows-registry-key', 'stix_type': 'windows-registry-key', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'windows-registry-key', 'form': 'windows-registry-key', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Windows-Registry-Key', 'prior_string0': 'Key -> ', 'post_field0': 'key', 'prior_string1': 'Name -> ', 'post_field1': 'values.[0].name', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'WindowsRegistryKey'},
+    {'icon': 'x509-certificate', 'stix_type': 'x509-certificate', 'protocol': 'stix21', 'group': 'sco', 'typeql': 'x509-certificate', 'form': 'x509-certificate', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'X509-Certificate', 'prior_string0': 'Issuer ->', 'post_field0': 'issuer', 'prior_string1': 'Policy Constraints', 'post_field1': 'extensions.x509_v3_extensions.policy_contraints', 'prior_string2': 'Name Constraints -> ', 'post_field2': 'extensions.x509_v3_extensions.name_constraints', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'X509Certificate'},
+    {'icon': 'oca-finding', 'stix_type': 'x-ibm-finding', 'protocol': 'oca', 'group': 'sco', 'typeql': 'oca-finding', 'form': 'oca-finding', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-Finding', 'prior_string0': 'Type ->', 'post_field0': 'finding_type', 'prior_string1': 'Name -> ', 'post_field1': 'name', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCAFinding'},
+    {'icon': 'oca-ttp-tagging', 'stix_type': 'x-ibm-ttp-tagging', 'protocol': 'oca', 'group': 'sco', 'typeql': 'oca-tagging', 'form': 'oca-ttp-tagging', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'OCA-TTP-Tagging', 'prior_string0': 'Phase -> ', 'post_field0': 'kill_chain_phases.[0].phase_name', 'prior_string1': 'Technique -> ', 'post_field1': 'extensions.mitre-attack-ext.technique_name', 'prior_string2': 'ID -> ', 'post_field2': 'extensions.mitre-attack-ext.technique_id', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCATagging'},
+    {'icon': 'attack-analytic', 'stix_type': 'x-mitre-analytic', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'attack-analytic', 'form': 'attack-analytic', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': '', 'prior_string0': '', 'post_field0': '', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'AttackAnalytic'},
+    {'icon': 'attack-asset', 'stix_type': 'x-mitre-asset', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'attack-asset', 'form': 'attack-asset', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Asset', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Platform ->', 'post_field1': 'x_mitre_platforms', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'AttackAsset'},
+    {'icon': 'attack-collection', 'stix_type': 'x-mitre-collection', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'collection', 'form': 'attack-collection', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Collection', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Collection'},
+    {'icon': 'attack-data-component', 'stix_type': 'x-mitre-data-component', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'data-component', 'form': 'attack-data-component', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Data-Component', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'DataComponent'},
+    {'icon': 'attack-detection-strategy', 'stix_type': 'x-mitre-detection-strategy', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'detection-strategy', 'form': 'DetectionStrategy', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': '', 'prior_string0': '', 'post_field0': '', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'detection-strategy'},
+    {'icon': 'attack-data-source', 'stix_type': 'x-mitre-data-source', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'data-source', 'form': 'attack-data-source', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Data-Source', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'DataSource'},
+    {'icon': 'atlas-matrix', 'stix_type': 'x-mitre-matrix', 'protocol': 'atlas', 'group': 'sdo', 'typeql': 'matrix', 'form': 'atlas-matrix', 'condition1': 'EQUALS', 'field1': 'external_references.[0].source_name', 'value1': 'mitre-atlas', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Atlas-Matrix', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Atlas ID -> ', 'post_field1': 'external_references.[0].external_id', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Matrix'},
+    {'icon': 'attack-matrix', 'stix_type': 'x-mitre-matrix', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'matrix', 'form': 'attack-matrix', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Matrix', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Matrix'},
+    {'icon': 'atlas-tactic', 'stix_type': 'x-mitre-tactic', 'protocol': 'atlas', 'group': 'sdo', 'typeql': 'tactic', 'form': 'atlas-tactic', 'condition1': 'EQUALS', 'field1': 'external_references.[0].source_name', 'value1': 'mitre-atlas', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Atlas-Tactic', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Atlas ID -> ', 'post_field1': 'external_references.[0].external_id', 'prior_string2': 'Description ->', 'post_field2': 'description', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Tactic'},
+    {'icon': 'attack-tactic', 'stix_type': 'x-mitre-tactic', 'protocol': 'attack', 'group': 'sdo', 'typeql': 'tactic', 'form': 'attack-tactic', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Attack-Tactic', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Tactic'},
+    {'icon': 'oca-asset', 'stix_type': 'x-oca-asset', 'protocol': 'oca', 'group': 'sco', 'typeql': 'oca-asset', 'form': 'oca-asset', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Oca-Asset', 'prior_string0': 'Name -> ', 'post_field0': 'hostname', 'prior_string1': 'Type -> ', 'post_field1': 'host_type', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCAAsset'},
+    {'icon': 'oca-behavior', 'stix_type': 'x-oca-behavior', 'protocol': 'oca', 'group': 'sdo', 'typeql': 'behavior', 'form': 'oca-behavior', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Oca-Behavior', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Behavior'},
+    {'icon': 'oca-detection', 'stix_type': 'x-oca-detection', 'protocol': 'oca', 'group': 'sdo', 'typeql': 'detection', 'form': 'oca-detection', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Oca-Detection', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Analytic Type -> ', 'post_field1': 'analytic.type', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Detection'},
+    {'icon': 'oca-detector', 'stix_type': 'x-oca-detector', 'protocol': 'oca', 'group': 'sdo', 'typeql': 'detector', 'form': 'oca-detector', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Oca-Detector', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Detector'},
+    {'icon': 'oca-event', 'stix_type': 'x-oca-event', 'protocol': 'oca', 'group': 'sco', 'typeql': 'oca-event', 'form': 'oca-event', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Oca-Event', 'prior_string0': 'Action -> ', 'post_field0': 'action', 'prior_string1': '', 'post_field1': '', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCAEvent'},
+    {'icon': 'oca-geo', 'stix_type': 'x-oca-geo', 'protocol': 'oca', 'group': 'sco', 'typeql': 'oca-geo', 'form': 'oca-geo', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Oca-Geo', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Location ->', 'post_field1': 'location', 'prior_string2': 'City ->', 'post_field2': 'city_name', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'OCAGeo'},
+    {'icon': 'oca-playbook', 'stix_type': 'x-oca-playbook', 'protocol': 'oca', 'group': 'sdo', 'typeql': 'playbook', 'form': 'oca-playbook', 'condition1': '', 'field1': '', 'value1': '', 'condition2': '', 'field2': '', 'value2': '', 'head': 'Oca-Playbook', 'prior_string0': 'Name -> ', 'post_field0': 'name', 'prior_string1': 'Description ->', 'post_field1': 'description', 'prior_string2': '', 'post_field2': '', 'prior_string3': '', 'post_field3': '', 'prior_string4': '', 'post_field4': '', 'prior_string5': '', 'post_field5': '', 'prior_string6': '', 'post_field6': '', 'node_name': '', 'node_heading': '', 'node_description': '', 'node_form': '', 'node_family': '', 'python_class': 'Playbook'},
+)
+
+by_type = {
+    'anecdote': (0,),
+    'artifact': (1,),
+    'attack-action': (2,),
+    'attack-asset': (3,),
+    'attack-condition': (4,),
+    'attack-flow': (5,),
+    'attack-operator': (6,),
+    'attack-pattern': (7, 8, 9, 10, 11),
+    'autonomous-system': (12,),
+    'campaign': (13, 14),
+    'course-of-action': (15, 16, 17, 18),
+    'directory': (19,),
+    'domain-name': (20,),
+    'email-addr': (21,),
+    'email-message': (22, 23),
+    'event': (24,),
+    'extension-definition': (25,),
+    'file': (26, 27, 28, 29, 30, 31, 32),
+    'grouping': (33,),
+    'identity': (34, 35, 36, 37, 38, 39, 40, 41, 42),
+    'impact': (43, 44, 45, 46, 47, 48, 49),
+    'incident': (50, 51),
+    'indicator': (52,),
+    'infrastructure': (53,),
+    'intrusion-set': (54, 55),
+    'ipv4-addr': (56,),
+    'ipv6-addr': (57,),
+    'location': (58,),
+    'mac-addr': (59,),
+    'malware': (60, 61, 62, 63),
+    'malware-analysis': (64,),
+    'malware-behavior': (65,),
+    'malware-method': (66,),
+    'malware-objective': (67,),
+    'marking-definition': (68,),
+    'mutex': (69,),
+    'network-traffic': (70, 71, 72, 73, 74, 75, 76, 77),
+    'note': (78,),
+    'observed-data': (79,),
+    'opinion': (80,),
+    'process': (81, 82, 83),
+    'relationship': (84, 85),
+    'report': (86,),
+    'sequence': (87, 88, 89, 90),
+    'sighting': (91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+    'software': (101, 102),
+    'task': (103,),
+    'threat-actor': (104,),
+    'tool': (105, 106, 107),
+    'url': (108,),
+    'user-account': (109, 110, 111),
+    'vulnerability': (112,),
+    'windows-registry-key': (113, 114),
+    'x509-certificate': (115,),
+    'x-ibm-finding': (116,),
+    'x-ibm-ttp-tagging': (117,),
+    'x-mitre-analytic': (118,),
+    'x-mitre-asset': (119,),
+    'x-mitre-collection': (120,),
+    'x-mitre-data-component': (121,),
+    'x-mitre-detection-strategy': (122,),
+    'x-mitre-data-source': (123,),
+    'x-mitre-matrix': (124, 125),
+    'x-mitre-tactic': (126, 127),
+    'x-oca-asset': (128,),
+    'x-oca-behavior': (129,),
+    'x-oca-detection': (130,),
+    'x-oca-detector': (131,),
+    'x-oca-event': (132,),
+    'x-oca-geo': (133,),
+    'x-oca-playbook': (134,),
+}
+
+by_type_protocol = {
+    ('anecdote', 'os-threat'): (0,),
+    ('artifact', 'stix21'): (1,),
+    ('attack-action', 'flow'): (2,),
+    ('attack-asset', 'flow'): (3,),
+    ('attack-condition', 'flow'): (4,),
+    ('attack-flow', 'flow'): (5,),
+    ('attack-operator', 'flow'): (6,),
+    ('attack-pattern', 'atlas'): (7, 8),
+    ('attack-pattern', 'stix21'): (9,),
+    ('attack-pattern', 'attack'): (10, 11),
+    ('autonomous-system', 'stix21'): (12,),
+    ('campaign', 'attack'): (13,),
+    ('campaign', 'stix21'): (14,),
+    ('course-of-action', 'atlas'): (15,),
+    ('course-of-action', 'attack'): (16,),
+    ('course-of-action', 'oca'): (17,),
+    ('course-of-action', 'stix21'): (18,),
+    ('directory', 'stix21'): (19,),
+    ('domain-name', 'stix21'): (20,),
+    ('email-addr', 'stix21'): (21,),
+    ('email-message', 'stix21'): (22, 23),
+    ('event', 'os-threat'): (24,),
+    ('extension-definition', 'stix21'): (25,),
+    ('file', 'stix21'): (26, 27, 28, 29, 30, 31),
+    ('file', 'oca'): (32,),
+    ('grouping', 'stix21'): (33,),
+    ('identity', 'attack'): (34,),
+    ('identity', 'os-threat'): (35, 36),
+    ('identity', 'stix21'): (37, 38, 39, 40, 41, 42),
+    ('impact', 'os-threat'): (43, 44, 45, 46, 47, 48, 49),
+    ('incident', 'os-threat'): (50,),
+    ('incident', 'stix21'): (51,),
+    ('indicator', 'stix21'): (52,),
+    ('infrastructure', 'stix21'): (53,),
+    ('intrusion-set', 'attack'): (54,),
+    ('intrusion-set', 'stix21'): (55,),
+    ('ipv4-addr', 'stix21'): (56,),
+    ('ipv6-addr', 'stix21'): (57,),
+    ('location', 'stix21'): (58,),
+    ('mac-addr', 'stix21'): (59,),
+    ('malware', 'attack'): (60,),
+    ('malware', 'mbc'): (61,),
+    ('malware', 'stix21'): (62, 63),
+    ('malware-analysis', 'stix21'): (64,),
+    ('malware-behavior', 'mbc'): (65,),
+    ('malware-method', 'mbc'): (66,),
+    ('malware-objective', 'mbc'): (67,),
+    ('marking-definition', 'stix21'): (68,),
+    ('mutex', 'stix21'): (69,),
+    ('network-traffic', 'oca'): (70, 71, 72),
+    ('network-traffic', 'stix21'): (73, 74, 75, 76, 77),
+    ('note', 'stix21'): (78,),
+    ('observed-data', 'stix21'): (79,),
+    ('opinion', 'stix21'): (80,),
+    ('process', 'oca'): (81, 82),
+    ('process', 'stix21'): (83,),
+    ('relationship', 'attack'): (84,),
+    ('relationship', 'stix21'): (85,),
+    ('report', 'stix21'): (86,),
+    ('sequence', 'os-threat'): (87, 88, 89, 90),
+    ('sighting', 'os-threat'): (91, 92, 93, 94, 95, 96, 97, 98, 99),
+    ('sighting', 'stix21'): (100,),
+    ('software', 'oca'): (101,),
+    ('software', 'stix21'): (102,),
+    ('task', 'os-threat'): (103,),
+    ('threat-actor', 'stix21'): (104,),
+    ('tool', 'attack'): (105,),
+    ('tool', 'oca'): (106,),
+    ('tool', 'stix21'): (107,),
+    ('url', 'stix21'): (108,),
+    ('user-account', 'oca'): (109,),
+    ('user-account', 'stix21'): (110, 111),
+    ('vulnerability', 'stix21'): (112,),
+    ('windows-registry-key', 'oca'): (113,),
+    ('windows-registry-key', 'stix21'): (114,),
+    ('x509-certificate', 'stix21'): (115,),
+    ('x-ibm-finding', 'oca'): (116,),
+    ('x-ibm-ttp-tagging', 'oca'): (117,),
+    ('x-mitre-analytic', 'attack'): (118,),
+    ('x-mitre-asset', 'attack'): (119,),
+    ('x-mitre-collection', 'attack'): (120,),
+    ('x-mitre-data-component', 'attack'): (121,),
+    ('x-mitre-detection-strategy', 'attack'): (122,),
+    ('x-mitre-data-source', 'attack'): (123,),
+    ('x-mitre-matrix', 'atlas'): (124,),
+    ('x-mitre-matrix', 'attack'): (125,),
+    ('x-mitre-tactic', 'atlas'): (126,),
+    ('x-mitre-tactic', 'attack'): (127,),
+    ('x-oca-asset', 'oca'): (128,),
+    ('x-oca-behavior', 'oca'): (129,),
+    ('x-oca-detection', 'oca'): (130,),
+    ('x-oca-detector', 'oca'): (131,),
+    ('x-oca-event', 'oca'): (132,),
+    ('x-oca-geo', 'oca'): (133,),
+    ('x-oca-playbook', 'oca'): (134,),
+}
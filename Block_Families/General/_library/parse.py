@@ -6,23 +6,30 @@ This module reads the CSV registry containing STIX object metadata including:
 - Python class mapping
 - Condition testing fields (condition1/2, field1/2, value1/2)
 - Display formatting fields (icon, form, head, prior_string/post_field pairs)
+- Node rendering templates (node_name, node_heading, node_description, node_form, node_family)
 """
 
 from pydantic import BaseModel
-from typing import List, Dict, Union, Optional
+from types import MappingProxyType
+from typing import List, Dict, Union, Optional, Mapping, Callable, Iterable
 import logging
-import copy
 import csv
+import hashlib
+import importlib.util
 import os
 
 
 logger = logging.getLogger(__name__)
 
+# The registry index, built by registry_index() from icon_registry.csv, and the file stamp it was built from
+_registry_index = None
+_registry_stamp = None
+
 
 class ParseContent(BaseModel):
 	"""
 	ParseContent is a Pydantic model that represents the ORM content used for parsing.
-	Reads from icon_registry.csv with 27 columns including display formatting fields.
+	Reads from icon_registry.csv with 33 columns including display formatting fields.
 	"""
 	# Core identification fields
 	stix_type: str
@@ -60,22 +67,138 @@ class ParseContent(BaseModel):
 	prior_string6: Optional[str] = ""
 	post_field6: Optional[str] = ""
 
+	# Node rendering templates, compiled by convert_n_and_e for the rows that have a node_name
+	node_name: Optional[str] = ""
+	node_heading: Optional[str] = ""
+	node_description: Optional[str] = ""
+	node_form: Optional[str] = ""
+	node_family: Optional[str] = ""
+
 	def __str__(self):
 		return f"ParseContent(stix_type={self.stix_type}, protocol={self.protocol}, group={self.group}, python_class={self.python_class}, typeql={self.typeql}, condition1={self.condition1}, field1={self.field1}, value1={self.value1}, condition2={self.condition2}, field2={self.field2}, value2={self.value2})"
-	
+
+	@property
+	def field_list1(self):
+		return tuple(self.field1.split("."))
+
+	@property
+	def field_list2(self):
+		return tuple(self.field2.split("."))
+
+
+# The registry columns, in ParseContent order
+registry_fields = tuple(ParseContent.model_fields)
+
+
+class RegistryRecord:
+    """
+    An immutable registry row, with the ParseContent fields, for the lookups.
+
+    The rows are validated as ParseContent when the registry is loaded, so a record is made without validation,
+    and has its condition field paths split once, as field_list1 and field_list2.
+    """
+    __slots__ = registry_fields + ("field_list1", "field_list2")
+
+    def __init__(self, row: Mapping):
+        for name in registry_fields:
+            object.__setattr__(self, name, row.get(name, ""))
+        object.__setattr__(self, "field_list1", tuple((self.field1 or "").split(".")))
+        object.__setattr__(self, "field_list2", tuple((self.field2 or "").split(".")))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"RegistryRecord is read-only, cannot set {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"RegistryRecord is read-only, cannot delete {name}")
+
+    def __eq__(self, other):
+        if not isinstance(other, RegistryRecord):
+            return NotImplemented
+        return self.values() == other.values()
+
+    def __hash__(self):
+        return hash(self.values())
+
+    def __reduce__(self):
+        return RegistryRecord, (self.as_dict(),)
+
+    def values(self) -> tuple:
+        return tuple(getattr(self, name) for name in registry_fields)
+
+    def as_dict(self) -> Dict[str, str]:
+        return dict(zip(registry_fields, self.values()))
+
+    def to_content(self) -> ParseContent:
+        """Return the record as a validated ParseContent model."""
+        return ParseContent(**self.as_dict())
+
+    def __str__(self):
+        # printed as the ParseContent it stands for
+        return f"ParseContent(stix_type={self.stix_type}, protocol={self.protocol}, group={self.group}, python_class={self.python_class}, typeql={self.typeql}, condition1={self.condition1}, field1={self.field1}, value1={self.value1}, condition2={self.condition2}, field2={self.field2}, value2={self.value2})"
+
+    def __repr__(self):
+        return "RegistryRecord(" + ", ".join(f"{name}={getattr(self, name)!r}" for name in registry_fields) + ")"
+
+
+class RegistryGroup:
+    """
+    The registry records of one stix_type, or (stix_type, protocol), grouped for classification.
+
+    Attributes:
+        records: the records, in registry order.
+        default: the records with no condition.
+        specialisation: the records with a condition, in the order they are tested.
+        matchers: tuple of (matcher, record) for the specialisations, see compile_condition().
+            A single record is always the result, so it has no specialisations to test.
+        fallback: the record when no specialisation matches, the first default,
+            or worst case the first in the specialisation list.
+    """
+    __slots__ = ("records", "default", "specialisation", "matchers", "fallback")
+
+    def __init__(self, records):
+        records = tuple(records)
+        default = tuple(item for item in records if item.condition1 == "")
+        specialisation = tuple(item for item in records if item.condition1 != "")
+        object.__setattr__(self, "records", records)
+        object.__setattr__(self, "default", default)
+        object.__setattr__(self, "specialisation", specialisation)
+        if len(records) == 1:
+            object.__setattr__(self, "matchers", ())
+            object.__setattr__(self, "fallback", records[0])
+        else:
+            object.__setattr__(self, "matchers", tuple((compile_condition(item), item) for item in specialisation))
+            object.__setattr__(self, "fallback", default[0] if default else specialisation[0])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"RegistryGroup is read-only, cannot set {name}")
+
+
+def registry_path() -> str:
+    """Return the path of icon_registry.csv, in the same directory as this module."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon_registry.csv")
+
 
 def read_icon_registry() -> List[Dict]:
     """
     Read icon_registry.csv from the same directory as this module.
+
+    The rows come from the registry index, so the file is only parsed again when it changes.
+    
+    Returns:
+        List[Dict]: List of dictionaries with registry data, or empty list if file not found.
+    """
+    return [dict(row) for row in registry_index()["rows"]]
+
+
+def load_icon_registry() -> List[Dict]:
+    """
+    Parse icon_registry.csv, trying each encoding in turn.
     
     Returns:
         List[Dict]: List of dictionaries with registry data, or empty list if file not found.
     """
     try:
-        # Get the directory of the current file
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Construct the path to the icon_registry.csv file
-        file_path = os.path.join(current_dir, "icon_registry.csv")
+        file_path = registry_path()
         
         if not os.path.exists(file_path):
             logger.error(f"icon_registry.csv file not found at {file_path}")
@@ -112,6 +235,177 @@ def read_icon_registry() -> List[Dict]:
         return []
 
 
+class RegistryTable(Mapping):
+    """A read-only table of the registry index, making the value of a key from its row numbers on first lookup."""
+
+    def __init__(self, rows_by_key, make):
+        self._rows_by_key = rows_by_key
+        self._make = make
+        self._values = {}
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            self._values[key] = self._make(self._rows_by_key[key])
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._rows_by_key)
+
+    def __len__(self):
+        return len(self._rows_by_key)
+
+
+def registry_tables(rows: List[Dict]):
+    """
+    Find the row numbers of each stix_type, and of each (stix_type, protocol), skipping rows that are not a valid ParseContent.
+
+    Returns:
+        Tuple[Dict, Dict, List]: The row numbers by stix_type, and by (stix_type, protocol), in registry order,
+            and the RegistryRecord of each row, or None for an invalid row.
+    """
+    by_type = {}
+    by_type_protocol = {}
+    contents = []
+    for row_number, item in enumerate(rows):
+        try:
+            content = ParseContent(**item)
+        except Exception as e:
+            logger.error(f"Error creating ParseContent from item {item}: {e}")
+            contents.append(None)
+            continue
+        contents.append(RegistryRecord(item))
+        by_type.setdefault(content.stix_type, []).append(row_number)
+        by_type_protocol.setdefault((content.stix_type, content.protocol), []).append(row_number)
+    by_type = {key: tuple(value) for key, value in by_type.items()}
+    by_type_protocol = {key: tuple(value) for key, value in by_type_protocol.items()}
+    return by_type, by_type_protocol, contents
+
+
+def build_registry_index(rows: List[Dict], tables=None) -> Mapping[str, Mapping]:
+    """
+    Build the registry index from the registry rows, making the RegistryRecord of each row once.
+
+    Args:
+        rows (Sequence[Dict]): The registry rows, as read by load_icon_registry().
+        tables (Tuple[Dict, Dict]): The row numbers by stix_type and by (stix_type, protocol), as found by
+            registry_tables() when the registry snapshot was written. The rows were validated then, so are not
+            validated again, and the records of a type are only made when the type is first looked up.
+
+    Returns:
+        Mapping[str, Mapping]: The index,
+            "rows": tuple of the registry rows,
+            "by_type": stix_type -> tuple of RegistryRecord, in registry order,
+            "by_type_protocol": (stix_type, protocol) -> tuple of RegistryRecord, in registry order,
+            "groups": stix_type -> RegistryGroup of its records.
+    """
+    if tables is None:
+        by_type, by_type_protocol, contents = registry_tables(rows)
+    else:
+        by_type, by_type_protocol = tables
+        contents = [None] * len(rows)
+
+    def contents_of(row_numbers):
+        # each row's record is made once, and shared by every table
+        for row_number in row_numbers:
+            if contents[row_number] is None:
+                contents[row_number] = RegistryRecord(rows[row_number])
+        return tuple(contents[row_number] for row_number in row_numbers)
+
+    return MappingProxyType({
+        "rows": tuple(MappingProxyType(row) for row in rows),
+        "by_type": RegistryTable(by_type, contents_of),
+        "by_type_protocol": RegistryTable(by_type_protocol, contents_of),
+        "groups": RegistryTable(by_type, lambda row_numbers: RegistryGroup(contents_of(row_numbers))),
+    })
+
+
+def snapshot_path() -> str:
+    """Return the path of the registry snapshot module, generated next to icon_registry.csv."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon_registry_snapshot.py")
+
+
+def registry_digest() -> Optional[str]:
+    # The sha256 of icon_registry.csv, which a snapshot must have been written from to be used
+    try:
+        with open(registry_path(), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def write_registry_snapshot() -> str:
+    """
+    Compile icon_registry.csv into the registry snapshot module, with the rows and their lookup tables as literals.
+
+    Run this, e.g. python parse.py, whenever icon_registry.csv is edited. Until then the
+    snapshot no longer matches the registry, so it is ignored and the registry is parsed.
+
+    Returns:
+        str: The path of the snapshot module.
+    """
+    digest = registry_digest()
+    rows = load_icon_registry()
+    by_type, by_type_protocol, _ = registry_tables(rows)
+    lines = ["# Generated from icon_registry.csv by parse.write_registry_snapshot(), do not edit", "",
+             f"registry_sha256 = {digest!r}", "", "rows = ("]
+    lines += [f"    {row!r}," for row in rows]
+    lines += [")", "", "by_type = {"]
+    lines += [f"    {key!r}: {value!r}," for key, value in by_type.items()]
+    lines += ["}", "", "by_type_protocol = {"]
+    lines += [f"    {key!r}: {value!r}," for key, value in by_type_protocol.items()]
+    lines += ["}", ""]
+    path = snapshot_path()
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def load_registry_snapshot(digest: Optional[str]):
+    """
+    Import the registry snapshot module, if it was written from the registry with this sha256.
+
+    Returns:
+        module: The snapshot, or None if it is missing, unreadable or stale.
+    """
+    path = snapshot_path()
+    if digest is None or not os.path.exists(path):
+        return None
+    try:
+        spec = importlib.util.spec_from_file_location("icon_registry_snapshot", path)
+        snapshot = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(snapshot)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable registry snapshot {path}: {e}")
+        return None
+    if getattr(snapshot, "registry_sha256", None) != digest:
+        logger.debug(f"Ignoring registry snapshot {path}, icon_registry.csv has changed since it was written")
+        return None
+    return snapshot
+
+
+def load_registry_index() -> Mapping[str, Mapping]:
+    # Prefer the snapshot, when it was written from the registry as it is now, else parse the registry
+    snapshot = load_registry_snapshot(registry_digest())
+    if snapshot is None:
+        return build_registry_index(load_icon_registry())
+    return build_registry_index(snapshot.rows, (snapshot.by_type, snapshot.by_type_protocol))
+
+
+def registry_index() -> Mapping[str, Mapping]:
+    """Return the registry index, building it on first use, and again whenever icon_registry.csv changes."""
+    global _registry_index, _registry_stamp
+    try:
+        stat = os.stat(registry_path())
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+    if _registry_index is None or stamp != _registry_stamp:
+        _registry_index = load_registry_index()
+        _registry_stamp = stamp
+    return _registry_index
+
+
 
 
 ###################################################################################
@@ -120,38 +414,26 @@ def read_icon_registry() -> List[Dict]:
 #
 ###################################################################################
 
-def get_content_list_for_type(type: str, content_type: str) -> List[ParseContent]:
+def get_content_list_for_type(type: str, content_type: str) -> List[RegistryRecord]:
     """
-    Get the list of ParseContent models for a specific type from the class registry.
+    Get the list of registry records for a specific type from the class registry.
     
     Args:
         type (str): The STIX type to filter by.
         content_type (str): The type of content to retrieve ("class" is currently supported).
     
     Returns:
-        List[ParseContent]: List of ParseContent models matching the type, or empty list if none found.
+        List[RegistryRecord]: List of records matching the type, or empty list if none found.
     """
     if content_type != "class":
         logger.warning(f"Content type '{content_type}' is not supported. Only 'class' is currently supported.")
         return []
     
     try:
-        # Read the icon registry data
-        registry_data = read_icon_registry()
-        
-        # Filter by the specified type and convert to ParseContent models
-        filtered_data = [item for item in registry_data if item.get("stix_type") == type]
+        # The records of the type, made once when the registry was indexed
+        parse_content_list = list(registry_index()["by_type"].get(type, ()))
         
-        # Convert dictionaries to ParseContent models
-        parse_content_list = []
-        for item in filtered_data:
-            try:
-                parse_content_list.append(ParseContent(**item))
-            except Exception as e:
-                logger.error(f"Error creating ParseContent from item {item}: {e}")
-                continue
-        
-        logger.debug(f"Found {len(parse_content_list)} ParseContent entries for type '{type}'")
+        logger.debug(f"Found {len(parse_content_list)} registry entries for type '{type}'")
         return parse_content_list
         
     except Exception as e:
@@ -169,7 +451,7 @@ def process_exists_condition(stix_dict, field_list):
     Returns:
         bool: True if all fields exist in the STIX dictionary, False otherwise.
     """
-    local_dict = copy.deepcopy(stix_dict)
+    local_dict = stix_dict
     correct = False
     length = len(field_list)
     for i, field in enumerate(field_list):
@@ -200,7 +482,7 @@ def process_starts_with_condition(stix_dict, value):
         bool: True if it is not an attack object, and any field starts with the given value, False otherwise.
     """
     correct = False
-    local_dict = copy.deepcopy(stix_dict)
+    local_dict = stix_dict
     if "x_mitre_attack_spec_version" in local_dict:
         return correct
     for field_name, field_value in local_dict.items():
@@ -221,7 +503,7 @@ def process_equals_condition(stix_dict, field_list, value):
     Returns:
         bool: True if the field exists and it equals the value, False otherwise.
     """
-    local_dict = copy.deepcopy(stix_dict)
+    local_dict = stix_dict
     correct = False
     length = len(field_list)
     for i, field in enumerate(field_list):
@@ -235,35 +517,59 @@ def process_equals_condition(stix_dict, field_list, value):
                 local_dict = local_dict[field]
     return correct
 
-def test_object_by_condition(item: ParseContent, stix_dict: Dict[str, str]) -> bool:
+def test_object_by_condition(item: Union[RegistryRecord, ParseContent], stix_dict: Dict[str, str]) -> bool:
     """
-    Test the ParseContent condition against the STIX dictionary .
+    Test the registry record condition against the STIX dictionary .
 
     Args:
-        item (ParseContent): The ParseContent condition to test.
+        item (RegistryRecord): The record, or ParseContent, condition to test.
         stix_dict (Dict[str, str]): The STIX dictionary to match against.
 
     Returns:
         bool: True if the dict matches the conditions, False otherwise.
     """
-    correct = False
-    # Check each condition in the STIX dictionary
+    return compile_condition(item)(stix_dict)
+
+def compile_condition(item: Union[RegistryRecord, ParseContent]) -> Callable[[Dict], bool]:
+    """
+    Compile the conditions of a registry record into a matcher, using its split field paths.
+
+    Args:
+        item (RegistryRecord): The record, or ParseContent, whose conditions are compiled.
+
+    Returns:
+        Callable[[Dict], bool]: Returns True if a STIX dictionary matches the conditions, without copying it.
+    """
     if item.condition1 == "EXISTS":
-        field_list = item.field1.split(".")
-        correct = process_exists_condition(stix_dict, field_list)
+        field_list1 = item.field_list1
+        first = lambda stix_dict: process_exists_condition(stix_dict, field_list1)
     elif item.condition1 == "STARTS_WITH":
-        correct = process_starts_with_condition(stix_dict, item.value1)
+        value1 = item.value1
+        first = lambda stix_dict: process_starts_with_condition(stix_dict, value1)
     elif item.condition1 == "EQUALS":
-        field_list = item.field1.split(".")
-        correct = process_equals_condition(stix_dict, field_list, item.value1)
-    # Check the second condition if it exists
-    if item.condition2 and correct:
-        if item.condition2 == "EQUALS":
-            field_list = item.field2.split(".")
-            correct = process_equals_condition(stix_dict, field_list, item.value2)
-    return correct
+        field_list1 = item.field_list1
+        value1 = item.value1
+        first = lambda stix_dict: process_equals_condition(stix_dict, field_list1, value1)
+    else:
+        return lambda stix_dict: False
+    # Only an EQUALS second condition is tested, any other leaves the first condition's result
+    if item.condition2 != "EQUALS":
+        return first
+    field_list2 = item.field_list2
+    value2 = item.value2
+    return lambda stix_dict: first(stix_dict) and process_equals_condition(stix_dict, field_list2, value2)
+
+def classify(groups, stix_dict: Dict[str, str]) -> Optional[RegistryRecord]:
+    # Test the compiled specialisations of the object's type in order, else take the fallback
+    group = groups.get(stix_dict.get("type"))
+    if group is None:
+        return None
+    for matcher, item in group.matchers:
+        if matcher(stix_dict):
+            return item
+    return group.fallback
 
-def determine_content_object_from_list_by_tests(stix_dict: Dict[str, str], content_type:str) -> ParseContent:
+def determine_content_object_from_list_by_tests(stix_dict: Dict[str, str], content_type:str) -> RegistryRecord:
     """
     Determine the content object from the list by matching the STIX dictionary.
 
@@ -272,26 +578,30 @@ def determine_content_object_from_list_by_tests(stix_dict: Dict[str, str], conte
         content_type (str): The type of content to match against "class" or "icon".
 
     Returns:
-        ParseContent: The matching ParseContent object, or None if not found.
+        RegistryRecord: The matching registry record, or None if not found.
     """
-    content_list: List[ParseContent] = get_content_list_for_type(stix_dict.get("type"), content_type)
-    if not content_list:
+    if content_type != "class":
+        # only "class" content is supported, get_content_list_for_type() logs the warning
+        get_content_list_for_type(stix_dict.get("type"), content_type)
         return None
-    elif len(content_list) == 1:
-        return content_list[0]
-    else:
-        correct = False
-        # Split the list
-        default = [item for item in content_list if item.condition1 == ""]
-        specialisation = [item for item in content_list if item.condition1 != ""]
-        # First check the specialisation list for test matches
-        for item in specialisation:
-            correct = test_object_by_condition(item, stix_dict)
-            if correct:
-                return item
-
-        # Else return the default, or worst case the first in the specialisation list
-        return default[0] if default else specialisation[0]
+    # First check the specialisation list for test matches, else return the default
+    return classify(registry_index()["groups"], stix_dict)
+
+def classify_objects(stix_dicts: Iterable[Dict[str, str]], content_type: str = "class") -> List[Optional[RegistryRecord]]:
+    """
+    Determine the content object of each STIX dictionary, as determine_content_object_from_list_by_tests() does.
+
+    Args:
+        stix_dicts (Iterable[Dict[str, str]]): The STIX dictionaries to match.
+        content_type (str): The type of content to match against, only "class" is supported.
+
+    Returns:
+        List[Optional[RegistryRecord]]: The matching record of each dictionary, or None if not found.
+    """
+    if content_type != "class":
+        return [determine_content_object_from_list_by_tests(stix_dict, content_type) for stix_dict in stix_dicts]
+    groups = registry_index()["groups"]
+    return [classify(groups, stix_dict) for stix_dict in stix_dicts]
     
 
 ###################################################################################################
@@ -306,23 +616,16 @@ def get_tqlname_from_type_and_protocol(stix_type, protocol=None) -> Union[str, N
 
     Args:
         stix_type (str): The type of the object.
-        protocol (str): The protocol to use.
+        protocol (str): The protocol to use. The default row of the type is used whatever the protocol.
 
     Returns:
         tql_name (str): The TypeQL name of the object.
     """
-    content_list: List[ParseContent] = get_content_list_for_type(stix_type, "class")
-    if not content_list:
+    group = registry_index()["groups"].get(stix_type)
+    if group is None:
         return None
-    elif len(content_list) == 1:
-        content = content_list[0]
-        return content.typeql
-    else:
-        # find the default option, with the empty condition
-        for item in content_list:
-            if item.condition1 == "":
-                return item.typeql
-    return content_list[0].typeql
+    # the single option, else the default option, with the empty condition
+    return group.fallback.typeql
 
 def get_group_from_type(stix_type) -> Union[str, None]:
     """
@@ -334,15 +637,12 @@ def get_group_from_type(stix_type) -> Union[str, None]:
     Returns:
         group (str): The Stix group of the object.
     """
-    content_list: List[ParseContent] = get_content_list_for_type(stix_type, "class")
-    if not content_list:
+    group = registry_index()["groups"].get(stix_type)
+    if group is None:
         return None
-    elif len(content_list) == 1:
-        content = content_list[0]
-        return content.group
-    else:
-        # find the default option, with the empty condition
-        for item in content_list:
-            if item.condition1 == "":
-                return item.group
-    return content_list[0].group
\ No newline at end of file
+    # the single option, else the default option, with the empty condition
+    return group.fallback.group
+
+
+if __name__ == "__main__":
+    print(write_registry_snapshot())
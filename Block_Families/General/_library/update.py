@@ -14,7 +14,7 @@ from stixorm.module.authorise import import_type_factory
 from stixorm.module.typedb_lib.factories.mappings_factory import get_mapping_factory_instance
 from stixorm.module.typedb_lib.instructions import ResultStatus, Result
 from stixorm.module.parsing import parse_objects
-from deepdiff import DeepDiff, parse_path
+from deepdiff import parse_path
 from Block_Families.General._library.update_utilities import follow_pathway
 from stixorm.module.definitions.property_definitions import is_stix_type, _check_uuid
 from pprint import pprint
@@ -41,6 +41,7 @@ logger.setLevel(logging.INFO)
 import json
 import os
 import copy
+import hashlib
 
 connection = {
     "uri": "localhost",
@@ -51,29 +52,195 @@ connection = {
 }
 
 
+# The list of objects properties, and the sub-object properties that identify an object in two versions of the list
+list_object_keys = {
+    "external_references": ("source_name", "external_id"),
+    "kill_chain_phases": ("kill_chain_name", "phase_name"),
+    "alternate_data_streams": ("name",),
+    "sections": ("name",),
+    "values": ("name",),
+    "x_mitre_contents": ("object_ref",),
+    "contents": ("object_ref",),
+    "changed_objects": ("initial_ref", "result_ref"),
+    "contact_numbers": ("contact_number_type",),
+    "email_addresses": ("email_address_ref",),
+    "social_media_accounts": ("user_account_ref",),
+    "scores": ("name",),
+}
+
+
+def diff_path(path, key):
+    return path + "[" + repr(key) + "]"
+
+
+def freeze_value(value):
+    # A hashable form of a value, which ignores list order and repetition, as the object diff does
+    if isinstance(value, dict):
+        return "dict", frozenset((key, freeze_value(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return "list", frozenset(freeze_value(item) for item in value)
+    return type(value), value
+
+
+def list_object_key(prop, item):
+    # The identifying values of a sub-object in a list of objects, or None if it cannot be matched by key
+    keys = list_object_keys.get(prop)
+    if keys is None or not isinstance(item, dict):
+        return None
+    key = tuple(freeze_value(item.get(name)) for name in keys)
+    if all(item.get(name) is None for name in keys):
+        return None
+    return key
+
+
+def diff_stix_lists(old, new, path, new_path, report, prop):
+    """
+    Compare two versions of a list property, ignoring order and repetition.
+
+    A list of values, e.g. the *_refs, is compared as a set, so its changes are items removed and added. In a
+    list of objects the unchanged objects are matched first, then the rest are matched by list_object_keys,
+    and the properties of each matched pair are compared.
+    """
+    # values are frozen with their type, so 1, True and 1.0 differ, as they do in DeepDiff
+    frozen_old = [freeze_value(item) for item in old]
+    frozen_new = [freeze_value(item) for item in new]
+    old_set = set(frozen_old)
+    new_set = set(frozen_new)
+    unmatched_old = {}
+    removed = []
+    paired = set()
+    seen = set()
+    for index, frozen in enumerate(frozen_old):
+        if frozen not in new_set and frozen not in seen:
+            seen.add(frozen)
+            removed.append(index)
+            unmatched_old.setdefault(list_object_key(prop, old[index]), []).append(index)
+    unmatched_old.pop(None, None)
+    seen = set()
+    for index, frozen in enumerate(frozen_new):
+        if frozen in old_set or frozen in seen:
+            continue
+        seen.add(frozen)
+        candidates = unmatched_old.get(list_object_key(prop, new[index]))
+        if candidates:
+            old_index = candidates.pop(0)
+            paired.add(old_index)
+            diff_stix_values(old[old_index], new[index], diff_path(path, old_index), diff_path(new_path, index), report)
+        else:
+            report.setdefault("iterable_item_added", {})[diff_path(new_path, index)] = new[index]
+    for index in removed:
+        if index in paired:
+            continue
+        report.setdefault("iterable_item_removed", {})[diff_path(path, index)] = old[index]
+
+
+def diff_stix_values(old, new, path, new_path, report, prop=None):
+    # Compare two versions of a value, adding the differences to the report, by DeepDiff report type
+    if type(old) is not type(new):
+        change = {"old_type": type(old).__name__, "new_type": type(new).__name__, "old_value": old, "new_value": new}
+        if new_path != path:
+            change["new_path"] = new_path
+        report.setdefault("type_changes", {})[path] = change
+    elif isinstance(old, dict):
+        for key, value in old.items():
+            if key in new:
+                diff_stix_values(value, new[key], diff_path(path, key), diff_path(new_path, key), report, key)
+            else:
+                report.setdefault("dictionary_item_removed", {})[diff_path(path, key)] = value
+        for key, value in new.items():
+            if key not in old:
+                report.setdefault("dictionary_item_added", {})[diff_path(path, key)] = value
+    elif isinstance(old, list):
+        diff_stix_lists(old, new, path, new_path, report, prop)
+    elif old != new:
+        change = {"new_value": new, "old_value": old}
+        if new_path != path:
+            change["new_path"] = new_path
+        report.setdefault("values_changed", {})[path] = change
+
+
+def diff_stix_objects(original_object, changed_object):
+    """
+    Compare two versions of a STIX object, in the shape of DeepDiff(verbose_level=2, ignore_order=True).
+
+    Scalar properties are compared directly, lists of values such as the *_refs are compared as sets, and
+    lists of objects are matched by the keys in list_object_keys. Unlike DeepDiff, a changed value in a
+    list is always reported as an item removed and an item added, never as a values_changed.
+
+    Returns:
+        Dict[str, Dict]: path -> difference, by report type, "dictionary_item_added", "dictionary_item_removed",
+            "values_changed", "type_changes", "iterable_item_added" and "iterable_item_removed". Empty if the
+            objects are the same.
+    """
+    report = {}
+    diff_stix_values(original_object, changed_object, "root", "root", report)
+    return report
+
+
 def find_obj_diff(original_object, changed_incident_obj):
-    verbose_level = 2
-    ignore_order = True
-    group_by = 'id'
-    diff = DeepDiff(original_object, changed_incident_obj, verbose_level=verbose_level, ignore_order=ignore_order)
+    diff_json = diff_stix_objects(original_object, changed_incident_obj)
     diff_local_path = "DeepDiff_object_output.json"
-    diff_json = json.loads(diff.to_json())
     with open(diff_local_path, 'w') as f:
         f.write(json.dumps(diff_json))
     return diff_json
 
 
+def content_hash(stix_object):
+    """
+    Hash the content of a STIX object, as the sha256 of its sorted-key JSON.
+
+    Every property is hashed, modified too, so two versions of an object with the same hash are the same,
+    and need not be diffed, while an object whose only change is its modified time is still pushed.
+    """
+    text = json.dumps(stix_object, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def content_hashes(stix_list):
+    # The content hash of each id, of its first object, as the list diff matches them
+    return {stix_id: content_hash(stix_object) for stix_id, stix_object in index_by_id(stix_list).items()}
+
+
+def index_by_id(stix_list):
+    # The first object of each id, in list order
+    by_id = {}
+    for stix_object in stix_list:
+        by_id.setdefault(stix_object["id"], stix_object)
+    return by_id
+
+
+def plan_list_diff(original_list, changed_list, original_hashes=None):
+    """
+    Plan the sync of two versions of an object list, matching the objects by id, in one pass over each list.
+
+    Args:
+        original_list (List[Dict]): The objects as last synced.
+        changed_list (List[Dict]): The objects now.
+        original_hashes (Dict[str, str]): The content hash of each original object, as saved when it was synced.
+            If given, an object whose content hash is unchanged is not paired, so it is not diffed.
+
+    Returns:
+        Tuple[List, List, List]: The ids of the original objects that have been deleted, the changed objects
+            that have been added, and a (original object, changed object) pair for each object that may have changed.
+    """
+    original_by_id = index_by_id(original_list)
+    changed_ids = {x["id"] for x in changed_list}
+    delete_object_ids = [stix_id for stix_id in original_by_id if stix_id not in changed_ids]
+    add_objects_list = []
+    may_have_changed_pairs = []
+    for changed_object in changed_list:
+        original_object = original_by_id.get(changed_object["id"])
+        if original_object is None:
+            add_objects_list.append(changed_object)
+        elif original_hashes is None or original_hashes.get(changed_object["id"]) != content_hash(changed_object):
+            may_have_changed_pairs.append((original_object, changed_object))
+    return delete_object_ids, add_objects_list, may_have_changed_pairs
+
+
 def find_list_diff(original_list, changed_list):
-    original_id_list = [x["id"] for x in original_list]
-    changed_id_list = [x["id"] for x in changed_list]
-    set_original_id  = set(original_id_list)
-    set_changed_id = set(changed_id_list)
-    delete_object_ids = set_original_id - set_changed_id
-    add_object_ids = set_changed_id - set_original_id
-    add_objects_list = [x for x in changed_list if x["id"] in list(add_object_ids)]
-    obj_ids_that_may_have_changed = set_original_id & set_changed_id
-    may_have_changed_list = [x for x in changed_list if x["id"] in list(obj_ids_that_may_have_changed)]
-    return list(delete_object_ids), list(add_objects_list), list(may_have_changed_list)
+    delete_object_ids, add_objects_list, may_have_changed_pairs = plan_list_diff(original_list, changed_list)
+    may_have_changed_list = [changed_object for _, changed_object in may_have_changed_pairs]
+    return delete_object_ids, add_objects_list, may_have_changed_list
 
 
 def stix_to_tql_basis(stix_dict, import_type):
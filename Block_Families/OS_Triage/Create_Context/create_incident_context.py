@@ -37,7 +37,6 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 # from Block_Families.General._library.
 # from Orchestration.Common.
 from urllib.request import urlretrieve
@@ -48,12 +47,13 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
-
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"},
+    {"module": "icon_registry", "file": "icon_registry.csv", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/icon_registry.csv"}
 ]
 
 # OS_Triage Memory Stuff
@@ -105,11 +105,26 @@ key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 def download_common(module_list):
     for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
         # Step 1: download the module
         result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
         print(f'common file result ->', result)
         # Step 2: install the module
 
+
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
+
+
 def create_context_map(c_map_file):
     local_map = {}
     local_map["current_incident"] = ""
@@ -119,43 +134,6 @@ def create_context_map(c_map_file):
     with open(TR_Context_Memory_Dir + "/" + c_map_file, 'w') as f:
         f.write(json.dumps(local_map))
 
-def add_node(node, context_dir):
-    exists = False
-    stix_nodes_list = []
-    if  os.path.exists(context_dir + incident_data["incident"]):
-        with open(context_dir + incident_data["incident"], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                if stix_nodes_list[i]["id"] == node["id"]:
-                    stix_nodes_list[i] = node
-                    exists = True
-            if not exists:
-                stix_nodes_list.append(node)
-    else:
-        stix_nodes_list = [node]
-
-    with open(context_dir + incident_data["incident"], 'w') as f:
-            f.write(json.dumps(stix_nodes_list))
-
-
-def add_edge(edge, context_dir):
-    exists = False
-    stix_edge_list = []
-    if os.path.exists(context_dir + incident_data["edges"]):
-        with open(context_dir + incident_data["edges"], "r") as mem_input:
-            stix_edge_list = json.load(mem_input)
-            for i in range(len(stix_edge_list)):
-                if stix_edge_list[i]["source"] == edge["source"] and stix_edge_list[i]["target"] == edge["target"]:
-                    stix_edge_list[i] = edge
-                    exists = True
-            if not exists:
-                stix_edge_list.append(edge)
-    else:
-        stix_edge_list = [edge]
-
-    with open(context_dir + incident_data["edges"], 'w') as f:
-            f.write(json.dumps(stix_edge_list))
-
 
 def create_incident_context(stix_object):
     if stix_object["type"] != "incident":
@@ -168,7 +146,7 @@ def create_incident_context(stix_object):
     # 2. Check if the key directories exist, if not make them, and download common files
     if not os.path.exists(TR_Common_Files):
         os.makedirs(TR_Common_Files)
-        download_common(common)
+    download_common(common)
     if not os.path.exists(TR_Context_Memory_Dir):
         os.makedirs(TR_Context_Memory_Dir)
         create_context_map(context_map)
@@ -180,14 +158,8 @@ def create_incident_context(stix_object):
         os.makedirs(TR_Incident_Dir)
 
     # 3. Now we are sure the common files exist, we need to import them
-    # Specify the path to the Nodes and Edges module
-    module_path = TR_Common_Files + '/' + common[0]["file"]
-    # Load the module spec using importlib.util.spec_from_file_location
-    spec = importlib.util.spec_from_file_location('n_and_e', module_path)
-    # Create the module from the specification
-    n_and_e = importlib.util.module_from_spec(spec)
-    # Load the module
-    spec.loader.exec_module(n_and_e)
+    n_and_e = import_common(common[0])
+    context_store = import_common(common[1])
     # 4. Get the Nodes and Edges, and save them to the lists
     nodes, edges = n_and_e.convert_node(stix_object)
     # 5. Get the Current Incident Directory in the map, update it and then save it
@@ -199,9 +171,9 @@ def create_incident_context(stix_object):
     with open(TR_Context_Memory_Dir + "/" + context_map, 'w') as f:
         f.write(json.dumps(local_map))
     # 6. Add the node and edges
-    add_node(nodes[0], TR_Incident_Dir)
-    for edge in edges:
-        add_edge(edge, TR_Incident_Dir)
+    with context_store.open_context_store(TR_Incident_Dir, incident_data) as store:
+        store.add_node(nodes[0], "incident")
+        store.add_edges(edges, "edges")
 
     return " incident context created -> " + str(stix_id) + "\nstix_id -> " + str(stix_object["id"])
 
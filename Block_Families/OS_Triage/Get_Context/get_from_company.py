@@ -41,17 +41,9 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.definitions.os_threat import (
-    StateChangeObject, EventCoreExt, Event, ImpactCoreExt,
-    Availability, Confidentiality, External, Integrity, Monetary, Physical,
-    Traceability, Impact, IncidentScoreObject, IncidentCoreExt, TaskCoreExt,
-    Task, SightingEvidence, Sequence, SequenceExt, ContactNumber, EmailContact,
-    SocialMediaContact, IdentityContact, AnecdoteExt, Anecdote,
-    SightingAnecdote, SightingAlert, SightingContext, SightingExclusion,
-    SightingEnrichment, SightingHunt, SightingFramework, SightingExternal
-)
-from stixorm.module.authorise import import_type_factory
 from posixpath import basename
+from urllib.request import urlretrieve
+import importlib.util
 import json
 import os
 
@@ -59,12 +51,12 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
-
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"}
 ]
 
 # OS_Triage Memory Stuff
@@ -115,6 +107,28 @@ field_names = {
 key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 
+def download_common(module_list):
+    for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
+        # Step 1: download the module
+        result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
+        print(f'common file result ->', result)
+        # Step 2: install the module
+
+
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
+
+
 def check_properties(cont, prop, source_value):
     source_val = ""
     object_val = ""
@@ -191,6 +205,11 @@ def check_embedded(cont, embedded, source_id):
 
 def get_context_object(get_query, context_type, source_value=None, source_id=None):
     # 1. Extract the components of the object
+    # Load the context_store common file, which reads the lists from the context directory snapshot, when snapshots are turned on
+    if not os.path.exists(TR_Common_Files):
+        os.makedirs(TR_Common_Files)
+    download_common([common[1]])
+    context_store = import_common(common[1])
     # 1.B Find Current Incident directory
     local_map = {}
     with open(TR_Context_Memory_Dir + "/" + context_map, "r") as current_context:
@@ -206,8 +225,7 @@ def get_context_object(get_query, context_type, source_value=None, source_id=Non
         context_data_list = []
         context_object = {}
         if os.path.exists(TR_Context_Filename):
-            with open(TR_Context_Filename, "r") as context_file:
-                context_data_list = json.load(context_file)
+            context_data_list = context_store.load_context_list(TR_Company_Context_Dir, comp_data[context_type])
 
         if context_data_list:
             for cont in context_data_list:
@@ -37,7 +37,6 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 from urllib.request import urlretrieve
 import json
 import sys
@@ -46,12 +45,14 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 import os
-import_type = import_type_factory.get_all_imports()
 
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"},
+    {"module": "icon_registry", "file": "icon_registry.csv", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/icon_registry.csv"}
 ]
 
 # OS_Triage Memory Stuff
@@ -97,68 +98,24 @@ promotable_object_types = [
 def download_common(module_list):
     """Download common utility modules if they don't exist"""
     for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
         # Step 1: download the module
         result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
         print(f'common file result ->', result)
 
-def add_node(node, context_dir, context_type):
-    """Add a node to the specified context file"""
-    exists = False
-    stix_nodes_list = []
-    if os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                if stix_nodes_list[i]["id"] == node["id"]:
-                    stix_nodes_list[i] = node
-                    exists = True
-            if not exists:
-                stix_nodes_list.append(node)
-    else:
-        stix_nodes_list = [node]
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
-
-def add_edge(edge, context_dir, context_type):
-    """Add an edge to the specified context file"""
-    exists = False
-    stix_edge_list = []
-    if os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_edge_list = json.load(mem_input)
-            for i in range(len(stix_edge_list)):
-                if stix_edge_list[i]["source"] == edge["source"] and stix_edge_list[i]["target"] == edge["target"]:
-                    stix_edge_list[i] = edge
-                    exists = True
-            if not exists:
-                stix_edge_list.append(edge)
-    else:
-        stix_edge_list = [edge]
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_edge_list))
-
-def register_id(id, field, TR_Incident_Context_Dir):
-    """Register an ID in the incident object's reference lists"""
-    incident_list = []
-    with open(TR_Incident_Context_Dir + incident_data["incident"], "r") as incident_object:
-        incident_list = json.load(incident_object)
-        wrapped_incident = incident_list[0]
-        incident = wrapped_incident["original"]
-        incident_ext = incident["extensions"]["extension-definition--ef765651-680c-498d-9894-99799f2fa126"]
-        # check whether field exists first
-        if field_names[field] in incident_ext:
-            id_list = incident_ext[field_names[field]]
-            if id not in id_list:
-                id_list.append(id)
-        else:
-            id_list = []
-            id_list.append(id)
-            incident_ext[field_names[field]] = id_list
-
-    with open(TR_Incident_Context_Dir + incident_data["incident"], 'w') as f:
-        f.write(json.dumps(incident_list))
-
-def save_object_to_incident_context(stix_object, TR_Incident_Context_Dir, n_and_e):
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
+
+def save_object_to_incident_context(stix_object, store, refs, n_and_e):
     """Save a single STIX object to incident context using the exact method from save_incident_context.py"""
     wrapped = False
     if "original" in stix_object:
@@ -166,103 +123,103 @@ def save_object_to_incident_context(stix_object, TR_Incident_Context_Dir, n_and_
     
     if stix_object["type"] == "relationship":
         if wrapped:
-            add_node(stix_object, TR_Incident_Context_Dir, "relations")
-            register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
+            store.add_node(stix_object, "relations")
+            refs.add(stix_object["id"], "other")
         else:
             nodes, edges, relation_edges, relation_replacement_edges = n_and_e.convert_relns(stix_object)
-            add_node(nodes[0], TR_Incident_Context_Dir, "relations")
-            register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
+            store.add_node(nodes[0], "relations")
+            refs.add(stix_object["id"], "other")
             for edge in edges:
-                add_edge(edge, TR_Incident_Context_Dir, "edges")
+                store.add_edge(edge, "edges")
             for edge in relation_edges:
-                add_edge(edge, TR_Incident_Context_Dir, "relation_edges")
+                store.add_edge(edge, "relation_edges")
             for edge in relation_replacement_edges:
-                add_edge(edge, TR_Incident_Context_Dir, "relation_replacement_edges")
+                store.add_edge(edge, "relation_replacement_edges")
 
     elif stix_object["type"] == "sighting":
         if wrapped:
-            add_node(stix_object, TR_Incident_Context_Dir, "other")
-            register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
+            store.add_node(stix_object, "other")
+            refs.add(stix_object["id"], "other")
         else:
             nodes, edges = n_and_e.convert_sighting(stix_object)
-            add_node(nodes[0], TR_Incident_Context_Dir, "other")
-            register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
+            store.add_node(nodes[0], "other")
+            refs.add(stix_object["id"], "other")
             for edge in edges:
-                add_edge(edge, TR_Incident_Context_Dir, "edges")
+                store.add_edge(edge, "edges")
     else:
         # its a node-type of object
         if stix_object["type"] == "sequence":
             if stix_object.get("step_type") == "start_step":
                 if wrapped:
-                    add_node(stix_object, TR_Incident_Context_Dir, "start")
-                    register_id(stix_object["id"], "start", TR_Incident_Context_Dir)
+                    store.add_node(stix_object, "start")
+                    refs.add(stix_object["id"], "start")
                 else:
                     nodes, edges = n_and_e.convert_node(stix_object)
-                    add_node(nodes[0], TR_Incident_Context_Dir, "start")
-                    register_id(stix_object["id"], "start", TR_Incident_Context_Dir)
+                    store.add_node(nodes[0], "start")
+                    refs.add(stix_object["id"], "start")
                     for edge in edges:
-                        add_edge(edge, TR_Incident_Context_Dir, "edges")
+                        store.add_edge(edge, "edges")
             else:
                 if wrapped:
-                    add_node(stix_object, TR_Incident_Context_Dir, "sequence")
-                    register_id(stix_object["id"], "sequence", TR_Incident_Context_Dir)
+                    store.add_node(stix_object, "sequence")
+                    refs.add(stix_object["id"], "sequence")
                 else:
                     nodes, edges = n_and_e.convert_node(stix_object)
-                    add_node(nodes[0], TR_Incident_Context_Dir, "sequence")
-                    register_id(stix_object["id"], "sequence", TR_Incident_Context_Dir)
+                    store.add_node(nodes[0], "sequence")
+                    refs.add(stix_object["id"], "sequence")
                     for edge in edges:
-                        add_edge(edge, TR_Incident_Context_Dir, "edges")
+                        store.add_edge(edge, "edges")
         elif stix_object["type"] == "task":
             if wrapped:
-                add_node(stix_object, TR_Incident_Context_Dir, "task")
-                register_id(stix_object["id"], "task", TR_Incident_Context_Dir)
+                store.add_node(stix_object, "task")
+                refs.add(stix_object["id"], "task")
             else:
                 nodes, edges = n_and_e.convert_node(stix_object)
-                add_node(nodes[0], TR_Incident_Context_Dir, "task")
-                register_id(stix_object["id"], "task", TR_Incident_Context_Dir)
+                store.add_node(nodes[0], "task")
+                refs.add(stix_object["id"], "task")
                 for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
+                    store.add_edge(edge, "edges")
         elif stix_object["type"] == "event":
             if wrapped:
-                add_node(stix_object, TR_Incident_Context_Dir, "event")
-                register_id(stix_object["id"], "event", TR_Incident_Context_Dir)
+                store.add_node(stix_object, "event")
+                refs.add(stix_object["id"], "event")
             else:
                 nodes, edges = n_and_e.convert_node(stix_object)
-                add_node(nodes[0], TR_Incident_Context_Dir, "event")
-                register_id(stix_object["id"], "event", TR_Incident_Context_Dir)
+                store.add_node(nodes[0], "event")
+                refs.add(stix_object["id"], "event")
                 for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
+                    store.add_edge(edge, "edges")
         elif stix_object["type"] == "impact":
             if wrapped:
-                add_node(stix_object, TR_Incident_Context_Dir, "impact")
-                register_id(stix_object["id"], "impact", TR_Incident_Context_Dir)
+                store.add_node(stix_object, "impact")
+                refs.add(stix_object["id"], "impact")
             else:
                 nodes, edges = n_and_e.convert_node(stix_object)
-                add_node(nodes[0], TR_Incident_Context_Dir, "impact")
-                register_id(stix_object["id"], "impact", TR_Incident_Context_Dir)
+                store.add_node(nodes[0], "impact")
+                refs.add(stix_object["id"], "impact")
                 for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
+                    store.add_edge(edge, "edges")
         elif stix_object["type"] in ["x-oca-behavior", "attack-flow"]:
             if wrapped:
-                add_node(stix_object, TR_Incident_Context_Dir, "behavior")
-                register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
+                store.add_node(stix_object, "behavior")
+                refs.add(stix_object["id"], "other")
             else:
                 nodes, edges = n_and_e.convert_node(stix_object)
-                add_node(nodes[0], TR_Incident_Context_Dir, "behavior")
-                register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
+                store.add_node(nodes[0], "behavior")
+                refs.add(stix_object["id"], "other")
                 for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
+                    store.add_edge(edge, "edges")
         else:
             # All other object types go to "other"
             if wrapped:
-                add_node(stix_object, TR_Incident_Context_Dir, "other")
-                register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
+                store.add_node(stix_object, "other")
+                refs.add(stix_object["id"], "other")
             else:
                 nodes, edges = n_and_e.convert_node(stix_object)
-                add_node(nodes[0], TR_Incident_Context_Dir, "other")
-                register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
+                store.add_node(nodes[0], "other")
+                refs.add(stix_object["id"], "other")
                 for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
+                    store.add_edge(edge, "edges")
 
 def collect_subgraph_for_object(target_object, unattached_objects):
     """Collect the complete subgraph for a target object based on its type"""
@@ -329,28 +286,16 @@ def collect_subgraph_for_object(target_object, unattached_objects):
     
     return subgraph
 
-def remove_objects_from_unattached(objects_to_remove, TR_Incident_Context_Dir):
+def remove_objects_from_unattached(objects_to_remove, store):
     """Remove specified objects from unattached context memory"""
-    unattached_file = TR_Incident_Context_Dir + incident_data["unattached"]
-    
-    if not os.path.exists(unattached_file):
+    if not store.exists("unattached"):
         return []
     
-    # Load current unattached objects
-    with open(unattached_file, "r") as f:
-        unattached_objects = json.load(f)
-    
-    # Get IDs to remove
-    ids_to_remove = {obj["id"] for obj in objects_to_remove}
-    
-    # Filter out the objects to remove
-    remaining_objects = [obj for obj in unattached_objects if obj["id"] not in ids_to_remove]
+    # Remove each object through the context store index
+    for obj in objects_to_remove:
+        store.delete_node(obj["id"], "unattached")
     
-    # Save the updated unattached list
-    with open(unattached_file, 'w') as f:
-        json.dump(remaining_objects, f)
-    
-    return remaining_objects
+    return store.get_list("unattached")
 
 def promote_subgraph(object_type_to_promote):
     """Main function to promote a subgraph from unattached to incident context"""
@@ -369,45 +314,45 @@ def promote_subgraph(object_type_to_promote):
         # Check if the key directories exist, if not make them, and download common files
         if not os.path.exists(TR_Common_Files):
             os.makedirs(TR_Common_Files)
-            download_common(common)
+        download_common(common)
         if not os.path.exists(TR_Context_Memory_Dir):
             os.makedirs(TR_Context_Memory_Dir)
 
-        # Import the convert_n_and_e module
-        module_path = TR_Common_Files + '/' + common[0]["file"]
-        spec = importlib.util.spec_from_file_location('n_and_e', module_path)
-        n_and_e = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(n_and_e)
+        # Import the convert_n_and_e and context_store modules, and open the context store
+        n_and_e = import_common(common[0])
+        context_store = import_common(common[1])
+        with context_store.open_context_store(TR_Incident_Context_Dir, incident_data) as store:
+            refs = context_store.IncidentRefs(store, field_names)
 
-        # Load unattached context memory
-        unattached_file = TR_Incident_Context_Dir + incident_data["unattached"]
-        if not os.path.exists(unattached_file):
-            return f"No unattached context found for incident {current_incident_dir}"
+            # Load unattached context memory
+            if not store.exists("unattached"):
+                return f"No unattached context found for incident {current_incident_dir}"
 
-        with open(unattached_file, "r") as f:
-            unattached_objects = json.load(f)
+            unattached_objects = store.get_list("unattached")
 
-        # Find the first object of the specified type
-        target_object = None
-        for obj in unattached_objects:
-            if obj["type"] == object_type_to_promote:
-                target_object = obj
-                break
+            # Find the first object of the specified type
+            target_object = None
+            for obj in unattached_objects:
+                if obj["type"] == object_type_to_promote:
+                    target_object = obj
+                    break
 
-        if not target_object:
-            return f"No object of type '{object_type_to_promote}' found in unattached context"
+            if not target_object:
+                return f"No object of type '{object_type_to_promote}' found in unattached context"
 
-        # Collect the complete subgraph for this object
-        subgraph = collect_subgraph_for_object(target_object, unattached_objects)
+            # Collect the complete subgraph for this object
+            subgraph = collect_subgraph_for_object(target_object, unattached_objects)
         
-        # Remove the subgraph objects from unattached context
-        remaining_unattached = remove_objects_from_unattached(subgraph, TR_Incident_Context_Dir)
+            # Remove the subgraph objects from unattached context
+            remaining_unattached = remove_objects_from_unattached(subgraph, store)
         
-        # Save each object in the subgraph to incident context using the exact method
-        promoted_count = 0
-        for stix_object in subgraph:
-            save_object_to_incident_context(stix_object, TR_Incident_Context_Dir, n_and_e)
-            promoted_count += 1
+            # Save each object in the subgraph to incident context using the exact method
+            promoted_count = 0
+            for stix_object in subgraph:
+                save_object_to_incident_context(stix_object, store, refs, n_and_e)
+                promoted_count += 1
+
+        # Closing the context store registers the promoted ids on the incident once, and compacts it, exporting the updated lists
 
         subgraph_ids = [obj["id"] for obj in subgraph]
         
@@ -37,7 +37,6 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 # from Block_Families.General._library.
 # from Orchestration.Common.
 from urllib.request import urlretrieve
@@ -48,12 +47,14 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 import os
-import_type = import_type_factory.get_all_imports()
 
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"},
+    {"module": "icon_registry", "file": "icon_registry.csv", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/icon_registry.csv"}
 ]
 
 # OS_Triage Memory Stuff
@@ -106,6 +107,8 @@ key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 def download_common(module_list):
     for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
         # Step 1: download the module
         result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
         print(f'common file result ->', result)
@@ -113,50 +116,26 @@ def download_common(module_list):
 
 
 
-def add_node(node, context_dir, context_type="unattached"):
-    exists = False
-    stix_nodes_list = []
-    if  os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                if stix_nodes_list[i]["id"] == node["id"]:
-                    stix_nodes_list[i] = node
-                    exists = True
-            if not exists:
-                stix_nodes_list.append(node)
-    else:
-        stix_nodes_list = [node]
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
-
-
-def add_edge(edge, context_dir, context_type):
-    exists = False
-    stix_edge_list = []
-    if os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_edge_list = json.load(mem_input)
-            for i in range(len(stix_edge_list)):
-                if stix_edge_list[i]["source"] == edge["source"] and stix_edge_list[i]["target"] == edge["target"]:
-                    stix_edge_list[i] = edge
-                    exists = True
-            if not exists:
-                stix_edge_list.append(edge)
-    else:
-        stix_edge_list = [edge]
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_edge_list))
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
 
 
-def process_node(stix_object, context_key, context_dir, n_and_e):
+def process_node(stix_object, context_key, store, n_and_e):
     if "original" in stix_object:
-        add_node(stix_object, context_key)
+        store.add_node(stix_object, context_key)
     else:
         nodes, edges = n_and_e.convert_node(stix_object)
-        add_node(nodes[0], context_dir, context_key)
+        store.add_node(nodes[0], context_key)
         for edge in edges:
-            add_edge(edge, context_dir, "edges")
+            store.add_edge(edge, "edges")
 
 
 def save_context(tree_object):
@@ -178,7 +157,7 @@ def save_context(tree_object):
         # 2. Check if the key directories exist, if not make them, and download common files
         if not os.path.exists(TR_Common_Files):
             os.makedirs(TR_Common_Files)
-            download_common(common)
+        download_common(common)
         if not os.path.exists(TR_Context_Memory_Dir):
             os.makedirs(TR_Context_Memory_Dir)
         if not os.path.exists(TR_Context_Memory_Dir + "/usr"):
@@ -186,44 +165,39 @@ def save_context(tree_object):
         # if not os.path.exists(TR_Context_Memory_Dir + "/incident_1"):
         #     os.makedirs(TR_Context_Memory_Dir + "/incident_1")
 
-        # 3. Now we are sure the common files exist, we need to import them
-        # Specify the path to the Nodes and Edges module
-        module_path = TR_Common_Files + '/' + common[0]["file"]
-        # Load the module spec using importlib.util.spec_from_file_location
-        spec = importlib.util.spec_from_file_location('n_and_e', module_path)
-        # Create the module from the specification
-        n_and_e = importlib.util.module_from_spec(spec)
-        # Load the module
-        spec.loader.exec_module(n_and_e)
-        # 4. Depending on Object Tupe, Get the Nodes and Edges, and save them to the lists
-        stix_nodes_list = []
-        incident = {}
-        stix_object = {k: v for k, v in tree_object.items() if k != "children"}
-        if stix_object["type"] == "relationship":
-            if wrapped:
-                add_node(stix_object, TR_Incident_Context_Dir, "unattached")
+        # 3. Now we are sure the common files exist, we need to import them, and open the context store
+        n_and_e = import_common(common[0])
+        context_store = import_common(common[1])
+        with context_store.open_context_store(TR_Incident_Context_Dir, incident_data) as store:
+            # 4. Depending on Object Tupe, Get the Nodes and Edges, and save them to the lists
+            stix_nodes_list = []
+            incident = {}
+            stix_object = {k: v for k, v in tree_object.items() if k != "children"}
+            if stix_object["type"] == "relationship":
+                if wrapped:
+                    store.add_node(stix_object, "unattached")
+                else:
+                    nodes, edges, relation_edges, relation_replacement_edges = n_and_e.convert_relns(stix_object)
+                    store.add_node(nodes[0], "unattached_relations")
+                    for edge in edges:
+                        store.add_edge(edge, "edges")
+                    for edge in relation_edges:
+                        store.add_edge(edge, "relation_edges")
+                    for edge in relation_replacement_edges:
+                        store.add_edge(edge, "relation_replacement_edges")
+
+            elif stix_object["type"] == "sighting":
+                if wrapped:
+                    store.add_node(stix_object, "unattached")
+                else:
+                    nodes, edges = n_and_e.convert_sighting(stix_object)
+                    store.add_node(nodes[0], "unattached")
+                    for edge in edges:
+                        store.add_edge(edge, "edges")
             else:
-                nodes, edges, relation_edges, relation_replacement_edges = n_and_e.convert_relns(stix_object)
-                add_node(nodes[0],TR_Incident_Context_Dir, "unattached_relations")
-                for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
-                for edge in relation_edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "relation_edges")
-                for edge in relation_replacement_edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "relation_replacement_edges")
-
-        elif stix_object["type"] == "sighting":
-            if wrapped:
-                add_node(stix_object, TR_Incident_Context_Dir, "unattached")
-            else:
-                nodes, edges = n_and_e.convert_sighting(stix_object)
-                add_node(nodes[0], TR_Incident_Context_Dir, "unattached")
-                for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
-        else:
-            # its a node-type of object
-            process_node(stix_object, "unattached", TR_Incident_Context_Dir, n_and_e)
-
+                # its a node-type of object
+                process_node(stix_object, "unattached", store, n_and_e)
+        # 5. Closing the context store compacts it, exporting the updated lists
 
     return "tree object saved to unattached context - \nstix_id -> " + str(stix_object["id"])
 
@@ -37,7 +37,6 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 # from Block_Families.General._library.
 # from Orchestration.Common.
 from urllib.request import urlretrieve
@@ -48,7 +47,6 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 import os
-import_type = import_type_factory.get_all_imports()
 
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
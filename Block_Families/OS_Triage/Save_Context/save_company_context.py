@@ -38,7 +38,6 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 import json
 import sys
 import importlib.util
@@ -49,12 +48,13 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
-
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"},
+    {"module": "icon_registry", "file": "icon_registry.csv", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/icon_registry.csv"}
 ]
 
 # OS_Triage Memory Stuff
@@ -108,45 +108,23 @@ key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 def download_common(module_list):
     for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
         # Step 1: download the module
         result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
         print(f'common file result ->', result)
 
 
-def add_node(node, context_dir, context_type):
-    exists = False
-    stix_nodes_list = []
-    if os.path.exists(context_dir + comp_data[context_type]):
-        with open(context_dir + comp_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                if stix_nodes_list[i]["id"] == node["id"]:
-                    stix_nodes_list[i] = node
-                    exists = True
-            if not exists:
-                stix_nodes_list.append(node)
-    else:
-        stix_nodes_list = [node]
-    with open(context_dir + comp_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
-
-
-def add_edge(edge, context_dir, context_type):
-    exists = False
-    stix_edge_list = []
-    if os.path.exists(context_dir + comp_data[context_type]):
-        with open(context_dir + comp_data[context_type], "r") as mem_input:
-            stix_edge_list = json.load(mem_input)
-            for i in range(len(stix_edge_list)):
-                if stix_edge_list[i]["source"] == edge["source"] and stix_edge_list[i]["target"] == edge["target"]:
-                    stix_edge_list[i] = edge
-                    exists = True
-            if not exists:
-                stix_edge_list.append(edge)
-    else:
-        stix_edge_list = [edge]
-    with open(context_dir + comp_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_edge_list))
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
 
 
 def save_context(stix_object, context_type):
@@ -166,7 +144,7 @@ def save_context(stix_object, context_type):
         # 2. Check if the key directories exist, if not make them, and download common files
         if not os.path.exists(TR_Common_Files):
             os.makedirs(TR_Common_Files)
-            download_common(common)
+        download_common(common)
         if not os.path.exists(TR_Context_Memory_Dir):
             os.makedirs(TR_Context_Memory_Dir)
         if not os.path.exists(TR_Context_Memory_Dir + "/usr"):
@@ -174,30 +152,16 @@ def save_context(stix_object, context_type):
         # if not os.path.exists(TR_Context_Memory_Dir + "/incident_1"):
         #     os.makedirs(TR_Context_Memory_Dir + "/incident_1")
 
-        # 3. Now we are sure the common files exist, we need to import them
-        # Specify the path to the Nodes and Edges module
-        module_path = TR_Common_Files + '/' + common[0]["file"]
-        # Load the module spec using importlib.util.spec_from_file_location
-        spec = importlib.util.spec_from_file_location('n_and_e', module_path)
-        # Create the module from the specification
-        n_and_e = importlib.util.module_from_spec(spec)
-        # Load the module
-        spec.loader.exec_module(n_and_e)
-        # 4.  if file exists, replce existing object if it exists, else add it, else create the list and add it
-        if stix_object["type"] == "relationship":
-            nodes, edges, relation_edges, relation_replacement_edges = n_and_e.convert_relns(stix_object)
-            add_node(nodes[0], TR_Company_Context_Dir, "relations")
-            for edge in edges:
-                add_edge(edge, TR_Company_Context_Dir, "edges")
-            for edge in relation_edges:
-                add_edge(edge, TR_Company_Context_Dir, "relation_edges")
-            for edge in relation_replacement_edges:
-                add_edge(edge, TR_Company_Context_Dir, "relation_replacement_edges")
-        else:
-            nodes, edges = n_and_e.convert_node(stix_object)
-            add_node(nodes[0], TR_Company_Context_Dir, context_type)
-            for edge in edges:
-                add_edge(edge, TR_Company_Context_Dir, "edges")
+        # 3. Now we are sure the common files exist, we need to import them, and open the context store
+        n_and_e = import_common(common[0])
+        context_store = import_common(common[1])
+        with context_store.open_context_store(TR_Company_Context_Dir, comp_data) as store:
+            # 4.  replace the existing object if it exists, else add it, writing only the node and edges that changed
+            node_type = "relations" if stix_object["type"] == "relationship" else context_type
+            node, edge_lists = context_store.convert_object(stix_object, n_and_e)
+            store.save_objects([(node_type, node, edge_lists,
+                                 context_store.previous_edge_lists(store, node_type, stix_object, edge_lists, n_and_e))])
+        # 5. Closing the context store compacts it, exporting the updated lists
 
     return "Company "+ str(current_company_dir) + "\nOptions context saved -> " + str(context_type) + "\nstix_id -> " + str(stix_object["id"])
 
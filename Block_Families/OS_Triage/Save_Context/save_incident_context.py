@@ -38,7 +38,6 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 # from Block_Families.General._library.
 # from Orchestration.Common.
 from urllib.request import urlretrieve
@@ -49,12 +48,14 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 import os
-import_type = import_type_factory.get_all_imports()
 
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"},
+    {"module": "icon_registry", "file": "icon_registry.csv", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/icon_registry.csv"}
 ]
 
 # OS_Triage Memory Stuff
@@ -108,225 +109,123 @@ key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 def download_common(module_list):
     for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
         # Step 1: download the module
         result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
         print(f'common file result ->', result)
         # Step 2: install the module
 
 
-
-def add_node(node, context_dir, context_type):
-    exists = False
-    stix_nodes_list = []
-    if  os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                if stix_nodes_list[i]["id"] == node["id"]:
-                    stix_nodes_list[i] = node
-                    exists = True
-            if not exists:
-                stix_nodes_list.append(node)
-    else:
-        stix_nodes_list = [node]
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
-
-
-def add_edge(edge, context_dir, context_type):
-    exists = False
-    stix_edge_list = []
-    if os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_edge_list = json.load(mem_input)
-            for i in range(len(stix_edge_list)):
-                if stix_edge_list[i]["source"] == edge["source"] and stix_edge_list[i]["target"] == edge["target"]:
-                    stix_edge_list[i] = edge
-                    exists = True
-            if not exists:
-                stix_edge_list.append(edge)
-    else:
-        stix_edge_list = [edge]
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_edge_list))
-
-def register_id(id, field, TR_Incident_Context_Dir):
-    incident_list = []
-    with open(TR_Incident_Context_Dir + incident_data["incident"], "r") as incident_object:
-        incident_list = json.load(incident_object)
-        wrapped_incident = incident_list[0]
-        incident = wrapped_incident["original"]
-        incident_ext = incident["extensions"]["extension-definition--ef765651-680c-498d-9894-99799f2fa126"]
-        # check whether field exists first
-        if field_names[field] in incident_ext:
-            id_list = incident_ext[field_names[field]]
-            if id not in id_list:
-                id_list.append(id)
-        else:
-            id_list = []
-            id_list.append(id)
-            incident_ext[field_names[field]] = id_list
-
-    with open(TR_Incident_Context_Dir + incident_data["incident"], 'w') as f:
-        f.write(json.dumps(incident_list))
-
-
-def save_context(stix_object, context_type):
-    # 0 Check for "original"
-    wrapped = False
-    exists = False
-    if "original" in stix_object:
-        wrapped = True
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
+
+
+def context_key_for(stix_object):
+    # Find the context list an object is saved to, which is also the incident field it is registered in
+    if stix_object["type"] in ["relationship", "sighting"]:
+        return "other"
+    elif stix_object["type"] == "sequence":
+        if stix_object["step_type"] == "start_step":
+            return "start"
+        return "sequence"
+    elif stix_object["type"] in ["task", "event", "impact", "incident"]:
+        return stix_object["type"]
+    return "other"
+
+
+def save_incident(stix_object, store, n_and_e, context_store):
+    # It is an Incident, so first, update all of the id lists on the incident object
+    for key in key_list:
+        # an empty or missing list gives an empty id list
+        stix_list = store.get_list(key)
+        if key == "other":
+            # if we are filling the "other" list then add in the relations
+            stix_list = stix_list + store.get_list("relations")
+        stix_object[field_names[key]] = [x["id"] for x in stix_list]
+
+    # create the nodes and edges, saving only what changed since the incident was last saved
+    node, edge_lists = context_store.convert_object(stix_object, n_and_e)
+    store.save_objects([("incident", node, edge_lists,
+                         context_store.previous_edge_lists(store, "incident", stix_object, edge_lists, n_and_e))])
+
+
+def open_incident_store():
     # 1.B Find Current Incident directory
     local_map = {}
     with open(TR_Context_Memory_Dir + "/" + context_map, "r") as current_context:
         local_map = json.load(current_context)
-        # 1. Setup the incident context directory
-        current_incident_dir = local_map["current_incident"]
-        TR_Incident_Context_Dir = TR_Context_Memory_Dir + "/" + current_incident_dir
-
-        # 2. Check if the key directories exist, if not make them, and download common files
-        if not os.path.exists(TR_Common_Files):
-            os.makedirs(TR_Common_Files)
-            download_common(common)
-        if not os.path.exists(TR_Context_Memory_Dir):
-            os.makedirs(TR_Context_Memory_Dir)
-        if not os.path.exists(TR_Context_Memory_Dir + "/usr"):
-            os.makedirs(TR_Context_Memory_Dir + "/usr")
-        # if not os.path.exists(TR_Context_Memory_Dir + "/incident_1"):
-        #     os.makedirs(TR_Context_Memory_Dir + "/incident_1")
-
-        # 3. Now we are sure the common files exist, we need to import them
-        # Specify the path to the Nodes and Edges module
-        module_path = TR_Common_Files + '/' + common[0]["file"]
-        # Load the module spec using importlib.util.spec_from_file_location
-        spec = importlib.util.spec_from_file_location('n_and_e', module_path)
-        # Create the module from the specification
-        n_and_e = importlib.util.module_from_spec(spec)
-        # Load the module
-        spec.loader.exec_module(n_and_e)
-        # 4. Depending on Object Type, Get the Nodes and Edges, and save them to the lists
-        stix_nodes_list = []
-        incident = {}
-        if stix_object["type"] == "relationship":
-            if wrapped:
-                add_node(stix_object, TR_Incident_Context_Dir, "relations")
-                register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
-            else:
-                nodes, edges, relation_edges, relation_replacement_edges = n_and_e.convert_relns(stix_object)
-                add_node(nodes[0],TR_Incident_Context_Dir, "relations")
-                register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
-                for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
-                for edge in relation_edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "relation_edges")
-                for edge in relation_replacement_edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "relation_replacement_edges")
-
-        elif stix_object["type"] == "sighting":
-            if wrapped:
-                add_node(stix_object, "other")
-                register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
-            else:
-                nodes, edges = n_and_e.convert_sighting(stix_object)
-                add_node(nodes[0], TR_Incident_Context_Dir, "other")
-                register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
-                for edge in edges:
-                    add_edge(edge, TR_Incident_Context_Dir, "edges")
-        else:
-            # its a node-type of object
-            if stix_object["type"] == "sequence":
-                if stix_object["step_type"] == "start_step":
-                    if wrapped:
-                        add_node(stix_object, "start")
-                        register_id(stix_object["id"], "start", TR_Incident_Context_Dir)
-                    else:
-                        nodes, edges = n_and_e.convert_node(stix_object)
-                        add_node(nodes[0], TR_Incident_Context_Dir, "start")
-                        register_id(stix_object["id"], "start", TR_Incident_Context_Dir)
-                        for edge in edges:
-                            add_edge(edge, TR_Incident_Context_Dir, "edges")
-                else:
-                    if wrapped:
-                        add_node(stix_object, "sequence")
-                        register_id(stix_object["id"], "sequence", TR_Incident_Context_Dir)
-                    else:
-                        nodes, edges = n_and_e.convert_node(stix_object)
-                        add_node(nodes[0], TR_Incident_Context_Dir, "sequence")
-                        register_id(stix_object["id"], "sequence", TR_Incident_Context_Dir)
-                        for edge in edges:
-                            add_edge(edge, TR_Incident_Context_Dir, "edges")
-            elif stix_object["type"] == "task":
-                if wrapped:
-                    add_node(stix_object, "task")
-                    register_id(stix_object["id"], "task", TR_Incident_Context_Dir)
-
-                else:
-                    nodes, edges = n_and_e.convert_node(stix_object)
-                    add_node(nodes[0], TR_Incident_Context_Dir, "task")
-                    register_id(stix_object["id"], "task", TR_Incident_Context_Dir)
-                    for edge in edges:
-                        add_edge(edge, TR_Incident_Context_Dir, "edges")
-            elif stix_object["type"] == "event":
-                if wrapped:
-                    add_node(stix_object, "event")
-                    register_id(stix_object["id"], "event", TR_Incident_Context_Dir)
-
-                else:
-                    nodes, edges = n_and_e.convert_node(stix_object)
-                    add_node(nodes[0], TR_Incident_Context_Dir, "event")
-                    register_id(stix_object["id"], "event", TR_Incident_Context_Dir)
-                    for edge in edges:
-                        add_edge(edge, TR_Incident_Context_Dir, "edges")
-            elif stix_object["type"] == "impact":
-                if wrapped:
-                    add_node(stix_object, "impact")
-                    register_id(stix_object["id"], "impact", TR_Incident_Context_Dir)
-
-                else:
-                    nodes, edges = n_and_e.convert_node(stix_object)
-                    add_node(nodes[0], TR_Incident_Context_Dir, "impact")
-                    register_id(stix_object["id"], "impact", TR_Incident_Context_Dir)
-                    for edge in edges:
-                        add_edge(edge, TR_Incident_Context_Dir, "edges")
-            elif stix_object["type"] != "incident":
-                if wrapped:
-                    add_node(stix_object, "other")
-                    register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
-                else:
-                    nodes, edges = n_and_e.convert_node(stix_object)
-                    add_node(nodes[0], TR_Incident_Context_Dir, "other")
-                    register_id(stix_object["id"], "other", TR_Incident_Context_Dir)
-                    for edge in edges:
-                        add_edge(edge, TR_Incident_Context_Dir, "edges")
-            else:
-                # It is an Incident, so first, update all of the id lists on the incident object
-                for key in key_list:
-                    if os.path.exists(TR_Incident_Context_Dir + incident_data[key]):
-                        with open(TR_Incident_Context_Dir + incident_data[key], "r") as list_input:
-                            stix_list = json.load(list_input)
-                            if key == "other":
-                                # if we are filling the "other" list then add in the relations
-                                if os.path.exists(TR_Incident_Context_Dir + incident_data["relations"]):
-                                    with open(TR_Incident_Context_Dir + incident_data[key], "r") as list2_input:
-                                        stix_list2 = json.load(list2_input)
-                                        stix_list = stix_list + stix_list2
-                            stix_id_list = [x["id"] for x in stix_list]
-                            # does the stix_object already appear in the list?
-                            stix_object[field_names[key]] = stix_id_list
-                    else:
-                        # list is empty
-                        stix_object[field_names[key]] = []
-
-                # create the nodes and edges
-                if wrapped:
-                    add_node(stix_object, "incident")
-                else:
-                    nodes, edges = n_and_e.convert_node(stix_object)
-                    add_node(nodes[0], "incident")
-                    for edge in edges:
-                        add_edge(edge, "edges")
+    # 1. Setup the incident context directory
+    current_incident_dir = local_map["current_incident"]
+    TR_Incident_Context_Dir = TR_Context_Memory_Dir + "/" + current_incident_dir
+
+    # 2. Check if the key directories exist, if not make them, and download common files
+    if not os.path.exists(TR_Common_Files):
+        os.makedirs(TR_Common_Files)
+    download_common(common)
+    if not os.path.exists(TR_Context_Memory_Dir):
+        os.makedirs(TR_Context_Memory_Dir)
+    if not os.path.exists(TR_Context_Memory_Dir + "/usr"):
+        os.makedirs(TR_Context_Memory_Dir + "/usr")
+
+    # 3. Now we are sure the common files exist, we need to import them, and open the context store
+    n_and_e = import_common(common[0])
+    context_store = import_common(common[1])
+    store = context_store.open_context_store(TR_Incident_Context_Dir, incident_data)
+    refs = context_store.IncidentRefs(store, field_names)
+    return n_and_e, context_store, store, refs
+
+
+def save_context_list(stix_list, context_type=""):
+    """
+    Save a batch of stix objects to the current incident context, opening and committing
+    each context file once for the whole batch.
+
+    Args:
+        stix_list (List[Dict]): The stix objects, either plain or already wrapped with "original".
+        context_type (str): Unused, kept to match save_context.
+
+    Returns:
+        str: The context memory return message.
+    """
+    n_and_e, context_store, store, refs = open_incident_store()
+    with store:
+        # 4. Convert every object, with its edges as last saved, so only the changes are written
+        saves = []
+        incidents = []
+        for stix_object in stix_list:
+            context_key = context_key_for(stix_object)
+            if context_key == "incident":
+                incidents.append(stix_object)
+                continue
+            node, edge_lists = context_store.convert_object(stix_object, n_and_e)
+            node_key = "relations" if stix_object["type"] == "relationship" else context_key
+            saves.append((node_key, node, edge_lists,
+                          context_store.previous_edge_lists(store, node_key, stix_object, edge_lists, n_and_e)))
+            refs.add(stix_object["id"], context_key)
+
+        # 5. Save the changes to each list, removing stale edges, and register the ids on the incident in one update,
+        # which waits for the incident when the directory has none yet
+        store.save_objects(saves)
+        refs.flush()
+        # incidents are saved last, so their id lists include the rest of the batch
+        for stix_object in incidents:
+            save_incident(stix_object, store, n_and_e, context_store)
+    # 6. Closing the context store compacts it, exporting the updated lists
+
+    return " incident context saved - \nstix_ids -> " + str([x["id"] for x in stix_list])
 
+
+def save_context(stix_object, context_type):
+    save_context_list([stix_object], context_type)
     return " incident context saved - \nstix_id -> " + str(stix_object["id"])
 
 
@@ -337,19 +236,19 @@ def main(inputfile, outputfile):
         with open(inputfile, "r") as script_input:
             input_data = json.load(script_input)
             print(f"input data->{input_data}")
-            if "stix_object" in input_data:
+            if "api" in input_data:
+                input_data = input_data["api"]
+                print("api")
+            if "context_type" in input_data:
+                context_type_string = input_data["context_type"]["context_type"]
+            if "stix_list" in input_data:
+                stix_list = input_data["stix_list"]
+                print(f"from ports \nstix_list->{len(stix_list)} objects\ncontext type->{context_type_string}")
+                result_string = save_context_list(stix_list, context_type_string)
+            elif "stix_object" in input_data:
                 stix_object = input_data["stix_object"]
-                if "context_type" in input_data:
-                    context_type_string = input_data["context_type"]["context_type"]
                 print(f"from ports \nstix_object->{stix_object}\ncontext type->{context_type_string}")
                 result_string = save_context(stix_object, context_type_string)
-            elif "api" in input_data:
-                api_input_data = input_data["api"]
-                stix_object = api_input_data["stix_object"]
-                if "context_type" in api_input_data:
-                    context_type_string = api_input_data["context_type"]["context_type"]
-                print(f"api \nstix_object->{stix_object}\ncontext type->{context_type_string}")
-                result_string = save_context(stix_object, context_type_string)
 
             # setup logger for execution
 
@@ -36,7 +36,6 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the BSD.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 import json
 import os
 import shutil
@@ -47,8 +46,6 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
-
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
 common = [
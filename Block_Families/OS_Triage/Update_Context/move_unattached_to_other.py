@@ -36,16 +36,14 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the BSD.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 import json
 from Block_Families.General._library.convert_n_and_e import convert_relns, convert_sighting, convert_node
+from Block_Families.General._library.context_store import open_context_store
 
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
-
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
 common = [
@@ -100,40 +98,6 @@ field_names = {
 key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 
-def add_node(node, context_dir, context_type):
-    exists = False
-    stix_nodes_list = []
-    if os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                if stix_nodes_list[i]["id"] == node["id"]:
-                    stix_nodes_list[i] = node
-                    exists = True
-            if not exists:
-                stix_nodes_list.append(node)
-    else:
-        stix_nodes_list = [node]
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
-
-
-def del_node(node_id, context_dir, context_type):
-    exists = False
-    stix_nodes_list = []
-    if os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                #print(f"i->{i}, len->{len(stix_nodes_list)} node {stix_nodes_list[i]}")
-                if stix_nodes_list[i]["id"] == node_id:
-                    del stix_nodes_list[i]
-                    print(f"delete element {i}, node id {node_id}")
-                    break
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
-
-
 def move_unattached_to_other(stix_list):
     # 1.B Find Current Incident directory
     local_map = {}
@@ -151,25 +115,28 @@ def move_unattached_to_other(stix_list):
         # if not os.path.exists(TR_Context_Memory_Dir + "/incident_1"):
         #     os.makedirs(TR_Context_Memory_Dir + "/incident_1")
 
-        # 4. for each object receieved, add it to the Other List, and remove it from the Unattached List
-        report_id = []
-        for stix_obj in stix_list:
-            # if file exists, replce existing object if it exists, else add it, else create the list and add it
-            if stix_obj["type"] == "relationship":
-                nodes, edges, relation_edges, relation_replacement_edges = convert_relns(stix_obj)
-                add_node(nodes[0],TR_Incident_Context_Dir, "other")
-                del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                report_id.append(stix_obj["id"])
-            elif stix_obj["type"] == "sighting":
-                nodes, edges = convert_sighting(stix_obj)
-                add_node(nodes[0],TR_Incident_Context_Dir, "other")
-                del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                report_id.append(stix_obj["id"])
-            else:
-                nodes, edges = convert_node(stix_obj)
-                add_node(nodes[0],TR_Incident_Context_Dir, "other")
-                del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                report_id.append(stix_obj["id"])
+        # 3. Open the context store for the incident
+        with open_context_store(TR_Incident_Context_Dir, incident_data) as store:
+            # 4. for each object receieved, add it to the Other List, and remove it from the Unattached List
+            report_id = []
+            for stix_obj in stix_list:
+                # if file exists, replce existing object if it exists, else add it, else create the list and add it
+                if stix_obj["type"] == "relationship":
+                    nodes, edges, relation_edges, relation_replacement_edges = convert_relns(stix_obj)
+                    store.add_node(nodes[0], "other")
+                    store.delete_node(stix_obj["id"], "unattached")
+                    report_id.append(stix_obj["id"])
+                elif stix_obj["type"] == "sighting":
+                    nodes, edges = convert_sighting(stix_obj)
+                    store.add_node(nodes[0], "other")
+                    store.delete_node(stix_obj["id"], "unattached")
+                    report_id.append(stix_obj["id"])
+                else:
+                    nodes, edges = convert_node(stix_obj)
+                    store.add_node(nodes[0], "other")
+                    store.delete_node(stix_obj["id"], "unattached")
+                    report_id.append(stix_obj["id"])
+        # 5. Closing the context store compacts it, exporting the updated lists
 
     return " transferred from 'Unattached' to 'Other' -> " + str(report_id)
 
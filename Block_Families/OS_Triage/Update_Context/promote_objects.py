@@ -35,20 +35,22 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the BSD.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
 import json
 
+from urllib.request import urlretrieve
 import importlib.util
+import sys
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
-
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"},
+    {"module": "icon_registry", "file": "icon_registry.csv", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/icon_registry.csv"}
 ]
 
 # OS_Triage Memory Stuff
@@ -100,38 +102,26 @@ field_names = {
 key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 
-def add_node(node, context_dir, context_type):
-    exists = False
-    stix_nodes_list = []
-    if os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                if stix_nodes_list[i]["id"] == node["id"]:
-                    stix_nodes_list[i] = node
-                    exists = True
-            if not exists:
-                stix_nodes_list.append(node)
-    else:
-        stix_nodes_list = [node]
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
-
-
-def del_node(node_id, context_dir, context_type):
-    exists = False
-    stix_nodes_list = []
-    if os.path.exists(context_dir + incident_data[context_type]):
-        with open(context_dir + incident_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                #print(f"i->{i}, len->{len(stix_nodes_list)} node {stix_nodes_list[i]}")
-                if stix_nodes_list[i]["id"] == node_id:
-                    del stix_nodes_list[i]
-                    print(f"delete element {i}, node id {node_id}")
-                    break
-    with open(context_dir + incident_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
+def download_common(module_list):
+    for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
+        # Step 1: download the module
+        result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
+        print(f'common file result ->', result)
+        # Step 2: install the module
+
+
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
 
 
 def promote_objects(stix_list):
@@ -154,91 +144,87 @@ def promote_objects(stix_list):
         #     os.makedirs(TR_Context_Memory_Dir + "/incident_1")
         #     os.makedirs(TR_Context_Memory_Dir + "/incident_1")
 
-        # 3. Now we are sure the common files exist, we need to import them
-        # Specify the path to the Nodes and Edges module
-        module_path = TR_Common_Files + '/' + common[0]["file"]
-        # Load the module spec using importlib.util.spec_from_file_location
-        spec = importlib.util.spec_from_file_location('n_and_e', module_path)
-        # Create the module from the specification
-        n_and_e = importlib.util.module_from_spec(spec)
-        # Load the module
-        spec.loader.exec_module(n_and_e)
-
-        # 4. for each object receieved, add it to the Other List, and remove it from the Unattached List
-        report_id = []
-        for stix_obj in stix_list:
-            if "original" in stix_obj:
-                wrapped = True
-            if stix_obj["type"] == "relationship":
-                if wrapped:
-                    add_node(stix_obj, TR_Incident_Context_Dir, "relations")
-                else:
-                    nodes, edges, relation_edges, relation_replacement_edges = n_and_e.convert_relns(stix_obj)
-                    add_node(nodes[0],TR_Incident_Context_Dir, "relations")
-                    del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                    report_id.append(stix_obj["id"])
+        # 3. Now we are sure the common files exist, we need to import them, and open the context store
+        n_and_e = import_common(common[0])
+        context_store = import_common(common[1])
+        with context_store.open_context_store(TR_Incident_Context_Dir, incident_data) as store:
+
+            # 4. for each object receieved, add it to the Other List, and remove it from the Unattached List
+            report_id = []
+            for stix_obj in stix_list:
+                if "original" in stix_obj:
+                    wrapped = True
+                if stix_obj["type"] == "relationship":
+                    if wrapped:
+                        store.add_node(stix_obj, "relations")
+                    else:
+                        nodes, edges, relation_edges, relation_replacement_edges = n_and_e.convert_relns(stix_obj)
+                        store.add_node(nodes[0], "relations")
+                        store.delete_node(stix_obj["id"], "unattached")
+                        report_id.append(stix_obj["id"])
     
-            elif stix_obj["type"] == "sighting":
-                if wrapped:
-                    add_node(stix_obj, "other")
+                elif stix_obj["type"] == "sighting":
+                    if wrapped:
+                        store.add_node(stix_obj, "other")
+                    else:
+                        nodes, edges = n_and_e.convert_sighting(stix_obj)
+                        store.add_node(nodes[0], "other")
+                        store.delete_node(stix_obj["id"], "unattached")
+                        report_id.append(stix_obj["id"])
                 else:
-                    nodes, edges = n_and_e.convert_sighting(stix_obj)
-                    add_node(nodes[0], TR_Incident_Context_Dir, "other")
-                    del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                    report_id.append(stix_obj["id"])
-            else:
-                # its a node-type of object
-                if stix_obj["type"] == "sequence":
-                    if stix_obj["step_type"] == "start_step":
+                    # its a node-type of object
+                    if stix_obj["type"] == "sequence":
+                        if stix_obj["step_type"] == "start_step":
+                            if wrapped:
+                                store.add_node(stix_obj, "start")
+                            else:
+                                nodes, edges = n_and_e.convert_node(stix_obj)
+                                store.add_node(nodes[0], "start")
+                                store.delete_node(stix_obj["id"], "unattached")
+                                report_id.append(stix_obj["id"])
+                        else:
+                            if wrapped:
+                                store.add_node(stix_obj, "sequence")
+                            else:
+                                nodes, edges = n_and_e.convert_node(stix_obj)
+                                store.add_node(nodes[0], "sequence")
+                                store.delete_node(stix_obj["id"], "unattached")
+                                report_id.append(stix_obj["id"])
+                    elif stix_obj["type"] == "task":
                         if wrapped:
-                            add_node(stix_obj, "start")
+                            store.add_node(stix_obj, "task")
                         else:
                             nodes, edges = n_and_e.convert_node(stix_obj)
-                            add_node(nodes[0], TR_Incident_Context_Dir, "start")
-                            del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
+                            store.add_node(nodes[0], "task")
+                            store.delete_node(stix_obj["id"], "unattached")
                             report_id.append(stix_obj["id"])
-                    else:
+                    elif stix_obj["type"] == "event":
                         if wrapped:
-                            add_node(stix_obj, "sequence")
+                            store.add_node(stix_obj, "event")
                         else:
                             nodes, edges = n_and_e.convert_node(stix_obj)
-                            add_node(nodes[0], TR_Incident_Context_Dir, "sequence")
-                            del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
+                            store.add_node(nodes[0], "event")
+                            store.delete_node(stix_obj["id"], "unattached")
+                            report_id.append(stix_obj["id"])
+                    elif stix_obj["type"] == "impact":
+                        if wrapped:
+                            store.add_node(stix_obj, "impact")
+                        else:
+                            nodes, edges = n_and_e.convert_node(stix_obj)
+                            store.add_node(nodes[0], "impact")
+                            store.delete_node(stix_obj["id"], "unattached")
+                            report_id.append(stix_obj["id"])
+                    elif stix_obj["type"] != "incident":
+                        if wrapped:
+                            store.add_node(stix_obj, "other")
+                        else:
+                            nodes, edges = n_and_e.convert_node(stix_obj)
+                            store.add_node(nodes[0], "other")
+                            store.delete_node(stix_obj["id"], "unattached")
                             report_id.append(stix_obj["id"])
-                elif stix_obj["type"] == "task":
-                    if wrapped:
-                        add_node(stix_obj, "task")
-                    else:
-                        nodes, edges = n_and_e.convert_node(stix_obj)
-                        add_node(nodes[0], TR_Incident_Context_Dir, "task")
-                        del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                        report_id.append(stix_obj["id"])
-                elif stix_obj["type"] == "event":
-                    if wrapped:
-                        add_node(stix_obj, "event")
-                    else:
-                        nodes, edges = n_and_e.convert_node(stix_obj)
-                        add_node(nodes[0], TR_Incident_Context_Dir, "event")
-                        del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                        report_id.append(stix_obj["id"])
-                elif stix_obj["type"] == "impact":
-                    if wrapped:
-                        add_node(stix_obj, "impact")
-                    else:
-                        nodes, edges = n_and_e.convert_node(stix_obj)
-                        add_node(nodes[0], TR_Incident_Context_Dir, "impact")
-                        del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                        report_id.append(stix_obj["id"])
-                elif stix_obj["type"] != "incident":
-                    if wrapped:
-                        add_node(stix_obj, "other")
                     else:
-                        nodes, edges = n_and_e.convert_node(stix_obj)
-                        add_node(nodes[0], TR_Incident_Context_Dir, "other")
-                        del_node(stix_obj["id"],TR_Incident_Context_Dir, "unattached")
-                        report_id.append(stix_obj["id"])
-                else:
-                    return "Error: You cannot promote an incident"
+                        return "Error: You cannot promote an incident"
+        # 5. Closing the context store compacts it, exporting the updated lists
 
     return " transferred from 'Unattached' to 'Other' -> " + str(report_id)
 
@@ -40,6 +40,7 @@ from stixorm.module.definitions.stix21 import (
     Relationship
 )
 from Block_Families.General._library.convert_n_and_e import convert_relns
+from Block_Families.General._library.context_store import open_context_store
 from stixorm.module.authorise import import_type_factory
 import json
 
@@ -141,51 +142,14 @@ def conv(stix_object):
             jdict[tim] = temp_string
     return jdict
 
-def add_node(node, context_type):
-    exists = False
-    stix_nodes_list = []
-    if os.path.exists(TR_Context_Memory_Dir + comp_data[context_type]):
-        with open(TR_Context_Memory_Dir + comp_data[context_type], "r") as mem_input:
-            stix_nodes_list = json.load(mem_input)
-            for i in range(len(stix_nodes_list)):
-                if stix_nodes_list[i]["id"] == node["id"]:
-                    stix_nodes_list[i] = node
-                    exists = True
-            if not exists:
-                stix_nodes_list.append(node)
-    else:
-        stix_nodes_list = [node]
-    with open(TR_Context_Memory_Dir + comp_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_nodes_list))
-
-
-def add_edge(edge, context_type):
-    exists = False
-    stix_edge_list = []
-    if os.path.exists(TR_Context_Memory_Dir + comp_data[context_type]):
-        with open(TR_Context_Memory_Dir + comp_data[context_type], "r") as mem_input:
-            stix_edge_list = json.load(mem_input)
-            for i in range(len(stix_edge_list)):
-                if stix_edge_list[i]["source"] == edge["source"] and stix_edge_list[i]["target"] == edge["target"]:
-                    stix_edge_list[i] = edge
-                    exists = True
-            if not exists:
-                stix_edge_list.append(edge)
-    else:
-        stix_edge_list = [edge]
-    with open(TR_Context_Memory_Dir + comp_data[context_type], 'w') as f:
-        f.write(json.dumps(stix_edge_list))
-
-
-
-def add_relation_to_context_memory(nodes, edges, relation_edges, relation_replacement_edges ):
-    add_node(nodes[0], "relations")
+def add_relation_to_context_memory(store, nodes, edges, relation_edges, relation_replacement_edges ):
+    store.add_node(nodes[0], "relations")
     for edge in edges:
-        add_edge(edge, "edges")
+        store.add_edge(edge, "edges")
     for edge in relation_edges:
-        add_edge(edge, "relation_edges")
+        store.add_edge(edge, "relation_edges")
     for edge in relation_replacement_edges:
-        add_edge(edge, "relation_replacement_edges")
+        store.add_edge(edge, "relation_replacement_edges")
 
 
 def update_company_relations(reln_type=None):
@@ -247,37 +211,39 @@ def update_company_relations(reln_type=None):
 
         # 5. if Me exists, or Team setup, then setup relationship_type
         reln_ids = []
-        if company:
-            if Object_lists["me"] and reln_type:
-                me_ident = Object_lists["me"][0]
-                temp_rel = Relationship(relationship_type=reln_type, source_ref=company["id"], target_ref=me_ident["id"])
-                nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
-                add_relation_to_context_memory(nodes, edges, relation_edges, relation_replacement_edges)
-                reln_ids.append(nodes[0]["id"])
-            if Object_lists["team"] !=  []: # and reln_type:
-                for team_ident in Object_lists["team"]:
-                    temp_rel = Relationship(relationship_type=reln_type, source_ref=company["id"], target_ref=team_ident["id"])
-                    nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
-                    add_relation_to_context_memory(nodes, edges, relation_edges, relation_replacement_edges)
-                    reln_ids.append(nodes[0]["id"])
-            if Object_lists["users"] != []:
-                for team_ident in Object_lists["users"]:
-                    temp_rel = Relationship(relationship_type='employed-by', source_ref=company["id"], target_ref=team_ident["id"])
-                    nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
-                    add_relation_to_context_memory(nodes, edges, relation_edges, relation_replacement_edges)
-                    reln_ids.append(nodes[0]["id"])
-            if Object_lists["assets"] != []:
-                for team_ident in Object_lists["assets"]:
-                    temp_rel = Relationship(relationship_type='asset-of', source_ref=company["id"], target_ref=team_ident["id"])
-                    nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
-                    add_relation_to_context_memory(nodes, edges, relation_edges, relation_replacement_edges)
-                    reln_ids.append(nodes[0]["id"])
-            if Object_lists["systems"] != []:
-                for team_ident in Object_lists["systems"]:
-                    temp_rel = Relationship(relationship_type='system-of', source_ref=company["id"], target_ref=team_ident["id"])
+        with open_context_store(TR_Context_Memory_Dir, comp_data) as store:
+            if company:
+                if Object_lists["me"] and reln_type:
+                    me_ident = Object_lists["me"][0]
+                    temp_rel = Relationship(relationship_type=reln_type, source_ref=company["id"], target_ref=me_ident["id"])
                     nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
-                    add_relation_to_context_memory(nodes, edges, relation_edges, relation_replacement_edges)
+                    add_relation_to_context_memory(store, nodes, edges, relation_edges, relation_replacement_edges)
                     reln_ids.append(nodes[0]["id"])
+                if Object_lists["team"] !=  []: # and reln_type:
+                    for team_ident in Object_lists["team"]:
+                        temp_rel = Relationship(relationship_type=reln_type, source_ref=company["id"], target_ref=team_ident["id"])
+                        nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
+                        add_relation_to_context_memory(store, nodes, edges, relation_edges, relation_replacement_edges)
+                        reln_ids.append(nodes[0]["id"])
+                if Object_lists["users"] != []:
+                    for team_ident in Object_lists["users"]:
+                        temp_rel = Relationship(relationship_type='employed-by', source_ref=company["id"], target_ref=team_ident["id"])
+                        nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
+                        add_relation_to_context_memory(store, nodes, edges, relation_edges, relation_replacement_edges)
+                        reln_ids.append(nodes[0]["id"])
+                if Object_lists["assets"] != []:
+                    for team_ident in Object_lists["assets"]:
+                        temp_rel = Relationship(relationship_type='asset-of', source_ref=company["id"], target_ref=team_ident["id"])
+                        nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
+                        add_relation_to_context_memory(store, nodes, edges, relation_edges, relation_replacement_edges)
+                        reln_ids.append(nodes[0]["id"])
+                if Object_lists["systems"] != []:
+                    for team_ident in Object_lists["systems"]:
+                        temp_rel = Relationship(relationship_type='system-of', source_ref=company["id"], target_ref=team_ident["id"])
+                        nodes, edges, relation_edges, relation_replacement_edges = convert_relns(conv(temp_rel))
+                        add_relation_to_context_memory(store, nodes, edges, relation_edges, relation_replacement_edges)
+                        reln_ids.append(nodes[0]["id"])
+        # 6. Closing the context store compacts it, exporting the updated lists
 
     # does file exist
     return_string = ""
@@ -59,7 +59,7 @@ from stixorm.module.authorise import import_type_factory
 from stixorm.module.typedb import TypeDBSource, TypeDBSink
 from stixorm.module.authorise import import_type_factory
 from posixpath import basename
-from Block_Families.General._library.update import find_list_diff, find_obj_diff, handle_object_diff
+from Block_Families.General._library.update import plan_list_diff, find_obj_diff, handle_object_diff, content_hashes
 import json
 import os
 
@@ -121,7 +121,7 @@ field_names = {
     "task" : "task_refs",
     "other" : "other_object_refs"
 }
-def load_context(OS_Threat_Context_Memory_Path):
+def load_context(OS_Threat_Context_Memory_Path, with_hashes=False):
     # 1. Load the OS_Triage
     with open(OS_Threat_Context_Memory_Path, "r") as context_file:
         OS_Threat_Context = json.load(context_file)
@@ -171,7 +171,15 @@ def load_context(OS_Threat_Context_Memory_Path):
         remote_list = remote_list + r_me + r_team + r_company + r_systems + r_assets
         second_list = sequence_start_objs + sequence_objs + task_objs + event_objs + impact_objs + other_object_objs
         second_list = second_list + me + team + company + systems + assets
+        #
+        # 6. The content hashes of the TypeDB objects, saved when they were synched, else hash them now
+        #
+        remote_hashes = remote.get("content_hashes")
+        if with_hashes and remote_hashes is None:
+            remote_hashes = content_hashes(remote_list)
 
+    if with_hashes:
+        return remote_list, r_incident_obj, second_list, incident_obj, remote_hashes
     return remote_list, r_incident_obj, second_list, incident_obj
 
 
@@ -204,8 +212,17 @@ def synch_context(OS_Threat_Context_Memory_Path):
         remote_context["company"] = local_context["company"]
         remote_context["systems"] = local_context["systems"]
         remote_context["assets"] = local_context["assets"]
+        #
+        # 4. Save the content hashes of the objects now in TypeDB, so the next update only diffs those that changed
+        #
+        remote_list = []
+        for objs in ["sequence_start_objs", "sequence_objs", "task_objs", "event_objs", "other_object_objs", "impact_objs"]:
+            remote_list += remote_incident[objs]
+        for objs in ["me", "team", "company", "systems", "assets"]:
+            remote_list += remote_context[objs]
+        remote["content_hashes"] = content_hashes(remote_list)
     #
-    # 4. Export the context
+    # 5. Export the context
     #
     with open(OS_Threat_Context_Memory_Path, 'w') as f:
         f.write(json.dumps(OS_Threat_Context))
@@ -218,10 +235,11 @@ def update_context(OS_Threat_Context_Memory_Path, connection, original_stix,  cu
     #OS_Threat_Context_Memory_Path = "./Orchestration/Context_Mem/OS_Threat_Context.json"
     # 1. First add the Step 1 objects to typedb
     #
-    t_original_list, t_original_incident_obj, current_list, current_incident_obj = load_context(OS_Threat_Context_Memory_Path)
+    t_original_list, t_original_incident_obj, current_list, current_incident_obj, t_original_hashes = load_context(OS_Threat_Context_Memory_Path, with_hashes=True)
     #
-    # 2. Find out the set operations between the lists of object already in TypeDB, and the list of objects now
-    delete_object_ids, add_objects_list, may_have_changed_list = find_list_diff(t_original_list, current_list)
+    # 2. Find out the set operations between the lists of object already in TypeDB, and the list of objects now,
+    # leaving out the objects whose content hash is unchanged
+    delete_object_ids, add_objects_list, may_have_changed_pairs = plan_list_diff(t_original_list, current_list, t_original_hashes)
     # 3. Setup TypeDB Sink and Source
     reinitilise = False
     typedb_sink = TypeDBSink(connection=connection, clear=reinitilise, import_type=import_type)
@@ -235,11 +253,10 @@ def update_context(OS_Threat_Context_Memory_Path, connection, original_stix,  cu
     print(f"\n delete_raw type is {type(delete_raw)} \n delete_raw is -> {delete_raw}")
     # 6. Calculate whether update is needed per object, if so push it
     change_list = []
-    for current_obj in may_have_changed_list:
-        orig_object = [x for x in t_original_list if x["id"] == current_obj["id"]]
-        obj_diff = find_obj_diff(orig_object[0], current_obj)
+    for orig_object, current_obj in may_have_changed_pairs:
+        obj_diff = find_obj_diff(orig_object, current_obj)
         if obj_diff != {}:
-            diff_report = handle_object_diff(obj_diff, orig_object[0], current_obj, connection)
+            diff_report = handle_object_diff(obj_diff, orig_object, current_obj, connection)
             change_list.append(diff_report)
     report = {}
     report["add_result"] = result_list
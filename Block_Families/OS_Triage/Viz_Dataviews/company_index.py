@@ -36,21 +36,21 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
+from urllib.request import urlretrieve
+import sys
+import importlib.util
 import json
-import copy
 
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-from stixorm.module.typedb_lib.factories.auth_factory import get_auth_factory_instance
-import_type = import_type_factory.get_all_imports()
-
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"}
 ]
 
 # OS_Triage Memory Stuff
@@ -103,7 +103,34 @@ comp_list = ["assets", "systems", "users"]
 
 
 
+def download_common(module_list):
+    for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
+        # Step 1: download the module
+        result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
+        print(f'common file result ->', result)
+        # Step 2: install the module
+
+
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
+
+
 def get_company_index():
+    # Load the context_store common file, which reads the lists from the context directory snapshot, when snapshots are turned on
+    if not os.path.exists(TR_Common_Files):
+        os.makedirs(TR_Common_Files)
+    download_common([common[1]])
+    context_store = import_common(common[1])
     show_sro = True
     company_index = {}
     stix_company_obj = {}
@@ -112,9 +139,6 @@ def get_company_index():
     possible = []
     relations = []
     stix_incident_id = ""
-    auth_factory = get_auth_factory_instance()
-    auth = auth_factory.get_auth_for_import(import_type)
-    auth_types = copy.deepcopy(auth["types"])
     local_map = {}
     with open(TR_Context_Memory_Dir + "/" + context_map, "r") as current_context:
         local_map = json.load(current_context)
@@ -122,13 +146,11 @@ def get_company_index():
         TR_Company_Context_Dir = TR_Context_Memory_Dir + "/" + current_company_dir
         # 2. open the company file, and then the assets, systems and users
         if os.path.exists(TR_Company_Context_Dir + comp_data["company"]):
-            with open(TR_Company_Context_Dir + comp_data["company"], "r") as mem_input:
-                stix_company_list = json.load(mem_input)
-                stix_company_obj = stix_company_list[0]
-                for key in comp_list:
-                    if os.path.exists(TR_Company_Context_Dir + comp_data[key]):
-                        with open(TR_Company_Context_Dir + comp_data[key], "r") as mem_input:
-                            comp_obj[key] = json.load(mem_input)
+            stix_company_list = context_store.load_context_list(TR_Company_Context_Dir, comp_data["company"])
+            stix_company_obj = stix_company_list[0]
+            for key in comp_list:
+                if os.path.exists(TR_Company_Context_Dir + comp_data[key]):
+                    comp_obj[key] = context_store.load_context_list(TR_Company_Context_Dir, comp_data[key])
         # 3. setup the root record
         if stix_company_obj != {}:
             company_index = stix_company_obj
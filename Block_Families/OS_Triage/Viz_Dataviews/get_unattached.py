@@ -36,19 +36,21 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
+from urllib.request import urlretrieve
+import sys
+import importlib.util
 import json
 
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
-
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"}
 ]
 
 # OS_Triage Memory Stuff
@@ -100,7 +102,34 @@ field_names = {
 key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 
+def download_common(module_list):
+    for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
+        # Step 1: download the module
+        result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
+        print(f'common file result ->', result)
+        # Step 2: install the module
+
+
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
+
+
 def get_unattached():
+    # Load the context_store common file, which reads the lists from the context directory snapshot, when snapshots are turned on
+    if not os.path.exists(TR_Common_Files):
+        os.makedirs(TR_Common_Files)
+    download_common([common[1]])
+    context_store = import_common(common[1])
     show_sro = True
     task_index = {}
     # 1. Setup variables
@@ -120,28 +149,24 @@ def get_unattached():
         TR_Incident_Context_Dir = TR_Context_Memory_Dir + "/" + current_incident_dir
         # 2. open files and fill lists
         if os.path.exists(TR_Incident_Context_Dir + incident_data["unattached"]):
-            with open(TR_Incident_Context_Dir + incident_data["unattached"], "r") as mem_input:
-                inc_nodes = json.load(mem_input)
+            inc_nodes = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["unattached"])
         if os.path.exists(TR_Incident_Context_Dir + incident_data["edges"]):
-            with open(TR_Incident_Context_Dir + incident_data["edges"], "r") as mem_input:
-                inc_edges = json.load(mem_input)
+            inc_edges = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["edges"])
         if os.path.exists(TR_Incident_Context_Dir + incident_data["relations"]):
-            with open(TR_Incident_Context_Dir + incident_data["relations"], "r") as mem_input:
-                relations = json.load(mem_input)
+            relations = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["relations"])
         if os.path.exists(TR_Incident_Context_Dir + incident_data["unattached_relations"]):
-            with open(TR_Incident_Context_Dir + incident_data["unattached_relations"], "r") as mem_input:
-                unattached_relations = json.load(mem_input)
-                relations = relations + unattached_relations
+            unattached_relations = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["unattached_relations"])
+            relations = relations + unattached_relations
         if os.path.exists(TR_Incident_Context_Dir + incident_data["relation_edges"]):
-            with open(TR_Incident_Context_Dir + incident_data["relation_edges"], "r") as mem_input:
-                relation_edges = json.load(mem_input)
+            relation_edges = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["relation_edges"])
         if os.path.exists(TR_Incident_Context_Dir + incident_data["relation_replacement_edges"]):
-            with open(TR_Incident_Context_Dir + incident_data["relation_replacement_edges"], "r") as mem_input:
-                relation_replacement_edges = json.load(mem_input)
+            relation_replacement_edges = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["relation_replacement_edges"])
         # 3. sort sightings by time
         nodes = inc_nodes
         node_ids = [x['id'] for x in nodes]
         print(f"node ids->{node_ids}")
+        # a set for the membership checks, as the list is printed
+        node_ids = set(node_ids)
         for rel in relations:
             if rel["original"]["source_ref"] in node_ids and rel["original"]["target_ref"] in node_ids:
                 if show_sro:
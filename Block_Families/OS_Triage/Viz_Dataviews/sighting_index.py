@@ -36,7 +36,9 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
+from urllib.request import urlretrieve
+import sys
+import importlib.util
 import json
 import copy
 
@@ -45,13 +47,13 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 from datetime import datetime
-from stixorm.module.typedb_lib.factories.auth_factory import get_auth_factory_instance
-import_type = import_type_factory.get_all_imports()
 
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"}
 ]
 
 # OS_Triage Memory Stuff
@@ -102,15 +104,45 @@ field_names = {
 key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 
+def download_common(module_list):
+    for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
+        # Step 1: download the module
+        result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
+        print(f'common file result ->', result)
+        # Step 2: install the module
+
+
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
+
+
 def get_sighting_index():
+    # Load the context_store common file, which reads the lists from the context directory snapshot, when snapshots are turned on
+    if not os.path.exists(TR_Common_Files):
+        os.makedirs(TR_Common_Files)
+    download_common([common[1]])
+    context_store = import_common(common[1])
     sighting_index = {}
     # 1. Setup variables
     sightings = []
     SDO = []
     SCO = []
     relationship = []
+    # stixorm is only needed here, to split the objects by family, so the block starts without loading it
+    from stixorm.module.authorise import import_type_factory
+    from stixorm.module.typedb_lib.factories.auth_factory import get_auth_factory_instance
     auth_factory = get_auth_factory_instance()
-    auth = auth_factory.get_auth_for_import(import_type)
+    auth = auth_factory.get_auth_for_import(import_type_factory.get_all_imports())
     auth_types = copy.deepcopy(auth["types"])
     # 1.B Find Current Incident directory
     local_map = {}
@@ -120,19 +152,18 @@ def get_sighting_index():
         TR_Incident_Context_Dir = TR_Context_Memory_Dir + "/" + current_incident_dir
         # 2. open "others" list file, and split it into chunks
         if os.path.exists(TR_Incident_Context_Dir + incident_data["other"]):
-            with open(TR_Incident_Context_Dir + incident_data["other"], "r") as mem_input:
-                stix_others_list = json.load(mem_input)
-                for stix_obj in stix_others_list:
-                    if stix_obj["type"] == "sighting":
-                        sightings.append(stix_obj)
-                    elif stix_obj["type"] in auth_types["sdo"]:
-                        SDO.append(stix_obj)
-                    elif stix_obj["type"] in auth_types["sco"]:
-                        SCO.append(stix_obj)
-                    elif stix_obj["type"] == "relationship":
-                        relationship.append(stix_obj)
-                    else:
-                        return {"result": "error, type is unknown"}
+            stix_others_list = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["other"])
+            for stix_obj in stix_others_list:
+                if stix_obj["type"] == "sighting":
+                    sightings.append(stix_obj)
+                elif stix_obj["type"] in auth_types["sdo"]:
+                    SDO.append(stix_obj)
+                elif stix_obj["type"] in auth_types["sco"]:
+                    SCO.append(stix_obj)
+                elif stix_obj["type"] == "relationship":
+                    relationship.append(stix_obj)
+                else:
+                    return {"result": "error, type is unknown"}
         total_obs_components = SCO + relationship
         # 3. sort sightings by time
         sighting_index["name"] = "Evidence List"
@@ -36,22 +36,23 @@ where_am_i = os.path.dirname(os.path.abspath(__file__))
 # This code is licensed under the terms of the Apache 2.
 ##############################################################################
 
-from stixorm.module.authorise import import_type_factory
+from urllib.request import urlretrieve
+import sys
+import importlib.util
 import json
-import copy
 
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 from datetime import datetime
-from stixorm.module.typedb_lib.factories.auth_factory import get_auth_factory_instance
-import_type = import_type_factory.get_all_imports()
 
 # Common File Stuff
 TR_Common_Files = "./generated/os-triage/common_files"
+common_loader = {"module": "common_loader", "file": "common_loader.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/common_loader.py"}
 common = [
-    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"}
+    {"module": "convert_n_and_e", "file": "convert_n_and_e.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/convert_n_and_e.py"},
+    {"module": "context_store", "file": "context_store.py", "url" : "https://raw.githubusercontent.com/typerefinery-ai/brett_blocks/main/Block_Families/General/_library/context_store.py"}
 ]
 
 # OS_Triage Memory Stuff
@@ -102,7 +103,34 @@ field_names = {
 key_list = ["start", "sequence", "impact", "event", "task", "other"]
 
 
+def download_common(module_list):
+    for module in module_list:
+        if os.path.exists(TR_Common_Files + "/" + module["file"]):
+            continue
+        # Step 1: download the module
+        result = urlretrieve(module["url"], TR_Common_Files + "/" + module["file"])
+        print(f'common file result ->', result)
+        # Step 2: install the module
+
+
+def import_common(module):
+    # Common files are loaded once per process, and reused while unchanged, by the common_loader common file
+    loader = sys.modules.get(common_loader["module"])
+    if loader is None:
+        download_common([common_loader])
+        spec = importlib.util.spec_from_file_location(common_loader["module"], TR_Common_Files + '/' + common_loader["file"])
+        loader = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(loader)
+        sys.modules[common_loader["module"]] = loader
+    return loader.import_common_file(module["module"], TR_Common_Files + '/' + module["file"])
+
+
 def get_task_index():
+    # Load the context_store common file, which reads the lists from the context directory snapshot, when snapshots are turned on
+    if not os.path.exists(TR_Common_Files):
+        os.makedirs(TR_Common_Files)
+    download_common([common[1]])
+    context_store = import_common(common[1])
     show_sro = True
     task_index = {}
     # 1. Setup variables
@@ -110,9 +138,6 @@ def get_task_index():
     possible = []
     relations = []
     stix_incident_id = ""
-    auth_factory = get_auth_factory_instance()
-    auth = auth_factory.get_auth_for_import(import_type)
-    auth_types = copy.deepcopy(auth["types"])
     local_map = {}
     with open(TR_Context_Memory_Dir + "/" + context_map, "r") as current_context:
         local_map = json.load(current_context)
@@ -120,25 +145,22 @@ def get_task_index():
         TR_Incident_Context_Dir = TR_Context_Memory_Dir + "/" + current_incident_dir
         # 2. open "others" list file, and split it into chunks
         if os.path.exists(TR_Incident_Context_Dir + incident_data["incident"]):
-            with open(TR_Incident_Context_Dir + incident_data["incident"], "r") as mem_input:
-                stix_incident_obj = json.load(mem_input)
-                stix_incident_id = stix_incident_obj[0]["id"]
+            stix_incident_obj = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["incident"])
+            stix_incident_id = stix_incident_obj[0]["id"]
         if os.path.exists(TR_Incident_Context_Dir + incident_data["task"]):
-            with open(TR_Incident_Context_Dir + incident_data["task"], "r") as mem_input:
-                stix_task_list = json.load(mem_input)
-                for stix_obj in stix_task_list:
-                    if stix_obj["type"] == "task":
-                        tasks.append(stix_obj)
-                    else:
-                        return {"result": "error, type is not task"}
+            stix_task_list = context_store.load_context_list(TR_Incident_Context_Dir, incident_data["task"])
+            for stix_obj in stix_task_list:
+                if stix_obj["type"] == "task":
+                    tasks.append(stix_obj)
+                else:
+                    return {"result": "error, type is not task"}
         for key in key_list:
             if os.path.exists(TR_Incident_Context_Dir + incident_data[key]):
-                with open(TR_Incident_Context_Dir + incident_data[key], "r") as mem_input:
-                    stix_obj_list = json.load(mem_input)
-                    if key == "relations":
-                        relations = stix_obj_list
-                    else:
-                        possible = possible + stix_obj_list
+                stix_obj_list = context_store.load_context_list(TR_Incident_Context_Dir, incident_data[key])
+                if key == "relations":
+                    relations = stix_obj_list
+                else:
+                    possible = possible + stix_obj_list
         # 3. sort sightings by time
         if tasks != []:
             sorted_list = sorted(tasks, key=lambda t: datetime.strptime(t["original"]["created"], "%Y-%m-%dT%H:%M:%S.%fZ"))
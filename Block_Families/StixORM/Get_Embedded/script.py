@@ -38,19 +38,14 @@ sys.path.append(where_am_i)
 ##############################################################################
 
 
-from stixorm.module.typedb import TypeDBSource
-from stixorm.module.authorise import import_type_factory
 from posixpath import basename
 import json
 import copy
 import os
-import sys
-import argparse
 import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-import_type = import_type_factory.get_all_imports()
 
 
 def get_embedded_links(stix_object):
@@ -14,7 +14,7 @@
 
 from stixorm.module.typedb import TypeDBSink, TypeDBSource
 from stixorm.module.authorise import import_type_factory
-from Block_Families.General._library.update import handle_object_diff, find_list_diff, find_obj_diff
+from Block_Families.General._library.update import handle_object_diff, plan_list_diff, find_obj_diff
 from Block_Families.OS_Triage.Update_Context.update_context import load_context, synch_context
 from Block_Families.OS_Triage.Open_Incident.get_default_incidents_objects import get_default_incidents_objects
 
@@ -243,13 +243,13 @@ def compare_incidents():
     #updated_list = vary_current_list(changed_list)
     #
     # 2. Find out the set operations between the lists of object already in TypeDB, and the list of objects now
-    delete_object_ids, add_objects_list, may_have_changed_list = find_list_diff(original_list, changed_list)
+    delete_object_ids, add_objects_list, may_have_changed_pairs = plan_list_diff(original_list, changed_list)
+    may_have_changed_list = [current_obj for _, current_obj in may_have_changed_pairs]
     # 3. Calculate whether update is needed per object, if so push it
-    for current_obj in may_have_changed_list:
-        orig_object = [x for x in original_list if x["id"] == current_obj["id"]]
-        obj_diff = find_obj_diff(orig_object[0], current_obj)
+    for orig_object, current_obj in may_have_changed_pairs:
+        obj_diff = find_obj_diff(orig_object, current_obj)
         if obj_diff != {}:
-            diff_report_list.append(handle_object_diff(obj_diff, orig_object[0], current_obj, connection, all_imports))
+            diff_report_list.append(handle_object_diff(obj_diff, orig_object, current_obj, connection, all_imports))
 
 
     # 4. Now process the incident diff
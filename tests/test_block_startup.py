@@ -0,0 +1,63 @@
+"""
+Block Cold-Start Tests
+"""
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+
+repo_root = Path(__file__).parent.parent
+triage_dir = repo_root / "Block_Families" / "OS_Triage"
+
+# Generous import time ceiling, in seconds, of a block in each OS_Triage family, so slow machines still pass
+startup_ceilings = {
+    "Create_Context": 1.0,
+    "Form_Actions": 1.0,
+    "Get_Context": 1.0,
+    "Mouse": 1.0,
+    "Open_Incident": 1.0,
+    "Save_Context": 1.0,
+    "Update_Context": 1.0,
+    "Viz_Dataviews": 1.0,
+}
+# Import time ceiling, in seconds, of a block that loads stixorm
+stixorm_ceiling = 10.0
+# Blocks that use stixorm on every run, e.g. to parse objects or sync TypeDB, so load it when they start
+stixorm_blocks = {
+    "Form_Actions/get_connections",
+    "Mouse/get_connection_types",
+    "Mouse/get_relationship_types",
+    "Update_Context/update_company_relations",
+    "Update_Context/update_context",
+}
+
+measure_import = (
+    "import importlib, sys, time\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "print(time.perf_counter() - start, 'stixorm' in sys.modules)\n"
+)
+
+
+def triage_blocks():
+    for path in sorted(triage_dir.glob("*/*.py")):
+        if path.name != "__init__.py":
+            yield path.parent.name + "/" + path.stem
+
+
+@pytest.mark.startup
+@pytest.mark.parametrize("block", list(triage_blocks()))
+def test_block_startup(block):
+    """Verify each block imports in a fresh process within its family's ceiling, loading stixorm only if it must"""
+    module = "Block_Families.OS_Triage." + block.replace("/", ".")
+    result = subprocess.run([sys.executable, "-c", measure_import, module],
+                            capture_output=True, text=True, cwd=repo_root)
+    assert result.returncode == 0, result.stderr
+    seconds, loaded_stixorm = result.stdout.split()[-2:]
+
+    if block in stixorm_blocks:
+        assert float(seconds) < stixorm_ceiling, f"{block} took {seconds}s to import"
+    else:
+        assert loaded_stixorm == "False", f"{block} loads stixorm when it starts"
+        assert float(seconds) < startup_ceilings[block.split("/")[0]], f"{block} took {seconds}s to import"
@@ -0,0 +1,541 @@
+"""
+Context Memory Storage Tests
+"""
+import pytest
+import importlib.util
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from Block_Families.General._library import context_store
+from Block_Families.General._library.context_store import (
+    open_context_store, edge_key, IncidentRefs, SQLiteContextStore, ContextLock, incident_ext_id,
+    journal_file, journal_line, read_journal, recover_journal, snapshot_file, ContextSnapshot, write_snapshot,
+    load_context_list
+)
+
+
+incident_data = {
+    "incident": "/incident.json",
+    "other": "/other_object_refs.json",
+    "unattached": "/unattached_objs.json",
+    "edges": "/incident_edges.json",
+    "relation_edges": "/relation_edges.json",
+}
+
+
+field_names = {
+    "task": "task_refs",
+    "other": "other_object_refs",
+}
+
+
+def make_node(stix_id, name="node"):
+    return {"id": stix_id, "type": stix_id.split("--")[0], "name": name}
+
+
+def make_edge(source, target, name="refers-to", stix_id=None):
+    edge = {"source": source, "target": target, "id": source + "-" + target, "name": name}
+    if stix_id:
+        edge["stix-id"] = stix_id
+    return edge
+
+
+def read_list(context_dir, context_type):
+    with open(str(context_dir) + incident_data[context_type], "r") as f:
+        return json.load(f)
+
+
+@pytest.mark.context
+def test_close_exports_json_lists(tmp_path):
+    """Verify closing the store writes the same JSON lists the Viz blocks read"""
+    store = open_context_store(str(tmp_path), incident_data)
+    store.add_node(make_node("identity--1"), "other")
+    store.add_node(make_node("identity--2"), "other")
+    store.add_edge(make_edge("identity--1", "identity--2"), "edges")
+    store.close()
+
+    assert [x["id"] for x in read_list(tmp_path, "other")] == ["identity--1", "identity--2"]
+    assert read_list(tmp_path, "edges")[0]["target"] == "identity--2"
+    assert not os.path.exists(str(tmp_path) + journal_file)
+
+
+@pytest.mark.context
+def test_upsert_keeps_position(tmp_path):
+    """Verify replacing a node or edge keeps its place in the list"""
+    with open_context_store(str(tmp_path), incident_data) as store:
+        store.add_node(make_node("identity--1"), "other")
+        store.add_node(make_node("identity--2"), "other")
+        store.add_node(make_node("identity--1", "renamed"), "other")
+        store.add_edge(make_edge("identity--1", "identity--2"), "edges")
+        store.add_edge(make_edge("identity--1", "identity--2", "created-by"), "edges")
+
+    nodes = read_list(tmp_path, "other")
+    assert [x["id"] for x in nodes] == ["identity--1", "identity--2"]
+    assert nodes[0]["name"] == "renamed"
+    assert [x["name"] for x in read_list(tmp_path, "edges")] == ["created-by"]
+
+
+@pytest.mark.context
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_edge_identity_includes_stix_id(tmp_path, backend):
+    """Verify edges between the same objects from different relationships are kept apart"""
+    with open_context_store(str(tmp_path), incident_data, backend=backend) as store:
+        for context_type in ["edges", "relation_edges"]:
+            store.add_edge(make_edge("identity--1", "identity--2", "uses", "relationship--1"), context_type)
+            store.add_edge(make_edge("identity--1", "identity--2", "targets", "relationship--2"), context_type)
+            store.add_edge(make_edge("identity--1", "identity--2", "related-to", "relationship--1"), context_type)
+        key = edge_key(make_edge("identity--1", "identity--2", stix_id="relationship--1"))
+        assert store.get("relation_edges", key)["name"] == "related-to"
+
+    for context_type in ["edges", "relation_edges"]:
+        assert [x["name"] for x in read_list(tmp_path, context_type)] == ["related-to", "targets"]
+
+
+@pytest.mark.context
+def test_delete_node(tmp_path):
+    """Verify a deleted node is removed from the exported list"""
+    with open_context_store(str(tmp_path), incident_data) as store:
+        store.add_node(make_node("identity--1"), "unattached")
+        store.add_node(make_node("identity--2"), "unattached")
+    with open_context_store(str(tmp_path), incident_data) as store:
+        assert store.delete_node("identity--1", "unattached")
+        assert not store.delete_node("identity--9", "unattached")
+
+    assert [x["id"] for x in read_list(tmp_path, "unattached")] == ["identity--2"]
+
+
+@pytest.mark.context
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_save_objects_writes_only_changes(tmp_path, backend):
+    """Verify a re-saved object writes only its changed node and edges, and removes the edges it lost"""
+    node = make_node("identity--1")
+    edges = {"edges": [make_edge("identity--1", "identity--2"), make_edge("identity--1", "identity--3")]}
+    with open_context_store(str(tmp_path), incident_data, backend=backend) as store:
+        assert store.save_objects([("other", node, edges, None)]) == {"nodes": 1, "edges": 2, "removed": 0}
+        store.add_edge(make_edge("identity--4", "identity--1"), "edges")
+
+    changed = {"edges": [make_edge("identity--1", "identity--2"), make_edge("identity--1", "identity--5")]}
+    with open_context_store(str(tmp_path), incident_data, backend=backend) as store:
+        assert store.save_objects([("other", node, edges, edges)]) == {"nodes": 0, "edges": 0, "removed": 0}
+        assert store.save_objects([("other", node, changed, edges)]) == {"nodes": 0, "edges": 1, "removed": 1}
+
+    assert [x["target"] for x in read_list(tmp_path, "edges")] == ["identity--2", "identity--1", "identity--5"]
+
+
+@pytest.mark.context
+def test_journal_replays_edge_deletes(tmp_path):
+    """Verify a committed edge removal is recovered after an interrupted run"""
+    with open_context_store(str(tmp_path), incident_data) as store:
+        store.add_edges([make_edge("identity--1", "identity--2"), make_edge("identity--1", "identity--3")], "edges")
+    store = open_context_store(str(tmp_path), incident_data)
+    assert store.delete_edges([("identity--1", "identity--2", None), ("identity--1", "identity--9", None)], "edges") == 1
+    store.commit()
+    simulate_crash(store)
+
+    with open_context_store(str(tmp_path), incident_data):
+        pass
+    assert [x["target"] for x in read_list(tmp_path, "edges")] == ["identity--3"]
+
+
+def simulate_crash(store):
+    # drop the store without exporting its lists, leaving the journal behind
+    store._journal.close()
+    store._lock.release()
+
+
+@pytest.mark.context
+def test_journal_replayed_after_interrupted_run(tmp_path):
+    """Verify committed mutations of a run that never closed its store are recovered"""
+    store = open_context_store(str(tmp_path), incident_data)
+    store.add_node(make_node("identity--1"), "other")
+    store.delete_node("identity--1", "other")
+    store.add_node(make_node("identity--2"), "other")
+    store.add_edge(make_edge("identity--2", "identity--3"), "edges")
+    store.commit()
+    simulate_crash(store)
+    assert not os.path.exists(str(tmp_path) + incident_data["other"])
+
+    with open_context_store(str(tmp_path), incident_data) as recovered:
+        assert recovered.get_ids("other") == ["identity--2"]
+        assert not os.path.exists(str(tmp_path) + journal_file)
+    assert [x["id"] for x in read_list(tmp_path, "other")] == ["identity--2"]
+    assert len(read_list(tmp_path, "edges")) == 1
+
+
+@pytest.mark.context
+def test_journal_discards_uncommitted_and_torn_records(tmp_path):
+    """Verify recovery applies whole committed groups only"""
+    store = open_context_store(str(tmp_path), incident_data)
+    store.add_node(make_node("identity--1"), "other")
+    store.commit()
+    store.add_node(make_node("identity--2"), "other")
+    store._journal.write(journal_line({"op": "put", "file": incident_data["other"], "edge": False,
+                                       "record": make_node("identity--2")}))
+    store._journal.write('0badc0de {"op": "commit"')
+    simulate_crash(store)
+
+    assert recover_journal(str(tmp_path)) == 1
+    assert [x["id"] for x in read_list(tmp_path, "other")] == ["identity--1"]
+
+
+@pytest.mark.context
+def test_group_commit(tmp_path):
+    """Verify mutations are buffered and fsynced to the journal in groups"""
+    store = open_context_store(str(tmp_path), incident_data, group_commit_size=4)
+    store.add_nodes([make_node(f"identity--{i}") for i in range(3)], "other")
+    assert not os.path.exists(str(tmp_path) + journal_file)
+    store.add_edge(make_edge("identity--0", "identity--1"), "edges")
+    store.add_node(make_node("identity--3"), "unattached")
+
+    assert store.get_ids("other") == [f"identity--{i}" for i in range(3)]
+    assert store.get("edges", ("identity--0", "identity--1", None))["target"] == "identity--1"
+    assert len(read_journal(str(tmp_path) + journal_file)) == 4
+    store.close()
+    assert len(read_list(tmp_path, "unattached")) == 1
+    assert not os.path.exists(str(tmp_path) + journal_file)
+
+
+@pytest.mark.context
+def test_compaction_threshold(tmp_path):
+    """Verify the lists are exported and the journal removed once it passes the threshold"""
+    store = open_context_store(str(tmp_path), incident_data, compact_threshold=3, group_commit_size=1)
+    for i in range(3):
+        store.add_node(make_node(f"identity--{i}"), "other")
+
+    assert len(read_list(tmp_path, "other")) == 3
+    assert not os.path.exists(str(tmp_path) + journal_file)
+    store.close()
+
+
+@pytest.mark.context
+def test_incident_refs_flushed_once_on_commit(tmp_path):
+    """Verify buffered ref registrations update the incident once, skipping duplicates"""
+    incident = {"id": "incident--1", "original": {"extensions": {incident_ext_id: {"task_refs": ["task--1"]}}}}
+    with open_context_store(str(tmp_path), incident_data) as store:
+        store.add_node(incident, "incident")
+    store = open_context_store(str(tmp_path), incident_data)
+    refs = IncidentRefs(store, field_names)
+    for stix_id, field in [("task--1", "task"), ("task--2", "task"), ("identity--1", "other"), ("task--2", "task")]:
+        refs.add(stix_id, field)
+    assert store.get("incident", "incident--1") == incident
+    store.close()
+
+    incident_ext = read_list(tmp_path, "incident")[0]["original"]["extensions"][incident_ext_id]
+    assert incident_ext["task_refs"] == ["task--1", "task--2"]
+    assert incident_ext["other_object_refs"] == ["identity--1"]
+    assert not refs.flush()
+
+
+@pytest.mark.context
+def test_incident_refs_wait_for_incident(tmp_path):
+    """Verify refs registered before the directory has an incident are kept for the incident saved later"""
+    incident = {"id": "incident--1", "original": {"extensions": {incident_ext_id: {}}}}
+    with open_context_store(str(tmp_path), incident_data) as store:
+        refs = IncidentRefs(store, field_names)
+        refs.add("task--1", "task")
+        assert not refs.flush()
+        store.commit()
+        store.add_node(incident, "incident")
+
+    incident_ext = read_list(tmp_path, "incident")[0]["original"]["extensions"][incident_ext_id]
+    assert incident_ext["task_refs"] == ["task--1"]
+
+
+@pytest.mark.context
+def test_sqlite_exports_same_lists(tmp_path):
+    """Verify the sqlite backend exports the same JSON lists as the json backend"""
+    json_dir = tmp_path / "json"
+    sqlite_dir = tmp_path / "sqlite"
+    json_dir.mkdir()
+    sqlite_dir.mkdir()
+    for context_dir, backend in [(json_dir, "json"), (sqlite_dir, "sqlite")]:
+        with open_context_store(str(context_dir), incident_data, backend=backend) as store:
+            store.add_nodes([make_node(f"identity--{i}") for i in range(4)], "other")
+            store.add_node(make_node("identity--1", "renamed"), "other")
+            store.delete_node("identity--2", "other")
+            store.add_edges([make_edge("identity--0", f"identity--{i}") for i in range(1, 4)], "edges")
+            store.add_edge(make_edge("identity--0", "identity--1", "created-by"), "edges")
+
+    for context_type in ["other", "edges"]:
+        assert read_list(json_dir, context_type) == read_list(sqlite_dir, context_type)
+    assert os.path.exists(str(sqlite_dir) + "/context_mem.sqlite3")
+
+
+@pytest.mark.context
+def test_sqlite_indexed_lookups(tmp_path):
+    """Verify the sqlite backend lookups by id, type and edge endpoint"""
+    with open_context_store(str(tmp_path), incident_data, backend="sqlite") as store:
+        store.add_nodes([make_node("identity--1"), make_node("task--1"), make_node("task--2")], "other")
+        store.add_edges([make_edge("task--1", "identity--1"), make_edge("task--2", "task--1")], "edges")
+
+        assert store.get("other", "task--2")["id"] == "task--2"
+        assert store.get("other", "task--9") is None
+        assert [x["id"] for x in store.get_by_type("other", "task")] == ["task--1", "task--2"]
+        assert len(store.get_edges_for("edges", "task--1")) == 2
+        assert store.get_ids("edges") == [("task--1", "identity--1", None), ("task--2", "task--1", None)]
+
+
+@pytest.mark.context
+def test_sqlite_uncommitted_run_rolled_back(tmp_path):
+    """Verify a run that never closes its store leaves the database and lists unchanged"""
+    with open_context_store(str(tmp_path), incident_data, backend="sqlite") as store:
+        store.add_node(make_node("identity--1"), "other")
+    store = SQLiteContextStore(str(tmp_path), incident_data)
+    store.add_node(make_node("identity--2"), "other")
+    store.add_edge(make_edge("identity--1", "identity--2"), "edges")
+    # simulate a crash, nothing is committed or exported
+    store._conn.close()
+    store._lock.release()
+
+    with open_context_store(str(tmp_path), incident_data, backend="sqlite") as store:
+        assert store.get_ids("other") == ["identity--1"]
+        assert not store.exists("edges")
+    assert [x["id"] for x in read_list(tmp_path, "other")] == ["identity--1"]
+
+
+@pytest.mark.context
+def test_sqlite_reimports_changed_json(tmp_path):
+    """Verify a list written to JSON by another block is picked up by the sqlite backend"""
+    with open_context_store(str(tmp_path), incident_data, backend="sqlite") as store:
+        store.add_node(make_node("identity--1"), "other")
+    with open(str(tmp_path) + incident_data["other"], "w") as f:
+        f.write(json.dumps([make_node("identity--7"), make_node("identity--8")]))
+
+    with open_context_store(str(tmp_path), incident_data, backend="sqlite") as store:
+        assert store.get_ids("other") == ["identity--7", "identity--8"]
+
+
+@pytest.mark.context
+def test_unknown_backend(tmp_path):
+    """Verify an unknown backend name is rejected"""
+    with pytest.raises(ValueError):
+        open_context_store(str(tmp_path), incident_data, backend="csv")
+
+
+def add_nodes_in_own_store(context_dir, backend, prefix, count):
+    for i in range(count):
+        with open_context_store(context_dir, incident_data, backend=backend) as store:
+            store.add_node(make_node(f"identity--{prefix}-{i}"), "other")
+
+
+@pytest.mark.context
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_concurrent_threads_lose_no_nodes(tmp_path, backend):
+    """Verify read-modify-write runs on parallel threads are serialised by the directory lock"""
+    threads = [threading.Thread(target=add_nodes_in_own_store, args=(str(tmp_path), backend, t, 10))
+               for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(read_list(tmp_path, "other")) == 40
+    assert [x for x in os.listdir(tmp_path) if x.endswith(".tmp")] == []
+
+
+@pytest.mark.context
+def test_concurrent_processes_lose_no_nodes(tmp_path):
+    """Verify read-modify-write runs in parallel processes are serialised by the directory lock"""
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        list(pool.map(add_nodes_in_own_store, [str(tmp_path)] * 3, ["json"] * 3, range(3), [10] * 3))
+
+    assert len(read_list(tmp_path, "other")) == 30
+
+
+@pytest.mark.context
+def test_nested_open_shares_the_store(tmp_path):
+    """Verify a nested open in the same thread reuses the open store, so neither overwrites the other"""
+    outer = open_context_store(str(tmp_path), incident_data)
+    outer.add_node(make_node("a--1"), "other")
+    with open_context_store(str(tmp_path), incident_data) as inner:
+        assert inner is outer
+        inner.add_node(make_node("b--1"), "other")
+    assert read_list(tmp_path, "other") == [make_node("a--1"), make_node("b--1")]
+    outer.add_node(make_node("c--1"), "other")
+    outer.close()
+    assert [x["id"] for x in read_list(tmp_path, "other")] == ["a--1", "b--1", "c--1"]
+    with pytest.raises(RuntimeError):
+        with open_context_store(str(tmp_path), incident_data):
+            ContextLock(str(tmp_path)).acquire()
+
+
+@pytest.mark.context
+def test_nested_open_rejects_a_different_file(tmp_path):
+    """Verify a nested open mapping a context type to another file raises, rather than writing the outer file"""
+    with open_context_store(str(tmp_path), incident_data) as outer:
+        with pytest.raises(ValueError, match="other"):
+            open_context_store(str(tmp_path), {**incident_data, "other": "other_nodes.json"})
+        assert outer._opens == 1
+        with open_context_store(str(tmp_path), {"other": incident_data["other"], "extra": "extra.json"}) as inner:
+            assert inner.file_map["extra"] == "extra.json"
+    assert not (tmp_path / "other_nodes.json").exists()
+
+
+@pytest.mark.context
+def test_nested_open_across_module_copies(tmp_path):
+    """Verify a copy of the module loaded by file path reuses the store opened through the package"""
+    module_path = os.path.join(os.path.dirname(context_store.__file__), "context_store.py")
+    spec = importlib.util.spec_from_file_location("context_store_copy", module_path)
+    module_copy = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module_copy)
+    with open_context_store(str(tmp_path), incident_data) as outer:
+        outer.add_node(make_node("a--1"), "other")
+        with module_copy.open_context_store(str(tmp_path), incident_data, lock_timeout=0.1) as inner:
+            assert inner is outer
+            inner.add_node(make_node("b--1"), "other")
+    assert [x["id"] for x in read_list(tmp_path, "other")] == ["a--1", "b--1"]
+
+
+@pytest.mark.context
+def test_lock_times_out_for_another_thread(tmp_path):
+    """Verify another thread waits for the lock, and times out"""
+    store = open_context_store(str(tmp_path), incident_data)
+    errors = []
+
+    def wait_for_lock():
+        try:
+            open_context_store(str(tmp_path), incident_data, lock_timeout=0.1)
+        except TimeoutError as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=wait_for_lock)
+    waiter.start()
+    waiter.join()
+    store.close()
+    assert len(errors) == 1
+
+
+def make_wrapped(stix_id, name="node"):
+    original = {"id": stix_id, "type": stix_id.split("--")[0], "name": name, "description": "x" * 200}
+    return {"id": stix_id, "type": original["type"], "original": original, "icon": original["type"]}
+
+
+@pytest.mark.context
+def test_store_copies_nodes_on_insert(tmp_path):
+    """Verify changing a saved object afterwards does not change the stored node"""
+    node = make_wrapped("identity--1")
+    with open_context_store(str(tmp_path), incident_data) as store:
+        store.add_node(node, "other")
+        node["original"]["name"] = "changed"
+        node["name"] = "changed"
+        assert store.get("other", "identity--1") == make_wrapped("identity--1")
+    assert read_list(tmp_path, "other") == [make_wrapped("identity--1")]
+
+
+@pytest.mark.context
+def test_store_copies_edges_on_insert(tmp_path):
+    """Verify changing a saved edge afterwards does not change the stored or journaled edge"""
+    edge = make_edge("a--1", "b--1")
+    store = open_context_store(str(tmp_path), incident_data)
+    store.add_edge(edge, "edges")
+    edge["name"] = "changed"
+    assert store.get("edges", edge_key(edge)) == make_edge("a--1", "b--1")
+    store.commit()
+    assert [x["record"] for x in read_journal(str(tmp_path) + journal_file)] == [make_edge("a--1", "b--1")]
+    store.close()
+    assert read_list(tmp_path, "edges") == [make_edge("a--1", "b--1")]
+
+
+@pytest.mark.context
+def test_journal_moves_an_original_between_lists(tmp_path):
+    """Verify an original moved between lists is journaled inline with each node, and recovered into its new list"""
+    node = make_wrapped("identity--1")
+    store = open_context_store(str(tmp_path), incident_data)
+    store.add_node(node, "unattached")
+    store.delete_node("identity--1", "unattached")
+    store.add_node(node, "other")
+    node["original"]["name"] = "changed"
+    store.commit()
+
+    entries = read_journal(str(tmp_path) + journal_file)
+    assert [x["op"] for x in entries] == ["put", "del", "put"]
+    assert entries[2]["record"] == make_wrapped("identity--1")
+    simulate_crash(store)
+    recover_journal(str(tmp_path))
+    assert read_list(tmp_path, "other") == [make_wrapped("identity--1")]
+    assert read_list(tmp_path, "unattached") == []
+
+
+@pytest.mark.context
+def test_sqlite_stores_each_original_once(tmp_path):
+    """Verify the sqlite backend keeps one copy of an original shared by several lists"""
+    with open_context_store(str(tmp_path), incident_data, backend="sqlite") as store:
+        store.add_node(make_wrapped("identity--1"), "unattached")
+        store.add_node(make_wrapped("identity--1"), "other")
+        store.add_node(make_wrapped("identity--2"), "other")
+        assert store._conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0] == 2
+        assert store.get("other", "identity--1") == make_wrapped("identity--1")
+        store.delete_node("identity--2", "other")
+
+    assert read_list(tmp_path, "unattached") == [make_wrapped("identity--1")]
+    assert list(read_list(tmp_path, "other")[0].keys()) == ["id", "type", "original", "icon"]
+    with open_context_store(str(tmp_path), incident_data, backend="sqlite") as store:
+        assert store._conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0] == 1
+
+
+@pytest.mark.context
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_snapshot_matches_json_lists(tmp_path, backend):
+    """Verify the snapshot written on close holds the exported lists, with each record found by key"""
+    with open_context_store(str(tmp_path), incident_data, backend=backend, snapshot=True) as store:
+        store.add_nodes([make_node("identity--1"), make_node("identity-\u00e9--2", "caf\u00e9")], "other")
+        store.add_edges([make_edge("identity--1", "identity--2", stix_id="relationship--1")], "edges")
+
+    snapshot = ContextSnapshot.load(str(tmp_path) + snapshot_file)
+    assert snapshot.get_list(incident_data["other"]) == read_list(tmp_path, "other")
+    assert snapshot.get(incident_data["other"], "identity-\u00e9--2")["name"] == "caf\u00e9"
+    edge = snapshot.get(incident_data["edges"], ("identity--1", "identity--2", "relationship--1"))
+    assert edge == read_list(tmp_path, "edges")[0]
+    assert load_context_list(str(tmp_path), incident_data["edges"]) == read_list(tmp_path, "edges")
+    assert load_context_list(str(tmp_path), incident_data["unattached"], []) == []
+
+
+@pytest.mark.context
+def test_snapshot_not_used_for_changed_list(tmp_path):
+    """Verify a list written after the snapshot is read from its JSON file, and the next close refreshes it"""
+    with open_context_store(str(tmp_path), incident_data, snapshot=True) as store:
+        store.add_node(make_node("identity--1"), "other")
+    with open(str(tmp_path) + incident_data["other"], "w") as f:
+        json.dump([make_node("identity--3"), make_node("identity--4")], f)
+
+    assert [x["id"] for x in load_context_list(str(tmp_path), incident_data["other"])] == ["identity--3", "identity--4"]
+    assert write_snapshot(str(tmp_path), incident_data)
+    assert not write_snapshot(str(tmp_path), incident_data)
+    snapshot = ContextSnapshot.load(str(tmp_path) + snapshot_file)
+    assert snapshot.is_current(str(tmp_path), incident_data["other"])
+    assert snapshot.get(incident_data["other"], "identity--4")["id"] == "identity--4"
+
+
+@pytest.mark.context
+def test_unreadable_snapshot_ignored(tmp_path):
+    """Verify a snapshot of another format version, or a truncated one, falls back to the JSON lists"""
+    with open_context_store(str(tmp_path), incident_data, snapshot=True) as store:
+        store.add_node(make_node("identity--1"), "other")
+    with open(str(tmp_path) + snapshot_file, "r+b") as f:
+        f.seek(4)
+        f.write(b"\xff\xff")
+    assert ContextSnapshot.load(str(tmp_path) + snapshot_file) is None
+    with open(str(tmp_path) + snapshot_file, "wb") as f:
+        f.write(b"TRCS")
+    assert ContextSnapshot.load(str(tmp_path) + snapshot_file) is None
+    assert load_context_list(str(tmp_path), incident_data["other"]) == read_list(tmp_path, "other")
+
+    with open_context_store(str(tmp_path), incident_data) as store:
+        store.add_node(make_node("identity--2"), "other")
+    assert [x["id"] for x in load_context_list(str(tmp_path), incident_data["other"])] == ["identity--1", "identity--2"]
+
+
+@pytest.mark.context
+def test_snapshot_is_opt_in(tmp_path, monkeypatch):
+    """Verify closing a store writes no snapshot unless TR_CONTEXT_SNAPSHOT is 1"""
+    monkeypatch.delenv("TR_CONTEXT_SNAPSHOT", raising=False)
+    with open_context_store(str(tmp_path), incident_data) as store:
+        store.add_node(make_node("identity--1"), "other")
+    assert not os.path.exists(str(tmp_path) + snapshot_file)
+    monkeypatch.setenv("TR_CONTEXT_SNAPSHOT", "1")
+    with open_context_store(str(tmp_path), incident_data) as store:
+        store.add_node(make_node("identity--2"), "other")
+    assert ContextSnapshot.load(str(tmp_path) + snapshot_file).get_list(incident_data["other"]) == \
+        read_list(tmp_path, "other")
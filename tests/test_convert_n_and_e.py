@@ -0,0 +1,245 @@
+"""
+Node and Edge Conversion Tests
+"""
+import pytest
+import json
+from pathlib import Path
+
+from stixorm.module.typedb_lib.factories.auth_factory import get_auth_factory_instance
+from Block_Families.General._library import context_store, convert_n_and_e
+
+
+repo_root = Path(__file__).parent.parent
+
+
+def load_examples():
+    with open(repo_root / "Block_Families" / "examples" / "block_output.json", "r") as f:
+        return json.load(f)
+
+
+def load_relationship():
+    with open(repo_root / "Orchestration" / "Results" / "step1" / "SRO_derived__rel.json", "r") as f:
+        return json.load(f)
+
+
+@pytest.mark.convert
+def test_auth_tables_built_once_and_read_only():
+    """Verify the lookup tables are shared across calls and cannot be changed by a caller"""
+    tables = convert_n_and_e.auth_tables()
+    assert convert_n_and_e.auth_tables() is tables
+    assert "email-addr" in tables["types"]["sco"]
+    with pytest.raises(TypeError):
+        tables["relation_roles"]["delivers"] = ("a", "b")
+    with pytest.raises(AttributeError):
+        tables["types"]["sdo"].add("not-a-type")
+
+
+@pytest.mark.convert
+def test_relationship_roles_match_authorisation():
+    """Verify the relationship node describes the source and target roles from the authorisation"""
+    rel = load_relationship()
+    auth = get_auth_factory_instance().get_auth_for_import(convert_n_and_e.import_type)
+    record = [x for x in auth["reln"]["standard_relations"] if x["stix"] == rel["relationship_type"]][-1]
+    nodes, edges, relation_edges, relation_replacement_edges = convert_n_and_e.convert_relns(rel)
+
+    assert record["source"].title() in nodes[0]["description"]
+    assert record["target"].title() in nodes[0]["description"]
+    assert [x["target"] for x in relation_edges] == [rel["id"], rel["target_ref"]]
+
+
+@pytest.mark.convert
+def test_embedded_edges_use_authorised_labels():
+    """Verify embedded reference fields become edges labelled, and directed, by the authorisation"""
+    tables = convert_n_and_e.auth_tables()
+    for obj in load_examples():
+        if obj["type"] in ["relationship", "sighting"]:
+            continue
+        nodes, edges = convert_n_and_e.convert_node(obj)
+        assert nodes[0]["id"] == obj["id"]
+        labels = {label for label, _ in tables["embedded_relations"].values()}
+        for edge in edges:
+            assert edge["name"] in labels
+            assert obj["id"] in (edge["source"], edge["target"])
+
+
+@pytest.mark.convert
+def test_embedded_plans_match_full_walk():
+    """Verify the extraction plans find the same edges as walking every property, including custom ones"""
+    plans = convert_n_and_e.auth_tables()["embedded_plans"]
+    assert plans["identity"]["created_by_ref"] == "ref"
+    assert plans["identity"]["extensions"][0] == "extensions"
+    with pytest.raises(TypeError):
+        plans["identity"] = {}
+
+    for obj in load_examples():
+        obj = dict(obj, x_custom={"notes": [{"object_refs": ["note--1"]}]})
+        edges = convert_n_and_e.find_embedded(obj, [], obj["id"], ["id"])
+        assert edges == convert_n_and_e.walk_embedded(dict(obj, id=None), [], obj["id"])
+        for ext in obj.get("extensions", {}).values():
+            for email in ext.get("email_addresses", []):
+                assert email["email_address_ref"] in [x["target"] for x in edges]
+        assert "note--1" in [x["target"] for x in edges]
+
+
+@pytest.mark.convert
+def test_icon_renderers_dispatch_by_type():
+    """Verify hand-written renderers are used for their types, and registry rows render the others"""
+    renderers = convert_n_and_e.icon_renderers()
+    assert renderers["sco"]["email-message"] is convert_n_and_e.email_message_icon
+    assert renderers["sdo"]["identity"] is convert_n_and_e.identity_icon
+    assert "email-addr" not in convert_n_and_e.sco_icons
+    with pytest.raises(TypeError):
+        renderers["sco"]["new-type"] = convert_n_and_e.default_sco_icon
+
+    node = convert_n_and_e.sco_icon({"type": "x-oca-asset", "id": "x-oca-asset--1", "hostname": "host1"}, {})
+    assert node["icon"] == "oca-asset"
+    assert node["object_form"] == "oca-asset"
+    assert node["object_group"] == "sco-forms"
+    assert "host1" not in node["heading"]
+
+
+@pytest.mark.convert
+def test_registry_only_types_rendered_from_registry():
+    """Verify types only the icon registry knows are converted, with the description compiled from their row"""
+    flow = {"type": "attack-flow", "id": "attack-flow--1", "name": "Flow 1", "scope": "incident"}
+    nodes, edges = convert_n_and_e.convert_node(flow)
+    assert nodes[0]["icon"] == "attack-flow"
+    assert nodes[0]["object_form"] == "flow-start"
+    assert nodes[0]["object_group"] == "sdo-forms"
+    assert nodes[0]["description"] == "<br>Name -> Flow 1"
+
+    behavior = {"type": "x-oca-behavior", "id": "x-oca-behavior--1", "name": "Beacon"}
+    node = convert_n_and_e.find_icon(behavior, {"id": behavior["id"]})
+    assert node["icon"] == "oca-behavior"
+    assert node["description"] == "<br>Name -> Beacon"
+
+    detection = {"type": "x-oca-detection", "id": "x-oca-detection--1", "name": "D", "analytic": {"type": "sigma"}}
+    node = convert_n_and_e.find_icon(detection, {"id": detection["id"]})
+    assert node["description"] == "<br>Name -> D<br>Analytic Type -> sigma"
+
+
+@pytest.mark.convert
+def test_registry_templates():
+    """Verify a registry row with node templates renders its optional segments, paths and formats"""
+    row = {"icon": "tool", "stix_type": "tool", "group": "sdo", "form": "tool", "head": "Tool",
+           "node_name": "Tool", "node_heading": "[Tool - {name}]", "node_form": "tool-form", "node_family": "",
+           "node_description": "[<br>{kill_chain_phases.[0].kill_chain_name:title} -> {kill_chain_phases.[0].phase_name:spaced}]"
+                               "[vendor?<br>{vendor} - {name}][<br>On -> {object_refs:types}]"}
+    render = convert_n_and_e.registry_icon(row)
+    node = render({"type": "tool", "kill_chain_phases": [{"kill_chain_name": "lockheed_martin", "phase_name": "c2_x"}],
+                   "vendor": "Acme", "object_refs": ["x-oca-asset--1", "identity--2"]}, {})
+    assert node["heading"] == "Tool - SDO"
+    assert node["description"] == "<br>Lockheed Martin -> c2 x<br>Acme - <br>On -> X-Oca-Asset, Identity"
+    assert (node["icon"], node["object_form"], node["object_family"]) == ("tool", "tool-form", "stix-forms")
+    node = render({"type": "tool", "name": "Hammer", "kill_chain_phases": []}, {})
+    assert (node["heading"], node["description"]) == ("Tool - Hammer", "")
+    with pytest.raises(ValueError):
+        convert_n_and_e.compile_template("[<br>{name}")
+
+
+@pytest.mark.convert
+def test_example_nodes_rendered():
+    """Verify the example objects render with the icon, form and group the forms expect"""
+    for obj in load_examples():
+        if obj["type"] in ["relationship", "sighting"]:
+            continue
+        node = convert_n_and_e.find_icon(obj, {"id": obj["id"]})
+        assert node["icon"]
+        assert node["object_group"] in ["sdo-forms", "sco-forms", "meta-forms"]
+        if obj["type"] == "email-addr":
+            assert node["heading"].startswith("Email Address")
+            assert node["description"] == "<br>Value -> " + obj["value"]
+        if obj["type"] == "indicator":
+            assert node["heading"] == "Indicator - " + obj["name"] if obj.get("name") else "Indicator"
+            assert "<br>Pattern -> " + obj["pattern"] in node["description"]
+
+
+@pytest.mark.convert
+def test_convert_many_matches_single_conversions():
+    """Verify converting a bundle gives the nodes of converting each object, with no dangling edges"""
+    objects = load_examples() + [load_relationship()]
+    graph = convert_n_and_e.convert_many(objects)
+
+    assert [x["id"] for x in graph["nodes"]] == [x["id"] for x in objects]
+    node_ids = {x["id"] for x in graph["nodes"]}
+    for edge_type in ["edges", "relation_edges", "relation_replacement_edges"]:
+        for edge in graph[edge_type]:
+            assert edge["source"] in node_ids and edge["target"] in node_ids
+    assert len(graph["relation_edges"]) == 2
+    assert {x["icon"] for x in graph["legend"]} == {x["icon"] for x in graph["nodes"]}
+
+    email = [x for x in objects if x["type"] == "email-message"][0]
+    nodes, edges = convert_n_and_e.convert_node(email)
+    kept = [x for x in edges if x["source"] in node_ids and x["target"] in node_ids]
+    assert kept and all(x in graph["edges"] for x in kept)
+
+
+@pytest.mark.convert
+def test_convert_many_duplicates_and_nodes():
+    """Verify an object given twice, or as a context node, appears once in its first place"""
+    objects = load_examples()[:3]
+    renamed = dict(objects[0], name="renamed")
+    nodes, _ = convert_n_and_e.convert_node(objects[1])
+    graph = convert_n_and_e.convert_many(objects + [renamed, nodes[0]])
+
+    assert [x["id"] for x in graph["nodes"]] == [x["id"] for x in objects]
+    assert graph["nodes"][0]["original"]["name"] == "renamed"
+
+
+@pytest.mark.convert
+def test_convert_many_parallel_matches_serial():
+    """Verify converting in worker processes gives the same graph, in the same order, as converting here"""
+    objects = load_examples() + [load_relationship()]
+    objects = objects + [dict(objects[0], name="renamed")] + objects[2:5]
+    serial = convert_n_and_e.convert_many(objects)
+
+    assert convert_n_and_e.convert_many(objects, workers=3, chunk_size=4) == serial
+    assert convert_n_and_e.convert_many(iter(objects), workers=2) == serial
+
+
+@pytest.mark.convert
+def test_convert_many_serial_without_fork(monkeypatch):
+    """Verify that where workers cannot be forked, e.g. on Windows, the objects are converted in this process"""
+    objects = load_examples() + [load_relationship()]
+    serial = convert_n_and_e.convert_many(objects)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a worker pool was started")
+
+    monkeypatch.setattr(convert_n_and_e.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    monkeypatch.setattr(convert_n_and_e, "ProcessPoolExecutor", no_pool)
+    assert convert_n_and_e.convert_many(objects, workers=3, chunk_size=4) == serial
+
+
+@pytest.mark.convert
+def test_refine_edges_and_legend_stream():
+    """Verify edge pruning and the legend keep their order, and accept generators"""
+    nodes = [{"id": f"identity--{i}", "icon": f"icon{i % 3}", "name": f"name{i}"} for i in range(10)]
+    edges = [{"source": f"identity--{i}", "target": f"identity--{i + 5}"} for i in range(10)]
+
+    assert convert_n_and_e.refine_edges(nodes, edges) == edges[:5]
+    assert list(convert_n_and_e.iter_refined_edges(iter(nodes), iter(edges))) == edges[:5]
+    legend = [{"icon": "icon0", "name": "name0"}, {"icon": "icon1", "name": "name1"}, {"icon": "icon2", "name": "name2"}]
+    assert convert_n_and_e.generate_legend(nodes) == legend
+    assert list(convert_n_and_e.iter_legend(x for x in nodes)) == legend
+
+
+@pytest.mark.convert
+def test_save_conversion_finds_previous_edges(tmp_path):
+    """Verify the save blocks' conversion gives each edge list, and the edges of the object as last saved"""
+    relationship = load_relationship()
+    node, edge_lists = context_store.convert_object(relationship, convert_n_and_e)
+    assert node["id"] == relationship["id"]
+    assert set(edge_lists) == {"edges", "relation_edges", "relation_replacement_edges"}
+    assert context_store.convert_object(node, convert_n_and_e) == (node, {})
+
+    obj = next(x for x in load_examples() if convert_n_and_e.convert_node(x)[1])
+    node, edge_lists = context_store.convert_object(obj, convert_n_and_e)
+    file_map = {"other": "/other_object_refs.json", "edges": "/incident_edges.json"}
+    with context_store.open_context_store(str(tmp_path), file_map) as store:
+        assert context_store.previous_edge_lists(store, "other", obj, edge_lists, convert_n_and_e) is None
+        store.save_objects([("other", node, edge_lists, None)])
+        assert context_store.previous_edge_lists(store, "other", obj, edge_lists, convert_n_and_e) is edge_lists
+        changed = dict(obj, description="changed")
+        assert context_store.previous_edge_lists(store, "other", changed, {}, convert_n_and_e) == edge_lists
+
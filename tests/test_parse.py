@@ -0,0 +1,129 @@
+"""
+Icon Registry Parsing Tests
+"""
+import pytest
+import os
+import shutil
+import threading
+
+from Block_Families.General._library import parse
+
+
+@pytest.fixture
+def registry_copy(tmp_path, monkeypatch):
+    # point the registry at a copy, so it can be edited
+    path = tmp_path / "icon_registry.csv"
+    shutil.copy(parse.registry_path(), path)
+    monkeypatch.setattr(parse, "registry_path", lambda: str(path))
+    return path
+
+
+@pytest.mark.parse
+def test_registry_index_built_once(registry_copy):
+    """Verify lookups share one index, and the same ParseContent instances, while the registry is unchanged"""
+    index = parse.registry_index()
+    assert parse.registry_index() is index
+    first = parse.get_content_list_for_type("identity", "class")
+    assert len(first) > 1
+    assert all(x is y for x, y in zip(first, parse.get_content_list_for_type("identity", "class")))
+    with pytest.raises(TypeError):
+        index["by_type"]["identity"] = ()
+
+
+@pytest.mark.parse
+def test_registry_index_rebuilt_when_file_changes(registry_copy):
+    """Verify an edited registry is read again on the next lookup"""
+    assert parse.get_group_from_type("url") == "sco"
+    text = registry_copy.read_text(encoding="utf-8", errors="ignore")
+    lines = [line.replace(",url,stix21,sco,", ",url,stix21,sdo,") for line in text.splitlines()]
+    registry_copy.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.utime(registry_copy, ns=(0, 1))
+
+    assert parse.get_group_from_type("url") == "sdo"
+    assert [x["group"] for x in parse.read_icon_registry() if x["stix_type"] == "url"] == ["sdo"]
+
+
+@pytest.mark.parse
+def test_tqlname_by_protocol():
+    """Verify the default row of the type gives the TypeQL name, whatever the protocol"""
+    assert parse.get_tqlname_from_type_and_protocol("attack-pattern") == "attack-pattern"
+    assert parse.get_tqlname_from_type_and_protocol("x-mitre-tactic", "attack") == "tactic"
+    assert parse.get_tqlname_from_type_and_protocol("attack-pattern", "other") == "attack-pattern"
+    assert parse.get_tqlname_from_type_and_protocol("attack-pattern", "attack") == "attack-pattern"
+    assert parse.get_tqlname_from_type_and_protocol("network-traffic", "oca") == "network-traffic"
+    assert parse.get_tqlname_from_type_and_protocol("not-a-type") is None
+
+
+@pytest.mark.parse
+def test_classify_objects_matches_single_lookups():
+    """Verify the batch classification gives the content of each object, as the single lookup does"""
+    objects = [
+        {"type": "identity", "id": "identity--1", "name": "Someone"},
+        {"type": "attack-pattern", "id": "attack-pattern--1", "x_mitre_is_subtechnique": True},
+        {"type": "url", "id": "url--1", "value": "http://example.com"},
+        {"type": "not-a-type", "id": "not-a-type--1"},
+    ]
+    classified = parse.classify_objects(iter(objects))
+
+    assert classified == [parse.determine_content_object_from_list_by_tests(x, "class") for x in objects]
+    assert classified[2].typeql == "url"
+    assert classified[3] is None
+    assert parse.classify_objects(objects, "icon") == [None] * 4
+
+
+@pytest.mark.parse
+def test_conditions_do_not_copy_the_object():
+    """Verify conditions are tested on the object in place, so values that cannot be copied are allowed"""
+    content = [x for x in parse.get_content_list_for_type("identity", "class") if x.condition1 == "EXISTS"][0]
+    stix_dict = {"type": "identity", "id": "identity--1", "x_handle": threading.Lock()}
+    matcher = parse.compile_condition(content)
+
+    assert matcher(stix_dict) == parse.test_object_by_condition(content, stix_dict)
+    assert parse.determine_content_object_from_list_by_tests(stix_dict, "class").stix_type == "identity"
+
+
+@pytest.mark.parse
+def test_registry_snapshot_is_current():
+    """Verify the committed snapshot matches icon_registry.csv, and indexes it as parsing the registry does"""
+    snapshot = parse.load_registry_snapshot(parse.registry_digest())
+    assert snapshot is not None, "icon_registry.csv has changed, run parse.py to write the snapshot again"
+
+    from_snapshot = parse.build_registry_index(snapshot.rows, (snapshot.by_type, snapshot.by_type_protocol))
+    from_registry = parse.build_registry_index(parse.load_icon_registry())
+    assert [dict(x) for x in from_snapshot["rows"]] == [dict(x) for x in from_registry["rows"]]
+    for stix_type in from_registry["by_type"]:
+        assert from_snapshot["by_type"][stix_type] == from_registry["by_type"][stix_type]
+    assert set(from_snapshot["by_type_protocol"]) == set(from_registry["by_type_protocol"])
+
+
+@pytest.mark.parse
+def test_stale_registry_snapshot_ignored(registry_copy, tmp_path, monkeypatch):
+    """Verify a snapshot written from an older registry is not used"""
+    monkeypatch.setattr(parse, "snapshot_path", lambda: str(tmp_path / "icon_registry_snapshot.py"))
+    parse.write_registry_snapshot()
+    assert parse.load_registry_snapshot(parse.registry_digest()) is not None
+
+    with open(registry_copy, "a", encoding="utf-8") as f:
+        f.write("new-icon,x-new-type,stix21,sdo,x-new-type,NewType,x-new-type" + "," * 21 + "\n")
+    assert parse.load_registry_snapshot(parse.registry_digest()) is None
+    assert parse.get_group_from_type("x-new-type") == "sdo"
+
+
+@pytest.mark.parse
+def test_registry_records_are_slotted_and_read_only():
+    """Verify lookups give read-only records, with split field paths, that validate as the ParseContent they stand for"""
+    records = parse.get_content_list_for_type("identity", "class")
+    record = [x for x in records if x.condition1 == "EQUALS"][0]
+    assert not hasattr(record, "__dict__")
+    assert record.field_list1 == tuple(record.field1.split("."))
+    with pytest.raises(AttributeError):
+        record.group = "sco"
+    content = record.to_content()
+    assert isinstance(content, parse.ParseContent)
+    assert content.model_dump() == record.as_dict()
+    assert parse.RegistryRecord(content.model_dump()) == record
+
+    group = parse.registry_index()["groups"]["identity"]
+    assert group.records == tuple(records)
+    assert group.fallback is group.default[0]
+    assert [item for _, item in group.matchers] == list(group.specialisation)
@@ -0,0 +1,156 @@
+"""
+Object Update Diff Tests
+"""
+import pytest
+import json
+from pathlib import Path
+
+from deepdiff import DeepDiff
+from Block_Families.General._library import update
+
+
+repo_root = Path(__file__).parent.parent
+
+
+def load_examples():
+    with open(repo_root / "Block_Families" / "examples" / "block_output.json", "r") as f:
+        return json.load(f)
+
+
+def deep_diff(original, changed):
+    return json.loads(DeepDiff(original, changed, verbose_level=2, ignore_order=True).to_json())
+
+
+@pytest.mark.update
+def test_object_diff_matches_deepdiff():
+    """Verify property changes, additions and removals are reported as DeepDiff reports them"""
+    for obj in load_examples():
+        changed = {key: value for key, value in obj.items() if key != "created"}
+        changed["x_custom"] = {"note": "added"}
+        changed["modified"] = "2024-01-01T00:00:00.000Z"
+        changed["spec_version"] = 2.1
+        if "extensions" in obj:
+            changed["extensions"] = {key: dict(value, x_ext="v") for key, value in obj["extensions"].items()}
+
+        assert update.diff_stix_objects(obj, changed) == deep_diff(obj, changed)
+        assert update.diff_stix_objects(obj, dict(obj)) == {}
+
+
+@pytest.mark.update
+def test_refs_compared_as_sets():
+    """Verify reordered refs are unchanged, and a replaced ref is one removed and one added"""
+    refs = [f"identity--{i}" for i in range(5)]
+    obj = {"type": "grouping", "id": "grouping--1", "object_refs": refs}
+
+    assert update.diff_stix_objects(obj, dict(obj, object_refs=refs[::-1] + refs[:2])) == {}
+    diff = update.diff_stix_objects(obj, dict(obj, object_refs=refs[:3] + ["note--1"] + refs[4:]))
+    assert diff == {
+        "iterable_item_removed": {"root['object_refs'][3]": "identity--3"},
+        "iterable_item_added": {"root['object_refs'][3]": "note--1"},
+    }
+
+
+@pytest.mark.update
+def test_list_values_compared_with_their_type():
+    """Verify equal values of different types in a list, e.g. 1 and True, are reported as changed, as DeepDiff does"""
+    for old, new in [([1, 2], [True, 2]), ([1, 2], [1.0, 2])]:
+        assert deep_diff({"a": old}, {"a": new})
+        assert update.diff_stix_objects({"a": old}, {"a": new}) == {
+            "iterable_item_removed": {"root['a'][0]": 1},
+            "iterable_item_added": {"root['a'][0]": new[0]},
+        }
+    assert update.diff_stix_objects({"a": [1, 2]}, {"a": [2, 1, 1]}) == {}
+
+@pytest.mark.update
+def test_list_objects_matched_by_key():
+    """Verify objects in a list are matched by their key, so a changed property is reported at its new place"""
+    first = {"source_name": "cve", "external_id": "CVE-1", "url": "http://a"}
+    second = {"source_name": "capec", "external_id": "CAPEC-1"}
+    obj = {"type": "vulnerability", "id": "vulnerability--1", "external_references": [first, second]}
+    changed = dict(obj, external_references=[second, dict(first, url="http://b"), {"source_name": "other"}])
+
+    assert update.diff_stix_objects(obj, changed) == {
+        "values_changed": {"root['external_references'][0]['url']": {
+            "new_value": "http://b", "old_value": "http://a", "new_path": "root['external_references'][1]['url']"}},
+        "iterable_item_added": {"root['external_references'][2]": {"source_name": "other"}},
+    }
+
+
+@pytest.mark.update
+def test_find_obj_diff_writes_report(tmp_path, monkeypatch):
+    """Verify the object diff is returned, and written to the diff output file"""
+    monkeypatch.chdir(tmp_path)
+    obj = [x for x in load_examples() if "name" in x][0]
+    diff = update.find_obj_diff(obj, dict(obj, name="renamed"))
+
+    assert diff["values_changed"]["root['name']"]["new_value"] == "renamed"
+    assert json.loads((tmp_path / "DeepDiff_object_output.json").read_text()) == diff
+
+
+@pytest.mark.update
+def test_list_diff_plan_matches_by_id():
+    """Verify the sync plan finds the deleted, added and paired objects by id, keeping list order"""
+    original = [{"id": f"identity--{i}", "name": "original"} for i in range(6)]
+    changed = [{"id": f"identity--{i}", "name": "changed"} for i in range(3, 9)][::-1]
+    deletes, adds, pairs = update.plan_list_diff(original, changed)
+
+    assert deletes == ["identity--0", "identity--1", "identity--2"]
+    assert [x["id"] for x in adds] == ["identity--8", "identity--7", "identity--6"]
+    assert [(x["id"], y["id"]) for x, y in pairs] == [("identity--5",) * 2, ("identity--4",) * 2, ("identity--3",) * 2]
+    assert all(x["name"] == "original" and y["name"] == "changed" for x, y in pairs)
+    assert update.find_list_diff(original, changed) == (deletes, adds, [y for _, y in pairs])
+
+
+@pytest.mark.update
+def test_content_hash_skips_unchanged_objects():
+    """Verify objects whose content hash is unchanged are not paired for diffing, whatever their key order"""
+    original = [{"id": f"identity--{i}", "type": "identity", "name": "same", "modified": "2024-01-01"} for i in range(4)]
+    changed = [dict(reversed(list(x.items()))) for x in original]
+    changed[1] = dict(changed[1], modified="2024-02-02")
+    changed[2] = dict(changed[2], name="renamed")
+
+    assert update.content_hash(changed[0]) == update.content_hash(original[0])
+    assert update.content_hash(changed[1]) != update.content_hash(original[1])
+    hashes = update.content_hashes(original)
+    deletes, adds, pairs = update.plan_list_diff(original, changed, hashes)
+    assert [y["id"] for _, y in pairs] == ["identity--1", "identity--2"]
+    assert len(update.plan_list_diff(original, changed)[2]) == 4
+
+
+@pytest.mark.update
+def test_modified_only_change_is_pushed():
+    """Verify an object whose only change is its modified time has a new content hash, so TypeDB gets the new modified"""
+    original = [{"id": "identity--1", "type": "identity", "name": "same", "modified": "2024-01-01T00:00:00.000Z"}]
+    changed = [dict(original[0], modified="2024-02-02T00:00:00.000Z")]
+
+    assert update.content_hash(changed[0]) != update.content_hash(original[0])
+    deletes, adds, pairs = update.plan_list_diff(original, changed, update.content_hashes(original))
+    assert pairs == [(original[0], changed[0])]
+    diff = update.diff_stix_objects(*pairs[0])
+    assert list(diff["values_changed"]) == ["root['modified']"]
+
+
+@pytest.mark.update
+def test_synch_context_saves_content_hashes(tmp_path):
+    """Verify synching the context saves the hashes of the TypeDB objects, which the next update loads"""
+    from Block_Families.OS_Triage.Update_Context import update_context
+
+    objects = [x for x in load_examples() if "id" in x][:6]
+    incident_lists = ["sequence_start_objs", "sequence_objs", "task_objs", "event_objs", "impact_objs", "other_object_objs"]
+    context_lists = ["me", "team", "company", "systems", "assets"]
+
+    def side(other_objects):
+        incident = {name: [] for name in incident_lists}
+        incident["other_object_objs"] = other_objects
+        incident["incident_obj"] = {}
+        return {"incident": incident, "context": {name: [] for name in context_lists}}
+
+    path = tmp_path / "OS_Threat_Context.json"
+    path.write_text(json.dumps({"local": side(objects), "remote": side(objects[:2])}))
+    remote_list, _, local_list, _, hashes = update_context.load_context(str(path), with_hashes=True)
+    assert hashes == update.content_hashes(objects[:2])
+
+    update_context.synch_context(str(path))
+    assert json.loads(path.read_text())["remote"]["content_hashes"] == update.content_hashes(objects)
+    remote_list, _, local_list, _, hashes = update_context.load_context(str(path), with_hashes=True)
+    assert update.plan_list_diff(remote_list, local_list, hashes) == ([], [], [])